@@ -1,10 +1,21 @@
 import pygame
-from pygame.sprite import Sprite
-import functions as gf
 
+import assets
+from sprites import CompactSprite, get_context
 
-class Alien(Sprite):
-    """Класс, представляющий одного пришельца"""
+
+class Alien(CompactSprite):
+    """
+    Класс, представляющий одного пришельца.
+
+    Движение, проверка краёв экрана и отрисовка пришельцев выполняются флотом
+    (fleet.Fleet) над массивами координат; прямоугольник спрайта Fleet
+    синхронизирует с массивами, когда он нужен.
+    """
+
+    __slots__ = ('fleet_index', 'kind', 'points')
+
+    image_path = 'images/alienship.bmp'  # Общее изображение для всех пришельцев
 
     def __init__(self, ai_settings, screen):
         """
@@ -13,49 +24,32 @@ class Alien(Sprite):
         :param ai_settings: Объект, содержащий настройки игры.
         :param screen: Объект экрана, на котором будет отображаться пришелец.
         """
-        super().__init__()  # Инициализация родительского класса Sprite
-        self.screen = screen
-        self.ai_settings = ai_settings
-
-        # Загрузка изображения пришельца и назначение атрибута rect
-        self.image = pygame.image.load(gf.resource_path('images/alienship.bmp'))
-        self.rect = self.image.get_rect()
-
-        # Каждый новый пришелец появляется в левом верхнем углу экрана
-        self.rect.x = self.rect.width
-        self.rect.y = self.rect.height
-
-        # Сохранение точной позиции пришельца для более точных вычислений
-        self.x = float(self.rect.x)
+        super().__init__()  # Инициализация компактного спрайта
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Прямоугольник переиспользуется при reset()
+        self.fleet_index = None  # Индекс в массивах флота (задаёт Fleet)
+        self.reset(ai_settings, screen)
 
-    def blitme(self):
+    def reset(self, ai_settings, screen):
         """
-        Отображает пришельца в его текущей позиции на экране.
+        Переинициализирует пришельца (повторное использование при создании нового флота).
 
-        Вызывает метод `blit`, чтобы отобразить изображение пришельца в его
-        текущем прямоугольнике `rect`.
+        :param ai_settings: Объект, содержащий настройки игры.
+        :param screen: Объект экрана, на котором будет отображаться пришелец.
         """
-        self.screen.blit(self.image, self.rect)
+        # Настройки и экран общие для всей волны
+        self.context = get_context(ai_settings, screen)
 
-    def check_edges(self):
-        """
-        Проверяет, находится ли пришелец у края экрана.
+        # Получение общего изображения пришельца из реестра и размера прямоугольника
+        self.image = assets.get_image(self.image_path)
+        self.rect.size = self.image.get_size()
 
-        :return: True, если пришелец касается края экрана (слева или справа).
-        """
-        screen_rect = self.screen.get_rect()
-        if self.rect.right >= screen_rect.right:
-            return True
-        elif self.rect.left <= 0:
-            return True
+        # Тип пришельца из файла волн (None - обычный пришелец) и множитель очков
+        self.kind = None
+        self.points = 1
 
-    def update(self):
-        """
-        Перемещает пришельца влево или вправо.
+        # Каждый новый пришелец появляется в левом верхнем углу экрана
+        self.rect.x = self.rect.width
+        self.rect.y = self.rect.height
 
-        Обновляет позицию пришельца, учитывая текущую скорость и направление
-        (вправо или влево) с помощью параметра `fleet_direction` из настроек игры.
-        """
-        self.x += (self.ai_settings.alien_speed_factor *
-                   self.ai_settings.fleet_direction)
-        self.rect.x = self.x
\ No newline at end of file
+        # Позиция на предыдущем шаге симуляции (для интерполяции при отрисовке)
+        self.prev_pos = None
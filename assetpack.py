@@ -0,0 +1,209 @@
+"""
+Пакет ресурсов игры: все изображения и звуки в одном файле.
+
+Изображения хранятся уже декодированными (пиксели RGB/RGBA), поэтому при
+запуске не нужно разбирать BMP-файлы, а собранной программе - распаковывать
+и открывать множество отдельных файлов. Звуки хранятся в исходном формате WAV
+и декодируются микшером при загрузке (формат микшера известен только при
+запуске), файлы данных (волны) - как есть. Если пакета нет, ресурсы
+загружаются из папок images/, sounds/ и waves/.
+
+Сборка пакета (выполняется скриптами build_*):
+    python assetpack.py
+"""
+import io
+import os
+import struct
+import sys
+import threading
+
+import pygame
+
+import functions as gf
+from ioworker import io_stats
+
+MAGIC = b'AIPK'  # Сигнатура файла пакета
+VERSION = 1  # Версия формата пакета
+PACK_FILE = 'assets.pack'  # Имя пакета рядом с игрой (или внутри собранной программы)
+SOURCE_DIRS = ('images', 'sounds', 'waves')  # Папки, из которых собирается пакет
+
+IMAGE = 0  # Тип записи: изображение
+SOUND = 1  # Тип записи: звук
+DATA = 2  # Тип записи: файл данных (например, описание волн)
+
+_HEADER = struct.Struct('<4sHI')  # Сигнатура, версия, количество записей
+_NAME = struct.Struct('<H')  # Длина имени записи
+# Тип, есть ли альфа-канал, смещение данных, размер данных, ширина, высота
+_ENTRY = struct.Struct('<BBIIHH')
+
+
+class AssetPack:
+    """Пакет ресурсов, прочитанный в память одним чтением файла."""
+
+    def __init__(self, filename):
+        """
+        Читает пакет и его оглавление.
+
+        :param filename: Путь к файлу пакета.
+        :raises ValueError: Если файл повреждён или записан в неизвестной версии формата.
+        """
+        with io_stats.track('pack'), open(filename, 'rb') as f:
+            self._data = memoryview(f.read())
+        try:
+            magic, version, count = _HEADER.unpack_from(self._data)
+        except struct.error as e:
+            raise ValueError(f"некорректный заголовок пакета: {e}") from e
+        if magic != MAGIC:
+            raise ValueError("неизвестная сигнатура пакета")
+        if version != VERSION:
+            raise ValueError(f"неподдерживаемая версия пакета: {version}")
+
+        self._entries = {}  # Имя ресурса -> (тип, альфа, смещение, размер, ширина, высота)
+        offset = _HEADER.size
+        for _ in range(count):
+            name_length, = _NAME.unpack_from(self._data, offset)
+            offset += _NAME.size
+            name = bytes(self._data[offset:offset + name_length]).decode()
+            offset += name_length
+            self._entries[name] = _ENTRY.unpack_from(self._data, offset)
+            offset += _ENTRY.size
+        self._data_start = offset
+
+    def image_info(self, name):
+        """
+        Возвращает размер изображения и наличие альфа-канала из оглавления пакета, не декодируя его.
+
+        :param name: Относительный путь изображения.
+        :return: Кортеж (ширина, высота, альфа) или None, если изображения нет в пакете.
+        """
+        entry = self._entries.get(name)
+        if entry is None or entry[0] != IMAGE:
+            return None
+        return entry[4], entry[5], bool(entry[1])
+
+    def __contains__(self, name):
+        """Проверяет, есть ли ресурс в пакете."""
+        return name in self._entries
+
+    def names(self):
+        """Возвращает имена всех ресурсов пакета."""
+        return list(self._entries)
+
+    def _payload(self, name):
+        """Возвращает запись оглавления и данные ресурса."""
+        entry = self._entries[name]
+        start = self._data_start + entry[2]
+        return entry, self._data[start:start + entry[3]]
+
+    def image(self, name):
+        """
+        Создаёт поверхность изображения из пакета (без конвертации в формат экрана).
+
+        :param name: Относительный путь изображения (например, 'images/alienship.bmp').
+        :return: Поверхность pygame.Surface.
+        """
+        (kind, alpha, _, _, width, height), data = self._payload(name)
+        if kind != IMAGE:
+            raise KeyError(name)
+        return pygame.image.frombytes(bytes(data), (width, height), 'RGBA' if alpha else 'RGB')
+
+    def sound(self, name):
+        """
+        Создаёт звук из пакета.
+
+        :param name: Относительный путь звука (например, 'sounds/laser.wav').
+        :return: Объект pygame.mixer.Sound.
+        """
+        (kind, _, _, _, _, _), data = self._payload(name)
+        if kind != SOUND:
+            raise KeyError(name)
+        return pygame.mixer.Sound(file=io.BytesIO(data))
+
+    def data(self, name):
+        """
+        Возвращает содержимое файла данных из пакета.
+
+        :param name: Относительный путь файла (например, 'waves/waves.json').
+        :return: Байты файла.
+        """
+        (kind, _, _, _, _, _), data = self._payload(name)
+        if kind != DATA:
+            raise KeyError(name)
+        return bytes(data)
+
+
+# Пакет, найденный при первом обращении (False - пакета нет)
+_default_pack = None
+_default_lock = threading.Lock()
+
+
+def default_pack():
+    """
+    Возвращает пакет ресурсов игры, открывая его при первом обращении.
+
+    :return: Объект AssetPack или None, если пакет не собран.
+    """
+    global _default_pack
+    with _default_lock:
+        if _default_pack is None:
+            path = gf.resource_path(PACK_FILE)
+            _default_pack = AssetPack(path) if os.path.exists(path) else False
+    return _default_pack or None
+
+
+def build(output=PACK_FILE, source_dirs=SOURCE_DIRS):
+    """
+    Собирает пакет из изображений (.bmp, .png), звуков (.wav, .ogg) и файлов данных (.json).
+
+    :param output: Имя создаваемого файла пакета.
+    :param source_dirs: Папки с ресурсами.
+    :return: Количество ресурсов в пакете.
+    """
+    entries = []  # (имя, тип, альфа, ширина, высота, данные)
+    for directory in source_dirs:
+        for filename in sorted(os.listdir(directory)):
+            name = f"{directory}/{filename}"
+            extension = os.path.splitext(filename)[1].lower()
+            if extension in ('.bmp', '.png'):
+                surface = pygame.image.load(name)
+                alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+                data = pygame.image.tobytes(surface, 'RGBA' if alpha else 'RGB')
+                entries.append((name, IMAGE, alpha, *surface.get_size(), data))
+            elif extension in ('.wav', '.ogg'):
+                with open(name, 'rb') as f:
+                    entries.append((name, SOUND, False, 0, 0, f.read()))
+            elif extension == '.json':
+                with open(name, 'rb') as f:
+                    entries.append((name, DATA, False, 0, 0, f.read()))
+
+    index = [_HEADER.pack(MAGIC, VERSION, len(entries))]
+    offset = 0
+    for name, kind, alpha, width, height, data in entries:
+        encoded = name.encode()
+        index.append(_NAME.pack(len(encoded)) + encoded)
+        index.append(_ENTRY.pack(kind, alpha, offset, len(data), width, height))
+        offset += len(data)
+
+    temp_path = output + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(b''.join(index))
+        for entry in entries:
+            f.write(entry[-1])
+    os.replace(temp_path, output)
+    return len(entries)
+
+
+def main(argv=None):
+    """Точка входа командной строки: сборка пакета ресурсов."""
+    import argparse  # Нужен только при сборке, не при запуске игры
+
+    parser = argparse.ArgumentParser(description="Сборка пакета ресурсов игры.")
+    parser.add_argument('--output', default=PACK_FILE, help=f"Файл пакета (по умолчанию {PACK_FILE}).")
+    args = parser.parse_args(argv)
+    count = build(args.output)
+    print(f"Пакет собран: {args.output} ({count} ресурсов, {os.path.getsize(args.output)} байт)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,308 @@
+import time
+import pygame
+
+import assetpack
+from atlas import TextureAtlas
+import functions as gf
+from ioworker import io_stats
+
+
+class AssetRegistry:
+    """
+    Реестр изображений игры.
+
+    Каждое изображение загружается и декодируется только один раз, после чего
+    все спрайты получают одну и ту же общую поверхность. Изображения берутся
+    из пакета ресурсов (assetpack), а при его отсутствии - из отдельных файлов.
+
+    Если задан поток ввода-вывода (use_worker()), изображение из пакета при
+    первом обращении не загружается в вызывающем потоке: сразу возвращается
+    заглушка нужного размера (размер известен из оглавления пакета), а
+    декодирование идёт в фоне. Когда игровой цикл обработает завершение
+    загрузки (IOWorker.poll()), изображение копируется в ту же поверхность,
+    поэтому спрайты, получившие заглушку, без каких-либо действий начинают
+    рисовать настоящее изображение.
+    """
+
+    placeholder_color = (96, 96, 112)  # Цвет заглушки изображения, загружаемого в фоне
+
+    def __init__(self):
+        """Инициализирует пустой кэш изображений и счётчики загрузки."""
+        self._images = {}  # Путь к ресурсу -> (поверхность, нужна ли альфа)
+        self._converted = set()  # Пути, уже приведённые к формату экрана
+        self._solids = {}  # (размер, цвет) -> залитая поверхность
+        self._tinted = {}  # (путь, оттенок) -> окрашенная копия изображения
+        self.atlas = None  # Текстурный атлас (после build_atlas())
+        self.worker = None  # Поток ввода-вывода для загрузки без ожидания (use_worker())
+        self._pending = set()  # Пути изображений, загружаемых в фоне (в кэше - заглушки)
+        self.generation = 0  # Увеличивается при замене изображений (загрузка заглушки, сборка атласа)
+
+        # Счётчики для контроля затрат на загрузку
+        self.loads = 0  # Количество реальных загрузок с диска
+        self.hits = 0  # Количество обращений, обслуженных из кэша
+        self.load_time = 0.0  # Суммарное время загрузки и конвертации (в секундах)
+
+    def image(self, relative_path, alpha=None):
+        """
+        Возвращает общую поверхность изображения, загружая её при первом обращении.
+
+        :param relative_path: Относительный путь к изображению (например, 'images/alienship.bmp').
+        :param alpha: True, если изображение содержит прозрачность (convert_alpha вместо convert);
+            None - определить по загруженному изображению (есть ли у него альфа-канал).
+        :return: Поверхность pygame.Surface, общая для всех вызывающих.
+        """
+        entry = self._images.get(relative_path)
+        if entry is not None:
+            self.hits += 1
+            return entry[0]
+
+        pack = assetpack.default_pack()
+        info = pack.image_info(relative_path) if pack is not None else None
+        if self.worker is not None and info is not None:
+            return self._request(relative_path, alpha, info)
+
+        start = time.perf_counter()
+        surface = self._load(relative_path)
+        if alpha is None and info is not None:
+            alpha = info[2]  # Пакет хранит пиксели RGBA для изображений с альфа-каналом
+        self._images[relative_path] = (surface, has_alpha(surface, alpha))
+        if pygame.display.get_surface() is not None:
+            surface = self._convert(relative_path)
+        self.load_time += time.perf_counter() - start
+        return surface
+
+    def use_worker(self, worker):
+        """
+        Включает загрузку изображений в потоке ввода-вывода с заглушками.
+
+        :param worker: Объект ioworker.IOWorker (None - загрузка в вызывающем потоке).
+        """
+        self.worker = worker
+
+    def pending(self):
+        """Возвращает количество изображений, ещё загружаемых в фоне."""
+        return len(self._pending)
+
+    def _request(self, relative_path, alpha, info):
+        """Возвращает заглушку изображения и ставит его загрузку в очередь потока ввода-вывода."""
+        width, height, pack_alpha = info
+        if alpha is None:
+            # Заглушка сразу получает альфа-канал, если он есть у изображения в пакете:
+            # в неё на месте копируются пиксели с прозрачным фоном
+            alpha = pack_alpha
+        placeholder = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:
+            placeholder = placeholder.convert_alpha() if alpha else placeholder.convert()
+            self._converted.add(relative_path)
+        placeholder.fill(self.placeholder_color)
+        self._images[relative_path] = (placeholder, alpha)
+        self._pending.add(relative_path)
+        self.worker.submit(self._load, relative_path,
+                           on_done=lambda future: self._arrive(relative_path, future))
+        return placeholder
+
+    def _arrive(self, relative_path, future):
+        """Копирует загруженное изображение в его заглушку (в главном потоке)."""
+        self._pending.discard(relative_path)
+        placeholder, alpha = self._images[relative_path]
+        try:
+            surface = future.result()
+        except (pygame.error, OSError) as e:
+            print("Не удалось загрузить изображение:", relative_path, e)
+            return
+        start = time.perf_counter()
+        if relative_path in self._converted:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        # Сложение с прозрачной заливкой копирует пиксели вместе с альфа-каналом
+        placeholder.fill((0, 0, 0, 0))
+        placeholder.blit(surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        # Окрашенные копии заглушки обновляются так же, на месте
+        for (path, tint), copy in self._tinted.items():
+            if path == relative_path:
+                copy.fill((0, 0, 0, 0))
+                copy.blit(placeholder, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+                copy.fill(tint, special_flags=pygame.BLEND_RGB_MULT)
+        self.generation += 1
+        self.load_time += time.perf_counter() - start
+
+    def preload(self, relative_paths, alpha=None):
+        """
+        Загружает изображения заранее, не конвертируя их в формат экрана.
+
+        Может выполняться в фоновом потоке, пока главный поток показывает окно;
+        конвертация выполняется затем в главном потоке методом convert_all().
+
+        :param relative_paths: Относительные пути к изображениям.
+        :param alpha: True, если изображения содержат прозрачность (None - определить по изображениям).
+        """
+        for relative_path in relative_paths:
+            if relative_path in self._images:
+                continue
+            start = time.perf_counter()
+            surface = self._load(relative_path)
+            self._images[relative_path] = (surface, has_alpha(surface, alpha))
+            self.load_time += time.perf_counter() - start
+
+    def request(self, relative_paths, alpha=None):
+        """
+        Ставит загрузку изображений в очередь потока ввода-вывода, не дожидаясь её.
+
+        Изображения из пакета сразу получают заглушки (см. image()); изображения
+        из отдельных файлов (размер которых заранее неизвестен) декодируются в
+        фоне и попадают в кэш по завершении, а до этого image() загрузит их сам.
+
+        :param relative_paths: Относительные пути к изображениям.
+        :param alpha: True, если изображения содержат прозрачность (None - определить по изображениям).
+        """
+        for relative_path in relative_paths:
+            if relative_path in self._images:
+                continue
+            pack = assetpack.default_pack()
+            info = pack.image_info(relative_path) if pack is not None else None
+            if info is not None:
+                self._request(relative_path, alpha, info)
+            else:
+                self.worker.submit(self._load, relative_path,
+                                   on_done=lambda future, path=relative_path: self._store(path, alpha, future))
+
+    def _store(self, relative_path, alpha, future):
+        """Добавляет изображение, загруженное в фоне, в кэш (в главном потоке)."""
+        try:
+            surface = future.result()
+        except (pygame.error, OSError) as e:
+            print("Не удалось загрузить изображение:", relative_path, e)
+            return
+        if relative_path not in self._images:
+            self._images[relative_path] = (surface, has_alpha(surface, alpha))
+
+    def _load(self, relative_path):
+        """Декодирует изображение из пакета ресурсов или из отдельного файла."""
+        self.loads += 1
+        pack = assetpack.default_pack()
+        with io_stats.track('image'):
+            if pack is not None and relative_path in pack:
+                return pack.image(relative_path)
+            return pygame.image.load(gf.resource_path(relative_path))
+
+    def convert_all(self):
+        """
+        Приводит все загруженные изображения к формату экрана.
+
+        Вызывается после pygame.display.set_mode(), так как до создания окна
+        convert()/convert_alpha() недоступны.
+        """
+        start = time.perf_counter()
+        for relative_path in list(self._images):
+            # Заглушки не заменяются: их уже получили спрайты
+            if relative_path not in self._converted and relative_path not in self._pending:
+                self._convert(relative_path)
+        # Окрашенные копии создаются заново из конвертированных изображений
+        # (копии заглушек остаются: они будут обновлены при загрузке изображения)
+        self._tinted = {key: surface for key, surface in self._tinted.items() if key[0] in self._pending}
+        self.load_time += time.perf_counter() - start
+
+    def build_atlas(self):
+        """
+        Собирает все загруженные изображения в текстурный атлас.
+
+        Вызывается после convert_all(); спрайты, созданные после этого,
+        получают подповерхности атласа.
+        """
+        start = time.perf_counter()
+        loaded = {path: surface for path, (surface, _) in self._images.items()
+                  if path not in self._pending}
+        self.atlas = TextureAtlas(loaded)
+        for path in loaded:
+            self._images[path] = (self.atlas.get(path), self._images[path][1])
+        self.generation += 1
+        self.load_time += time.perf_counter() - start
+
+    def surfaces(self):
+        """Возвращает все изображения реестра (например, для заблаговременного масштабирования)."""
+        return ([surface for surface, _ in self._images.values()] + list(self._solids.values()) +
+                list(self._tinted.values()))
+
+    def solid(self, size, color):
+        """
+        Возвращает общую поверхность заданного размера, залитую цветом (например, для пуль).
+
+        :param size: Размер (ширина, высота).
+        :param color: Цвет заливки.
+        :return: Поверхность pygame.Surface, общая для всех вызывающих.
+        """
+        key = (tuple(size), tuple(color))
+        surface = self._solids.get(key)
+        if surface is None:
+            surface = pygame.Surface(key[0])
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            surface.fill(key[1])
+            self._solids[key] = surface
+        return surface
+
+    def tinted(self, relative_path, tint):
+        """
+        Возвращает общую копию изображения, окрашенную умножением цвета (например, для типов пришельцев).
+
+        :param relative_path: Относительный путь к изображению.
+        :param tint: Оттенок (r, g, b); каждый канал изображения умножается на канал / 255.
+        :return: Поверхность pygame.Surface, общая для всех вызывающих.
+        """
+        key = (relative_path, tuple(tint))
+        surface = self._tinted.get(key)
+        if surface is None:
+            surface = self.image(relative_path).copy()
+            surface.fill(key[1], special_flags=pygame.BLEND_RGB_MULT)
+            self._tinted[key] = surface
+        return surface
+
+    def _convert(self, relative_path):
+        """Конвертирует одно изображение в формат экрана и обновляет кэш."""
+        surface, alpha = self._images[relative_path]
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        self._images[relative_path] = (surface, alpha)
+        self._converted.add(relative_path)
+        return surface
+
+    def get_stats(self):
+        """
+        Возвращает счётчики загрузки изображений.
+
+        :return: Словарь с количеством загрузок, попаданий в кэш и временем загрузки (мс).
+        """
+        return {
+            "images": len(self._images),
+            "atlas_size": self.atlas.surface.get_size() if self.atlas is not None else None,
+            "loads": self.loads,
+            "hits": self.hits,
+            "load_time_ms": round(self.load_time * 1000, 3),
+        }
+
+
+# Общий реестр, используемый всеми спрайтами игры
+registry = AssetRegistry()
+
+
+def has_alpha(surface, alpha=None):
+    """
+    Определяет, нужно ли сохранять альфа-канал изображения при конвертации.
+
+    :param surface: Загруженная поверхность.
+    :param alpha: Явное значение (True или False) или None - по флагу SRCALPHA поверхности
+        (32-битные BMP спрайтов игры содержат прозрачный фон).
+    :return: True, если изображение нужно конвертировать через convert_alpha().
+    """
+    if alpha is None:
+        return bool(surface.get_flags() & pygame.SRCALPHA)
+    return alpha
+
+
+def get_image(relative_path, alpha=None):
+    """
+    Возвращает общее изображение из реестра.
+
+    :param relative_path: Относительный путь к изображению.
+    :param alpha: True, если изображение содержит прозрачность (None - определить по изображению).
+    :return: Общая поверхность pygame.Surface.
+    """
+    return registry.image(relative_path, alpha)
@@ -0,0 +1,69 @@
+import pygame
+
+
+class TextureAtlas:
+    """
+    Текстурный атлас: все изображения игры на одной поверхности.
+
+    Изображения раскладываются по "полкам" (строкам одинаковой высоты) один раз
+    при запуске, а спрайты получают подповерхности атласа. Так все изображения
+    лежат в одном блоке памяти в формате экрана.
+    """
+
+    padding = 1  # Зазор между изображениями (в пикселях)
+
+    def __init__(self, images, max_width=1024):
+        """
+        Строит атлас.
+
+        :param images: Словарь {имя: поверхность} (поверхности уже в формате экрана; если
+            хотя бы у одной есть альфа-канал, атлас строится с альфа-каналом).
+        :param max_width: Максимальная ширина атласа в пикселях.
+        """
+        self.regions = {}  # Имя -> прямоугольник изображения в атласе
+
+        # Раскладка по полкам: сначала самые высокие изображения
+        order = sorted(images, key=lambda name: images[name].get_height(), reverse=True)
+        x = y = shelf_height = width = 0
+        for name in order:
+            image_width, image_height = images[name].get_size()
+            if x and x + image_width > max_width:
+                y += shelf_height + self.padding
+                x = shelf_height = 0
+            self.regions[name] = pygame.Rect(x, y, image_width, image_height)
+            x += image_width + self.padding
+            shelf_height = max(shelf_height, image_height)
+            width = max(width, x)
+        height = y + shelf_height
+
+        alpha = any(images[name].get_flags() & pygame.SRCALPHA for name in images)
+        self.surface = pygame.Surface((max(width, 1), max(height, 1)),
+                                      pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha() if alpha else self.surface.convert()
+        for name, rect in self.regions.items():
+            self.surface.blit(images[name], rect)
+
+        # Подповерхности атласа, выдаваемые спрайтам
+        self.images = {name: self.surface.subsurface(rect) for name, rect in self.regions.items()}
+
+    def get(self, name):
+        """Возвращает подповерхность атласа для изображения."""
+        return self.images[name]
+
+
+def blit_batch(target, sequence):
+    """
+    Рисует последовательность пар (поверхность, позиция) одним вызовом.
+
+    Использует Surface.fblits (pygame-ce), а при его отсутствии - Surface.blits
+    без возврата прямоугольников.
+
+    :param target: Поверхность, на которой рисуется слой.
+    :param sequence: Последовательность пар (поверхность, прямоугольник или позиция).
+    """
+    fblits = getattr(target, 'fblits', None)
+    if fblits is not None:
+        fblits(sequence)
+    else:
+        target.blits(sequence, False)
@@ -0,0 +1,331 @@
+"""
+Нагрузочные тесты конвейера кадра игры 'Инопланетное Вторжение'.
+
+Прогоняет сценарии (полный флот, флот на сетке столкновений, максимум пуль,
+дождь бонусов, частая смена уровней) через функции functions.py без реального окна и звука (драйверы SDL
+'dummy') и выводит процентили времени каждой фазы кадра и объём выделяемой
+памяти в формате JSON. Результат можно сохранить как эталон и сравнивать с ним
+последующие изменения.
+
+Примеры:
+    python bench.py --output bench.json
+    python bench.py --save-baseline bench_baseline.json
+    python bench.py --baseline bench_baseline.json --threshold 1.2
+"""
+import os
+
+# Драйверы SDL должны быть выбраны до инициализации pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from settings import Settings
+from button import Button
+from scoreboard import Scoreboard
+from simulation import Simulation, InputState
+import functions as gf
+import assets
+
+# Фазы кадра в порядке выполнения
+PHASES = ('update_bullets', 'update_aliens', 'check_bonus_collisions', 'update_screen')
+
+
+def configure_full_fleet(ai_settings):
+    """Полный флот на экране 1920x1080, корабль ходит из стороны в сторону."""
+    ai_settings.screen_width = 1920
+    ai_settings.screen_height = 1080
+
+
+def drive_full_fleet(sim, inputs, frame):
+    """Корабль меняет направление каждые 120 кадров и не стреляет."""
+    inputs.moving_right = (frame // 120) % 2 == 0
+    inputs.moving_left = not inputs.moving_right
+
+
+def configure_grid_fleet(ai_settings):
+    """Флот на экране 3840x2160: пришельцев больше Fleet.grid_min_aliens, столкновения идут через сетку."""
+    ai_settings.screen_width = 3840
+    ai_settings.screen_height = 2160
+    ai_settings.bullet_allowed = 20
+
+
+def drive_grid_fleet(sim, inputs, frame):
+    """Корабль ходит из стороны в сторону и стреляет каждые 5 кадров."""
+    drive_full_fleet(sim, inputs, frame)
+    inputs.fire = 1 if frame % 5 == 0 else 0
+
+
+def configure_max_bullets(ai_settings):
+    """Лимит пуль увеличен до 100, стрельба каждый кадр."""
+    ai_settings.bullet_allowed = 100
+    ai_settings.bullet_speed_factor = 3
+
+
+def drive_max_bullets(sim, inputs, frame):
+    """Выстрел на каждом кадре при движении корабля."""
+    drive_full_fleet(sim, inputs, frame)
+    inputs.fire = 1
+
+
+def configure_bonus_rain(ai_settings):
+    """Каждый сбитый пришелец оставляет бонус."""
+    ai_settings.bonus_chance = 1.0
+
+
+def drive_bonus_rain(sim, inputs, frame):
+    """Каждый кадр с верхнего края падает новый бонус."""
+    drive_full_fleet(sim, inputs, frame)
+    inputs.fire = 1
+    x = random.randrange(0, sim.ai_settings.screen_width - 50)
+    sim.bonuses.spawn(sim.ai_settings, sim.screen, random.choice(['life', 'shield']), x, 0)
+
+
+def configure_level_ups(ai_settings):
+    """Переход уровня без паузы."""
+    ai_settings.level_transition_time = 0
+
+
+def drive_level_ups(sim, inputs, frame):
+    """Каждые 10 кадров флот уничтожается целиком, вызывая переход на новый уровень."""
+    if frame % 10 == 0:
+        sim.aliens.empty()
+
+
+def configure_bullet_hell(ai_settings):
+    """Флот стреляет 400 раз в секунду, щит корабля не истекает."""
+    ai_settings.alien_fire_rates = (400,)
+    ai_settings.alien_bullet_speed = 1
+    ai_settings.shield_duration = 10 ** 9
+
+
+def drive_bullet_hell(sim, inputs, frame):
+    """Корабль под щитом ходит из стороны в сторону; на экране сотни снарядов пришельцев."""
+    drive_full_fleet(sim, inputs, frame)
+    if not sim.stats.shield_active:
+        sim.stats.activate_shield()
+
+
+SCENARIOS = {
+    'full_fleet': (configure_full_fleet, drive_full_fleet),
+    'grid_fleet': (configure_grid_fleet, drive_grid_fleet),
+    'max_bullets': (configure_max_bullets, drive_max_bullets),
+    'bonus_rain': (configure_bonus_rain, drive_bonus_rain),
+    'rapid_level_ups': (configure_level_ups, drive_level_ups),
+    'bullet_hell': (configure_bullet_hell, drive_bullet_hell),
+}
+
+
+def percentile(sorted_values, fraction):
+    """Возвращает процентиль отсортированного списка (ближайший ранг)."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def summarize(samples_ns):
+    """Сводка по времени фазы: среднее, процентили и максимум в миллисекундах."""
+    values = sorted(sample / 1e6 for sample in samples_ns)
+    return {
+        "mean_ms": round(sum(values) / len(values), 4) if values else 0.0,
+        "p50_ms": round(percentile(values, 0.50), 4),
+        "p95_ms": round(percentile(values, 0.95), 4),
+        "p99_ms": round(percentile(values, 0.99), 4),
+        "max_ms": round(values[-1], 4) if values else 0.0,
+    }
+
+
+def make_world(name, seed):
+    """Создаёт экран, мир и интерфейс для сценария."""
+    configure, drive = SCENARIOS[name]
+    random.seed(seed)
+    ai_settings = Settings()
+    ai_settings.ship_limit = 1000000  # Корабль не должен закончиться во время прогона
+    configure(ai_settings)
+
+    screen = pygame.display.set_mode((ai_settings.screen_width, ai_settings.screen_height))
+    assets.registry.convert_all()
+    assets.registry.build_atlas()
+    sim = Simulation(ai_settings, screen, seed=seed)
+    play_button = Button(ai_settings, screen, "Играть")
+    sb = Scoreboard(ai_settings, screen, sim.stats)
+    inputs = InputState()
+    inputs.start = True
+    sim.apply_input(inputs)
+    return sim, play_button, sb, inputs, drive
+
+
+def run_frame(sim, play_button, sb, inputs, timings=None, allocations=None):
+    """
+    Выполняет один кадр через функции functions.py, замеряя каждую фазу.
+
+    :param timings: Словарь {фаза: [время в нс]} или None.
+    :param allocations: Словарь {фаза: [пик выделенной памяти в байтах]} или None.
+    """
+    ai_settings, stats, screen = sim.ai_settings, sim.stats, sim.screen
+    stats.state.update()
+    sim.apply_input(inputs)
+    sim.ship.update(sim.dt)
+    phases = (
+        lambda: gf.update_bullets(ai_settings, screen, stats, sim.ship, sim.aliens,
+                                  sim.bullets, sim.bonuses, sim.dt),
+        lambda: gf.update_aliens(ai_settings, stats, screen, sim.ship, sim.aliens,
+                                 sim.bullets, sim.dt),
+        lambda: gf.check_bonus_collisions(ai_settings, stats, sim.ship, sim.bonuses),
+        lambda: gf.update_screen(ai_settings, screen, stats, sb, sim.ship, sim.aliens,
+                                 sim.bullets, play_button, sim.bonuses),
+    )
+    for phase, call in zip(PHASES, phases):
+        if allocations is not None:
+            start_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            call()
+            allocations[phase].append(tracemalloc.get_traced_memory()[1] - start_memory)
+        else:
+            start = time.perf_counter_ns()
+            call()
+            timings[phase].append(time.perf_counter_ns() - start)
+    sim.bonuses.update(sim.dt)
+    sim.bonuses.cull()
+    sim.clock.advance(sim.step_ms)
+
+
+def run_scenario(name, frames, warmup, seed):
+    """
+    Прогоняет сценарий: сначала замер времени, затем отдельно замер памяти.
+
+    :return: Словарь с результатами сценария.
+    """
+    # Замер времени (без tracemalloc, чтобы не искажать результаты)
+    sim, play_button, sb, inputs, drive = make_world(name, seed)
+    timings = {phase: [] for phase in PHASES}
+    frame_times = []
+    level_change_times = []  # Кадры, в которых собирался новый флот (новый уровень или потеря корабля)
+    for frame in range(warmup):
+        drive(sim, inputs, frame)
+        run_frame(sim, play_button, sb, inputs, {phase: [] for phase in PHASES})
+    gc_before = sum(generation['collections'] for generation in gc.get_stats())
+    for frame in range(frames):
+        drive(sim, inputs, warmup + frame)
+        reused = sim.aliens.created + sim.aliens.reused
+        start = time.perf_counter_ns()
+        run_frame(sim, play_button, sb, inputs, timings)
+        frame_times.append(time.perf_counter_ns() - start)
+        if sim.aliens.created + sim.aliens.reused != reused:
+            level_change_times.append(frame_times[-1])
+    gc_collections = sum(generation['collections'] for generation in gc.get_stats()) - gc_before
+
+    # Замер выделений памяти на том же сценарии с тем же зерном
+    sim, play_button, sb, inputs, drive = make_world(name, seed)
+    allocations = {phase: [] for phase in PHASES}
+    tracemalloc.start()
+    for frame in range(warmup + frames):
+        drive(sim, inputs, frame)
+        run_frame(sim, play_button, sb, inputs, allocations=allocations)
+    tracemalloc.stop()
+
+    phases = {}
+    for phase in PHASES:
+        phases[phase] = summarize(timings[phase])
+        measured = allocations[phase][warmup:]
+        phases[phase]["alloc_peak_kb"] = round(sum(measured) / len(measured) / 1024, 3)
+    return {
+        "frame": summarize(frame_times),
+        # Худшее время кадра при смене флота - заметная "заминка" перехода уровня
+        "level_change": dict(summarize(level_change_times), count=len(level_change_times)),
+        "phases": phases,
+        "gc_collections": gc_collections,
+        "aliens": len(sim.aliens),
+        "alien_shots": len(sim.aliens.shots),
+        "pools": sim.get_pool_counts(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Сравнивает p95 фаз с эталоном.
+
+    :return: Список строк с регрессиями (отношение больше threshold).
+    """
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        base_scenario = baseline.get("scenarios", {}).get(name)
+        if base_scenario is None:
+            continue
+        for phase, summary in scenario["phases"].items():
+            base = base_scenario["phases"].get(phase, {}).get("p95_ms")
+            if not base:
+                continue
+            ratio = summary["p95_ms"] / base
+            line = f"{name}.{phase}: p95 {summary['p95_ms']:.4f} ms / {base:.4f} ms = {ratio:.2f}x"
+            print(line, file=sys.stderr)
+            if ratio > threshold:
+                regressions.append(line)
+    return regressions
+
+
+def main(argv=None):
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Нагрузочные тесты конвейера кадра.")
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help="Сценарий (можно указать несколько раз; по умолчанию - все).")
+    parser.add_argument('--frames', type=int, default=600, help="Количество замеряемых кадров.")
+    parser.add_argument('--warmup', type=int, default=60, help="Количество кадров прогрева.")
+    parser.add_argument('--seed', type=int, default=12345, help="Зерно генератора случайных чисел.")
+    parser.add_argument('--output', help="Файл для результатов (по умолчанию - стандартный вывод).")
+    parser.add_argument('--save-baseline', metavar='FILE', help="Сохранить результаты как эталон.")
+    parser.add_argument('--baseline', metavar='FILE', help="Сравнить результаты с эталоном.")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Допустимое отношение p95 к эталону (по умолчанию 1.25).")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+    for name in args.scenario or sorted(SCENARIOS):
+        results["scenarios"][name] = run_scenario(name, args.frames, args.warmup, args.seed)
+    pygame.quit()
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("Обнаружены регрессии:", file=sys.stderr)
+            for line in regressions:
+                print("  " + line, file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
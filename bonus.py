@@ -1,9 +1,19 @@
 import pygame
-import functions as gf
+import assets
+from loop import interpolate_rect
+from sprites import CompactSprite, get_context
 
-class Bonus(pygame.sprite.Sprite):
+class Bonus(CompactSprite):
     """Класс, представляющий бонус в игре."""
 
+    __slots__ = ('bonus_type', 'y')
+
+    # Изображения бонусов в зависимости от типа
+    image_paths = {
+        'life': 'images/bonus_life.bmp',  # Бонус жизни
+        'shield': 'images/bonus_shield.bmp',  # Бонус щита
+    }
+
     def __init__(self, ai_settings, screen, bonus_type, x, y):
         """
         Инициализирует бонус с заданным типом и начальной позицией.
@@ -14,36 +24,61 @@ class Bonus(pygame.sprite.Sprite):
         :param x: Начальная позиция бонуса по оси X.
         :param y: Начальная позиция бонуса по оси Y.
         """
-        super().__init__()  # Инициализация базового класса Sprite
-        self.screen = screen
-        self.ai_settings = ai_settings
+        super().__init__()  # Инициализация компактного спрайта
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Прямоугольник переиспользуется при reset()
+        self.reset(ai_settings, screen, bonus_type, x, y)
+
+    def reset(self, ai_settings, screen, bonus_type, x, y):
+        """
+        Переинициализирует бонус (повторное использование из пула).
+
+        :param ai_settings: Объект настроек игры.
+        :param screen: Экран, на котором будет отображаться бонус.
+        :param bonus_type: Тип бонуса ('life' или 'shield').
+        :param x: Начальная позиция бонуса по оси X.
+        :param y: Начальная позиция бонуса по оси Y.
+        """
+        self.context = get_context(ai_settings, screen)  # Настройки и экран общие для всей волны
         self.bonus_type = bonus_type  # Тип бонуса (например, 'life' или 'shield')
 
-        # Создание изображения бонуса в зависимости от типа
-        if bonus_type == 'life':
-            self.image = pygame.image.load(gf.resource_path('images/bonus_life.bmp'))  # Бонус жизни
-        elif bonus_type == 'shield':
-            self.image = pygame.image.load(gf.resource_path('images/bonus_shield.bmp'))  # Бонус щита
+        # Общее изображение бонуса в зависимости от типа
+        self.image = assets.get_image(self.image_paths[bonus_type])
 
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.x = x  # Устанавливаем позицию бонуса по оси X
         self.rect.y = y  # Устанавливаем позицию бонуса по оси Y
 
-        # Скорость падения бонуса (скорость обновления позиции)
-        self.speed = ai_settings.bonus_speed
+        # Точная позиция по вертикали и позиция на предыдущем шаге симуляции
+        self.y = float(self.rect.y)
+        self.prev_pos = None
+
+    @property
+    def speed(self):
+        """Скорость падения бонуса (общая для всех бонусов, из настроек)."""
+        return self.context.ai_settings.bonus_speed
 
-    def update(self):
+    def update(self, dt=1.0):
         """
         Обновляет позицию бонуса. Перемещает бонус вниз по экрану с заданной скоростью.
 
         Этот метод должен вызываться в основном игровом цикле для обновления состояния.
+
+        :param dt: Множитель перемещения за прошедшее время (1.0 - один кадр базовой частоты).
         """
-        self.rect.y += self.speed  # Перемещает бонус вниз по экрану
+        self.prev_pos = self.rect.topleft
+        self.y += self.speed * dt  # Перемещает бонус вниз по экрану
+        self.rect.y = self.y
+
+    def is_offscreen(self):
+        """Проверяет, упал ли бонус за нижний край экрана."""
+        return self.rect.top >= self.ai_settings.screen_height
 
-    def blitme(self):
+    def blitme(self, alpha=1.0):
         """
         Отображает бонус на экране в текущей позиции.
 
         Этот метод рисует бонус на экране, используя текущее изображение и его прямоугольник.
+
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом.
         """
-        self.screen.blit(self.image, self.rect)
+        self.screen.blit(self.image, interpolate_rect(self, alpha))
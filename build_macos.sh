@@ -1,3 +1,4 @@
 @echo off
-pyinstaller --onefile --add-data "sounds:sounds" --add-data "images:images" main.py
+python assetpack.py
+pyinstaller --onefile --add-data "assets.pack:." main.py
 pause
@@ -1,15 +1,21 @@
 import pygame
-from pygame.sprite import Sprite
 
+import assets
+from loop import interpolate_rect
+from sprites import CompactSprite, get_context
 
-class Bullet(Sprite):
+
+class Bullet(CompactSprite):
     """
     Класс для управления пулями, выпущенными кораблём.
 
     Этот класс управляет пулями, которые корабль выпустил для уничтожения пришельцев.
     Пули движутся вверх по экрану и исчезают, когда выходят за пределы экрана.
+    Скорость и цвет общие для всех пуль и берутся из настроек, а не копируются в каждую пулю.
     """
 
+    __slots__ = ('y',)
+
     def __init__(self, ai_settings, screen, ship):
         """
         Инициализирует пулю в текущей позиции корабля.
@@ -18,35 +24,67 @@ class Bullet(Sprite):
         :param screen: Экран, на котором будет отображаться пуля.
         :param ship: Объект корабля, который выпустил пулю. Позиция пули зависит от положения корабля.
         """
-        super().__init__()  # Вызов конструктора родительского класса Sprite
-        self.screen = screen
-
-        # Создание пули в позиции (0,0) и назначение правильной позиции
+        super().__init__()  # Инициализация компактного спрайта
         self.rect = pygame.Rect(0, 0, ai_settings.bullet_width,
                                 ai_settings.bullet_height)
+        self.reset(ai_settings, screen, ship)
+
+    def reset(self, ai_settings, screen, ship):
+        """
+        Переинициализирует пулю в текущей позиции корабля (повторное использование из пула).
+
+        :param ai_settings: Объект настроек игры, содержащий параметры пуль.
+        :param screen: Экран, на котором будет отображаться пуля.
+        :param ship: Объект корабля, который выпустил пулю.
+        """
+        self.context = get_context(ai_settings, screen)  # Настройки и экран общие для всех пуль
+
+        # Размер пули и назначение правильной позиции
+        self.rect.size = (ai_settings.bullet_width, ai_settings.bullet_height)
         self.rect.centerx = ship.rect.centerx  # Центр пули по горизонтали совпадает с центром корабля
         self.rect.top = ship.rect.top  # Пуля появляется на верхней границе корабля
 
         # Позиция пули хранится в вещественном формате для более точных вычислений
         self.y = float(self.rect.y)
+        # Позиция на предыдущем шаге симуляции (для интерполяции при отрисовке)
+        self.prev_pos = None
+
+        # Заранее залитая общая поверхность пули (рисуется копированием, а не draw.rect)
+        self.image = assets.registry.solid(self.rect.size, ai_settings.bullet_color)
+
+    @property
+    def speed_factor(self):
+        """Скорость движения пули (общая для всех пуль, из настроек)."""
+        return self.context.ai_settings.bullet_speed_factor
 
-        self.color = ai_settings.bullet_color  # Цвет пули
-        self.speed_factor = ai_settings.bullet_speed_factor  # Скорость движения пули
+    @property
+    def color(self):
+        """Цвет пули (общий для всех пуль, из настроек)."""
+        return self.context.ai_settings.bullet_color
 
-    def update(self):
+    def update(self, dt=1.0):
         """
         Перемещает пулю вверх по экрану.
 
         Позиция пули обновляется каждый кадр в зависимости от её скорости. Пуля двигается
         вверх экрана, и её прямоугольник (rect) также обновляется.
+
+        :param dt: Множитель перемещения за прошедшее время (1.0 - один кадр базовой частоты).
         """
-        self.y -= self.speed_factor  # Обновление позиции пули в вещественном формате (движется вверх)
+        self.prev_pos = self.rect.topleft
+        self.y -= self.speed_factor * dt  # Обновление позиции пули в вещественном формате (движется вверх)
         self.rect.y = self.y  # Обновление прямоугольника для отображения пули на экране
 
-    def draw_bullet(self):
+    def is_offscreen(self):
+        """Проверяет, вышла ли пуля за верхний край экрана."""
+        return self.rect.bottom <= 0
+
+    def draw_bullet(self, alpha=1.0):
         """
         Отображает пулю на экране.
 
-        Рисует пулю с заданным цветом на экране в текущей позиции, используя её прямоугольник.
+        Копирует заранее залитую поверхность пули на экран в текущей позиции.
+
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом.
         """
-        pygame.draw.rect(self.screen, self.color, self.rect)  # Рисует прямоугольник пули
\ No newline at end of file
+        self.screen.blit(self.image, interpolate_rect(self, alpha))
\ No newline at end of file
@@ -13,12 +13,13 @@ class Button:
         """
         Инициализирует атрибуты кнопки.
 
-        :param ai_settings: Объект настроек игры (пока не используется, но может быть полезен для будущих улучшений).
+        :param ai_settings: Объект настроек игры (размер логического игрового пространства).
         :param screen: Экран, на котором будет отображаться кнопка.
         :param msg: Текст сообщения, который будет отображён на кнопке.
         """
         self.screen = screen
-        self.screen_rect = screen.get_rect()
+        # Кнопка располагается в логических координатах игры, а не в пикселях экрана
+        self.screen_rect = pygame.Rect(0, 0, ai_settings.screen_width, ai_settings.screen_height)
 
         # Размеры кнопки
         self.width, self.height = 200, 50
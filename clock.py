@@ -0,0 +1,30 @@
+import pygame
+
+
+class WallClock:
+    """Часы реального времени на основе pygame.time (поведение по умолчанию)."""
+
+    def get_ticks(self):
+        """Возвращает количество миллисекунд с момента pygame.init()."""
+        return pygame.time.get_ticks()
+
+
+class SimClock:
+    """
+    Часы симуляции.
+
+    Время продвигается явно, шагами симуляции, поэтому игровые таймеры
+    (например, щит) не зависят от скорости компьютера и работают без окна.
+    """
+
+    def __init__(self):
+        """Инициализирует часы с нулевым временем."""
+        self.ticks = 0.0  # Текущее время симуляции (в миллисекундах)
+
+    def get_ticks(self):
+        """Возвращает текущее время симуляции в миллисекундах."""
+        return int(self.ticks)
+
+    def advance(self, milliseconds):
+        """Продвигает время симуляции на заданное количество миллисекунд."""
+        self.ticks += milliseconds
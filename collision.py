@@ -0,0 +1,85 @@
+import numpy as np
+
+
+class SpatialGrid:
+    """
+    Равномерная сетка для быстрого отбора кандидатов на столкновение.
+
+    Объекты одинакового размера раскладываются по ячейкам по левому верхнему
+    углу. Ключи ячеек отсортированы, поэтому запрос по прямоугольнику сводится
+    к нескольким двоичным поискам вместо перебора всех объектов.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Инициализирует пустую сетку.
+
+        :param cell_size: Размер ячейки в пикселях.
+        """
+        self.cell_size = cell_size
+        self._keys = np.zeros(0, dtype=np.int64)  # Отсортированные ключи ячеек
+        self._ids = np.zeros(0, dtype=np.int64)  # Индексы объектов в порядке ключей
+        self._min_cx = 0  # Смещения, делающие номера ячеек неотрицательными
+        self._min_cy = 0
+        self._stride = 1  # Количество ячеек в строке сетки
+
+    def build(self, xs, ys, ids):
+        """
+        Заполняет сетку объектами.
+
+        :param xs: Массив левых границ объектов (целые пиксели).
+        :param ys: Массив верхних границ объектов (целые пиксели).
+        :param ids: Массив индексов объектов.
+        """
+        if len(ids) == 0:
+            self._keys = np.zeros(0, dtype=np.int64)
+            self._ids = np.zeros(0, dtype=np.int64)
+            return
+        cx = xs // self.cell_size
+        cy = ys // self.cell_size
+        self._min_cx = int(cx.min())
+        self._min_cy = int(cy.min())
+        self._stride = int(cx.max()) - self._min_cx + 1
+        keys = (cy - self._min_cy) * self._stride + (cx - self._min_cx)
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        self._ids = ids[order]
+
+    def query(self, left, top, right, bottom, width, height):
+        """
+        Возвращает индексы объектов, которые могут пересекать прямоугольник.
+
+        :param left: Левая граница прямоугольника.
+        :param top: Верхняя граница прямоугольника.
+        :param right: Правая граница прямоугольника.
+        :param bottom: Нижняя граница прямоугольника.
+        :param width: Ширина объектов в сетке.
+        :param height: Высота объектов в сетке.
+        :return: Массив индексов кандидатов (без точной проверки пересечения).
+        """
+        if len(self._keys) == 0:
+            return self._ids
+        cell = self.cell_size
+        # Объект, начинающийся левее/выше прямоугольника, может заходить в него
+        cx_first = max((left - width) // cell - self._min_cx, 0)
+        cx_last = min((right - 1) // cell - self._min_cx, self._stride - 1)
+        cy_first = max((top - height) // cell - self._min_cy, 0)
+        cy_last = (bottom - 1) // cell - self._min_cy
+        if cx_first > cx_last or cy_first > cy_last:
+            return self._ids[:0]
+
+        # Ключи одной строки сетки идут подряд, поэтому строка - один срез
+        keys = self._keys
+        last_key = int(keys[-1])
+        slices = []
+        for row in range(cy_first, cy_last + 1):
+            lo_key = row * self._stride + cx_first
+            if lo_key > last_key:
+                break
+            lo = keys.searchsorted(lo_key, side='left')
+            hi = keys.searchsorted(row * self._stride + cx_last, side='right')
+            if hi > lo:
+                slices.append(self._ids[lo:hi])
+        if not slices:
+            return self._ids[:0]
+        return slices[0] if len(slices) == 1 else np.concatenate(slices)
@@ -0,0 +1,189 @@
+import sys
+
+import pygame
+
+from profiler import frame_profiler
+import viewport
+
+
+class InputDispatcher:
+    """
+    Таблица привязок клавиш к действиям игрока.
+
+    Клавиши из Settings.key_bindings переводятся в коды pygame один раз, при
+    создании диспетчера, а каждое событие обрабатывается поиском в словаре,
+    поэтому стоимость обработки не зависит от количества привязок. Удержание
+    клавиши выстрела даёт автоматическую стрельбу с ограниченной частотой.
+    """
+
+    def __init__(self, ai_settings):
+        """
+        Строит таблицы привязок из настроек.
+
+        :param ai_settings: Настройки игры (key_bindings, autofire_rate, profiler_trace_file).
+        :raises ValueError: Если в привязках неизвестная клавиша или одна клавиша назначена двум действиям.
+        """
+        self.ai_settings = ai_settings
+
+        # Действие -> (обработчик нажатия, обработчик отпускания или None)
+        self.actions = {
+            'move_right': (self._move_right, self._move_right),
+            'move_left': (self._move_left, self._move_left),
+            'fire': (self._fire, None),
+            'quit': (self._quit, None),
+            'save': (self._save, None),
+            'load': (self._load, None),
+            'profiler': (self._toggle_profiler, None),
+            'trace': (self._dump_trace, None),
+        }
+
+        self.key_actions = {}  # Код клавиши -> действие
+        for action, key_names in ai_settings.key_bindings.items():
+            if action not in self.actions:
+                raise ValueError(f"неизвестное действие: {action}")
+            for key_name in key_names:
+                try:
+                    key = pygame.key.key_code(key_name)
+                except ValueError:
+                    raise ValueError(f"неизвестная клавиша '{key_name}' для действия {action}") from None
+                if self.key_actions.get(key, action) != action:
+                    raise ValueError(f"клавиша '{key_name}' назначена действиям "
+                                     f"{self.key_actions[key]} и {action}")
+                self.key_actions[key] = action
+
+        # Тип события -> обработчик
+        self.event_handlers = {
+            pygame.QUIT: self._on_quit,
+            pygame.KEYDOWN: self._on_keydown,
+            pygame.KEYUP: self._on_keyup,
+            pygame.MOUSEBUTTONDOWN: self._on_mouse_down,
+        }
+
+        self.held = {action: set() for action in self.actions}  # Удерживаемые клавиши действий
+
+        # Автоматическая стрельба при удержании клавиши выстрела
+        rate = ai_settings.autofire_rate
+        self.autofire_interval = 1000 / rate if rate > 0 else None  # Интервал выстрелов (мс)
+        self._next_autofire = 0  # Время следующего автоматического выстрела (мс)
+
+    def install(self):
+        """Оставляет в очереди событий pygame только обрабатываемые типы событий."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.event_handlers))
+
+    def process(self, events, stats, play_button, inputs):
+        """
+        Переводит события в команды игрока.
+
+        :param events: События pygame (например, pygame.event.get()).
+        :param stats: Статистика игры.
+        :param play_button: Кнопка для начала игры.
+        :param inputs: Объект InputState, в который записываются команды игрока.
+        """
+        handlers = self.event_handlers
+        for event in events:
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event, stats, play_button, inputs)
+        self._autofire(inputs)
+
+    def key_down(self, key, inputs):
+        """Выполняет действие, назначенное нажатой клавише."""
+        action = self.key_actions.get(key)
+        if action is not None:
+            self.held[action].add(key)
+            self.actions[action][0](action, inputs)
+
+    def key_up(self, key, inputs):
+        """Завершает действие удерживаемой клавиши."""
+        action = self.key_actions.get(key)
+        if action is not None:
+            self.held[action].discard(key)
+            on_release = self.actions[action][1]
+            if on_release is not None:
+                on_release(action, inputs)
+
+    def _on_quit(self, event, stats, play_button, inputs):
+        """Закрытие окна."""
+        sys.exit()
+
+    def _on_keydown(self, event, stats, play_button, inputs):
+        """Нажатие клавиши."""
+        self.key_down(event.key, inputs)
+
+    def _on_keyup(self, event, stats, play_button, inputs):
+        """Отпускание клавиши."""
+        self.key_up(event.key, inputs)
+
+    def _on_mouse_down(self, event, stats, play_button, inputs):
+        """Нажатие кнопки мыши: позиция берётся из события, а не из pygame.mouse.get_pos()."""
+        # Функции игры импортируются здесь: functions сам использует этот модуль
+        import functions as gf
+
+        # Позиция на экране переводится в логические координаты игры
+        mouse_x, mouse_y = viewport.to_logical(event.pos)
+        gf.check_play_button(stats, play_button, inputs, mouse_x, mouse_y)
+
+    def _move_right(self, action, inputs):
+        """Движение вправо, пока удерживается хотя бы одна клавиша действия."""
+        inputs.moving_right = bool(self.held[action])
+
+    def _move_left(self, action, inputs):
+        """Движение влево, пока удерживается хотя бы одна клавиша действия."""
+        inputs.moving_left = bool(self.held[action])
+
+    def _fire(self, action, inputs):
+        """Выстрел на ближайшем шаге симуляции; удержание включает автоматическую стрельбу."""
+        inputs.fire += 1
+        if self.autofire_interval is not None:
+            self._next_autofire = pygame.time.get_ticks() + self.autofire_interval
+
+    def _autofire(self, inputs):
+        """Добавляет выстрел, если клавиша выстрела удерживается дольше интервала автоматической стрельбы."""
+        if self.autofire_interval is None or not self.held['fire']:
+            return
+        now = pygame.time.get_ticks()
+        if now >= self._next_autofire:
+            inputs.fire += 1
+            self._next_autofire += self.autofire_interval
+            if self._next_autofire <= now:
+                # После долгого кадра пропущенные выстрелы не догоняются очередью
+                self._next_autofire = now + self.autofire_interval
+
+    def _quit(self, action, inputs):
+        """Выход из игры."""
+        sys.exit()
+
+    def _save(self, action, inputs):
+        """Сохранение мира на ближайшем шаге симуляции."""
+        inputs.save = True
+
+    def _load(self, action, inputs):
+        """Загрузка мира на ближайшем шаге симуляции."""
+        inputs.load = True
+
+    def _toggle_profiler(self, action, inputs):
+        """Оверлей профилировщика кадра."""
+        frame_profiler.toggle()
+
+    def _dump_trace(self, action, inputs):
+        """Трасса профилировщика для chrome://tracing."""
+        frame_profiler.dump_trace_async(self.ai_settings.profiler_trace_file)
+
+
+# Диспетчеры, созданные для настроек (по одному на объект настроек)
+_dispatchers = {}
+
+
+def get_dispatcher(ai_settings):
+    """
+    Возвращает диспетчер ввода для настроек, создавая его при необходимости.
+
+    :param ai_settings: Настройки игры.
+    :return: Объект InputDispatcher.
+    """
+    dispatcher = _dispatchers.get(id(ai_settings))
+    if dispatcher is None or dispatcher.ai_settings is not ai_settings:
+        dispatcher = InputDispatcher(ai_settings)
+        _dispatchers[id(ai_settings)] = dispatcher
+    return dispatcher
@@ -0,0 +1,438 @@
+import numpy as np
+
+from alien import Alien
+from collision import SpatialGrid
+from projectiles import ProjectileArray
+from sprites import CompactGroup
+
+
+class Fleet(CompactGroup):
+    """
+    Группа пришельцев с состоянием флота в массивах NumPy.
+
+    Координаты и признаки "жив" всех пришельцев хранятся в массивах, поэтому
+    движение, проверка краёв, снижение флота и проверка нижнего края
+    выполняются одной векторной операцией. Прямоугольники спрайтов
+    синхронизируются с массивами лениво - только когда спрайты действительно
+    нужны (отрисовка). Столкновения проверяются напрямую по массивам через
+    равномерную сетку SpatialGrid.
+
+    Сбитые пришельцы и пришельцы очищенного флота не выбрасываются: новый флот
+    (следующий уровень, потеря корабля) собирается из тех же объектов методом
+    spawn(), как в SpritePool, а волна из файла волн - методом place(), который
+    копирует во флот готовые массивы раскладки (waves.FormationLayout).
+
+    Ряды волны могут двигаться с разной скоростью (массив speed), а пришельцы -
+    выдерживать несколько попаданий (массив hp).
+    """
+
+    initial_capacity = 64  # Начальный размер массивов
+    grid_min_aliens = 48  # Для флота меньшего размера сетка не строится
+
+    def __init__(self, ai_settings):
+        """
+        Инициализирует пустой флот.
+
+        :param ai_settings: Настройки игры (скорость, направление, размеры экрана).
+        """
+        super().__init__()
+        self.ai_settings = ai_settings
+
+        self.count = 0  # Количество занятых ячеек массивов (живых и уничтоженных)
+        self.x = np.zeros(self.initial_capacity)  # Левая граница пришельца
+        self.y = np.zeros(self.initial_capacity)  # Верхняя граница пришельца
+        self.prev_x = np.zeros(self.initial_capacity)  # Позиция на предыдущем шаге
+        self.prev_y = np.zeros(self.initial_capacity)
+        self.alive = np.zeros(self.initial_capacity, dtype=bool)
+        self.speed = np.ones(self.initial_capacity)  # Множитель скорости пришельца
+        self.hp = np.ones(self.initial_capacity, dtype=np.int64)  # Оставшиеся попадания
+        self.column = np.zeros(self.initial_capacity, dtype=np.int64)  # Колонка строя
+        self.members = []  # Индекс в массивах -> спрайт пришельца
+        self._free = []  # Пришельцы, удалённые из флота, для повторного использования
+
+        # Счётчики повторного использования
+        self.created = 0  # Создано новых пришельцев
+        self.reused = 0  # Пришельцев взято из списка свободных
+
+        # Снаряды ответного огня флота и накопленная доля следующего выстрела
+        self.shots = ProjectileArray((ai_settings.alien_bullet_width, ai_settings.alien_bullet_height),
+                                     ai_settings.alien_bullet_color, ai_settings.alien_bullets_max)
+        self.fire_budget = 0.0
+        self._shooters = None  # Индексы нижних пришельцев колонок (None - пересчитать)
+
+        # Размер пришельца (одинаковый для всего флота)
+        self.alien_width = 0
+        self.alien_height = 0
+
+        self._rects_dirty = False  # Прямоугольники спрайтов отстают от массивов
+        self._has_prev = False  # Предыдущие позиции заполнены шагом update()
+        self._uniform_speed = True  # Все пришельцы движутся с одной скоростью
+
+        # Сетка для отбора кандидатов на столкновение. Если весь флот движется
+        # одинаково, сетка строится один раз на состав флота, а затем учитывается
+        # только общий сдвиг флота с момента её построения
+        self.grid = None
+        self._grid_dirty = True
+        self._shift_x = 0.0
+        self._shift_y = 0.0
+
+    def add_internal(self, sprite, layer=None):
+        """Добавляет пришельца в группу и записывает его позицию в массивы."""
+        super().add_internal(sprite, layer)
+        if self.count == len(self.x):
+            self._grow()
+
+        index = self.count
+        self.count += 1
+        self.x[index] = sprite.rect.x
+        self.y[index] = sprite.rect.y
+        self.prev_x[index] = sprite.rect.x
+        self.prev_y[index] = sprite.rect.y
+        self.alive[index] = True
+        self.speed[index] = 1.0
+        self.hp[index] = 1
+        self.column[index] = sprite.rect.x  # Колонка - по горизонтальной позиции
+        self.members.append(sprite)
+        sprite.fleet_index = index
+        self.alien_width, self.alien_height = sprite.rect.size
+        self._grid_dirty = True
+        self._shooters = None
+
+    def spawn(self, ai_settings, screen, x, y, alien_type=None, speed=1.0, hp=None, column=None):
+        """
+        Добавляет во флот пришельца в заданной позиции, по возможности используя свободный экземпляр.
+
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором рисуется игра.
+        :param x: Левая граница пришельца.
+        :param y: Верхняя граница пришельца.
+        :param alien_type: Тип пришельца из файла волн (waves.AlienType) или None.
+        :param speed: Множитель скорости пришельца.
+        :param hp: Оставшиеся попадания (по умолчанию - прочность типа).
+        :param column: Колонка строя (по умолчанию - по горизонтальной позиции).
+        :return: Добавленный пришелец.
+        """
+        alien = self._take(ai_settings, screen)
+        alien.rect.topleft = (int(x), int(y))
+        if alien_type is not None:
+            alien.kind = alien_type.kind
+            alien.points = alien_type.points
+            alien.image = alien_type.image()
+        self.add(alien)
+
+        index = alien.fleet_index
+        self.x[index] = self.prev_x[index] = x  # Точная позиция (в прямоугольнике - целая)
+        self.speed[index] = speed
+        if speed != 1.0:
+            self._uniform_speed = False
+        if hp is not None:
+            self.hp[index] = hp
+        elif alien_type is not None:
+            self.hp[index] = alien_type.hits
+        if column is not None:
+            self.column[index] = column
+        return alien
+
+    def place(self, layout, images, ai_settings, screen):
+        """
+        Добавляет во флот всех пришельцев готовой раскладки волны.
+
+        Позиции, скорости и прочность копируются из массивов раскладки целиком;
+        для каждого пришельца остаётся только взять спрайт из свободных.
+
+        :param layout: Раскладка волны (waves.FormationLayout).
+        :param images: Словарь {тип пришельца: изображение}.
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором рисуется игра.
+        """
+        start = self.count
+        end = start + len(layout)
+        while len(self.x) < end:
+            self._grow()
+
+        members = self.members
+        add_internal = super().add_internal
+        positions = zip(layout.x.astype(int).tolist(), layout.y.astype(int).tolist())
+        for index, kind, points, position in zip(range(start, end), layout.kinds, layout.points,
+                                                 positions):
+            alien = self._take(ai_settings, screen)
+            alien.image = images[kind]
+            alien.kind = kind
+            alien.points = points
+            alien.fleet_index = index
+            alien.rect.topleft = position
+            add_internal(alien)
+            alien.add_internal(self)
+            members.append(alien)
+
+        self.x[start:end] = self.prev_x[start:end] = layout.x
+        self.y[start:end] = self.prev_y[start:end] = layout.y
+        self.alive[start:end] = True
+        self.speed[start:end] = layout.speed
+        self.hp[start:end] = layout.hits
+        self.column[start:end] = layout.column
+        self.count = end
+
+        self.alien_width, self.alien_height = layout.alien_size
+        self._uniform_speed = self._uniform_speed and layout.uniform_speed
+        self._rects_dirty = True
+        self._grid_dirty = True
+        self._shooters = None
+
+    def _take(self, ai_settings, screen):
+        """Возвращает свободного пришельца или создаёт нового."""
+        if self._free:
+            alien = self._free.pop()
+            alien.reset(ai_settings, screen)
+            self.reused += 1
+        else:
+            alien = Alien(ai_settings, screen)
+            self.created += 1
+        return alien
+
+    def remove_internal(self, sprite):
+        """Удаляет пришельца из группы, помечает его ячейку как уничтоженную и возвращает его в список свободных."""
+        super().remove_internal(sprite)
+        self.alive[sprite.fleet_index] = False
+        self._free.append(sprite)
+        self._shooters = None
+        if not self.spritedict:
+            # Флот пуст - ячейки массивов можно использовать заново
+            self.count = 0
+            self.members = []
+            self._has_prev = False
+            self._uniform_speed = True
+            self._grid_dirty = True
+
+    def get_counts(self):
+        """
+        Возвращает счётчики повторного использования пришельцев.
+
+        :return: Словарь с количеством живых, свободных, созданных и повторно использованных пришельцев.
+        """
+        return {
+            "live": len(self.spritedict),
+            "pooled": len(self._free),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+    def _grow(self):
+        """Увеличивает размер массивов вдвое."""
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'alive', 'speed', 'hp', 'column'):
+            array = getattr(self, name)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def sprites(self):
+        """Возвращает спрайты пришельцев с прямоугольниками, согласованными с массивами."""
+        if self._rects_dirty:
+            self.sync_rects()
+        return super().sprites()
+
+    def __bool__(self):
+        """Проверяет, остались ли пришельцы, не синхронизируя прямоугольники."""
+        return bool(self.spritedict)
+
+    def sync_rects(self):
+        """Переносит координаты из массивов в прямоугольники живых спрайтов."""
+        self._rects_dirty = False
+        indices = np.flatnonzero(self.alive[:self.count])
+        members = self.members
+        xs = self.x[indices].astype(int).tolist()
+        ys = self.y[indices].astype(int).tolist()
+        if self._has_prev:
+            prev_xs = self.prev_x[indices].astype(int).tolist()
+            prev_ys = self.prev_y[indices].astype(int).tolist()
+            for index, x, y, prev_x, prev_y in zip(indices.tolist(), xs, ys, prev_xs, prev_ys):
+                sprite = members[index]
+                sprite.rect.topleft = (x, y)
+                sprite.prev_pos = (prev_x, prev_y)
+        else:
+            for index, x, y in zip(indices.tolist(), xs, ys):
+                members[index].rect.topleft = (x, y)
+
+    def blit_sequence(self, alpha=1.0):
+        """
+        Возвращает пары (изображение, позиция) живых пришельцев для Surface.blits().
+
+        Позиции интерполируются по массивам одной векторной операцией (так же,
+        как interpolate_rect()), без синхронизации прямоугольников спрайтов.
+
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом.
+        :return: Список пар (поверхность, (x, y)).
+        """
+        indices = np.flatnonzero(self.alive[:self.count])
+        xs = self.x[indices].astype(np.int64)
+        ys = self.y[indices].astype(np.int64)
+        if self._has_prev and alpha < 1.0:
+            prev_xs = self.prev_x[indices].astype(np.int64)
+            prev_ys = self.prev_y[indices].astype(np.int64)
+            xs = np.rint(prev_xs + (xs - prev_xs) * alpha).astype(np.int64)
+            ys = np.rint(prev_ys + (ys - prev_ys) * alpha).astype(np.int64)
+        members = self.members
+        return [(members[index].image, (x, y))
+                for index, x, y in zip(indices.tolist(), xs.tolist(), ys.tolist())]
+
+    def update(self, dt=1.0):
+        """
+        Перемещает весь флот влево или вправо одной векторной операцией.
+
+        Если ряды движутся с разной скоростью, взаимное расположение пришельцев
+        меняется, и сетка столкновений перестраивается при следующей проверке.
+
+        :param dt: Множитель перемещения за прошедшее время (1.0 - один кадр базовой частоты).
+        """
+        count = self.count
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+        step = self.ai_settings.alien_speed_factor * self.ai_settings.fleet_direction * dt
+        if self._uniform_speed:
+            self.x[:count] += step
+            self._shift_x += step
+        else:
+            self.x[:count] += step * self.speed[:count]
+            self._grid_dirty = True
+        self._has_prev = True
+        self._rects_dirty = True
+
+    def check_edges(self):
+        """
+        Проверяет, касается ли хотя бы один живой пришелец края экрана.
+
+        :return: True, если флот достиг левого или правого края.
+        """
+        alive = self.alive[:self.count]
+        if not alive.any():
+            return False
+        x = self.x[:self.count][alive]
+        return bool(x.max() + self.alien_width >= self.ai_settings.screen_width or
+                    x.min() <= 0)
+
+    def drop(self, distance):
+        """
+        Опускает весь флот вниз.
+
+        :param distance: Расстояние снижения в пикселях.
+        """
+        self.y[:self.count] += distance
+        self._shift_y += distance
+        self._rects_dirty = True
+
+    def reached_bottom(self):
+        """
+        Возвращает живых пришельцев, добравшихся до нижнего края экрана.
+
+        :return: Список спрайтов пришельцев.
+        """
+        bottom = self.y[:self.count] + self.alien_height >= self.ai_settings.screen_height
+        indices = np.flatnonzero(bottom & self.alive[:self.count])
+        return [self.members[index] for index in indices.tolist()]
+
+    def shooters(self):
+        """
+        Возвращает индексы пришельцев, которые могут стрелять: самых нижних
+        живых пришельцев каждой колонки флота.
+
+        Колонки строя задаются при создании флота и не меняются при движении,
+        поэтому результат пересчитывается только при изменении состава флота.
+
+        :return: Массив индексов в массивах флота.
+        """
+        if self._shooters is None:
+            indices = np.flatnonzero(self.alive[:self.count])
+            columns = self.column[indices]
+            # Сортировка по колонке, а внутри колонки - снизу вверх
+            order = np.lexsort((-self.y[indices], columns))
+            sorted_columns = columns[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = sorted_columns[1:] != sorted_columns[:-1]
+            self._shooters = indices[order][first]
+        return self._shooters
+
+    def _build_grid(self):
+        """Раскладывает живых пришельцев по ячейкам сетки столкновений."""
+        self._grid_dirty = False
+        self._shift_x = 0.0
+        self._shift_y = 0.0
+        cell_size = max(self.alien_width, self.alien_height, 1)
+        if self.grid is None or self.grid.cell_size != cell_size:
+            self.grid = SpatialGrid(cell_size)
+        indices = np.flatnonzero(self.alive[:self.count])
+        self.grid.build(self.x[indices].astype(np.int64),
+                        self.y[indices].astype(np.int64), indices)
+
+    def collide_rect(self, rect):
+        """
+        Находит живых пришельцев, пересекающих прямоугольник.
+
+        :param rect: Прямоугольник pygame.Rect.
+        :return: Список спрайтов пришельцев.
+        """
+        if self.count < self.grid_min_aliens:
+            # Небольшой флот дешевле проверить обычным перебором прямоугольников
+            members = self.sprites()
+            return [members[i] for i in rect.collidelistall([m.rect for m in members])]
+
+        width, height = self.alien_width, self.alien_height
+
+        if self._grid_dirty:
+            self._build_grid()
+        # Запрос переводится в координаты построения сетки с запасом в пиксель
+        # на округление; точная проверка ниже идёт по текущим координатам
+        shift_x = int(self._shift_x)
+        shift_y = int(self._shift_y)
+        candidates = self.grid.query(rect.left - shift_x - 1, rect.top - shift_y - 1,
+                                     rect.right - shift_x + 1, rect.bottom - shift_y + 1,
+                                     width, height)
+        if len(candidates) == 0:
+            return []
+        # Целые координаты совпадают с координатами прямоугольников спрайтов
+        xs = self.x[candidates].astype(np.int64)
+        ys = self.y[candidates].astype(np.int64)
+        hit = (self.alive[candidates] &
+               (xs < rect.right) & (xs + width > rect.left) &
+               (ys < rect.bottom) & (ys + height > rect.top))
+        members = self.members
+        found = [members[index] for index in candidates[hit].tolist()]
+        # Прямоугольники синхронизируются с массивами только в sprites(), а
+        # отрисовка атласом их не запрашивает: найденным пришельцам (от них,
+        # например, выпадают бонусы) координаты переносятся здесь
+        for alien, x, y in zip(found, xs[hit].tolist(), ys[hit].tolist()):
+            alien.rect.topleft = (x, y)
+        return found
+
+    def collide_any(self, rect):
+        """
+        Проверяет, пересекает ли прямоугольник хотя бы одного живого пришельца.
+
+        :param rect: Прямоугольник pygame.Rect (например, корабля).
+        :return: True при пересечении.
+        """
+        return bool(self.collide_rect(rect))
+
+    def collide_bullets(self, bullets):
+        """
+        Находит попадания пуль и удаляет сбитых пришельцев и попавшие пули.
+
+        Аналог pygame.sprite.groupcollide(bullets, aliens, True, True), но каждая
+        пуля проверяется только против пришельцев из соседних ячеек сетки.
+        Бронированный пришелец удаляется, когда у него не остаётся попаданий.
+
+        :param bullets: Группа пуль.
+        :return: Словарь {пуля: [сбитые пришельцы]} (только пули, сбившие хотя бы одного).
+        """
+        collisions = {}
+        for bullet in bullets.sprites():
+            hit = self.collide_rect(bullet.rect)
+            if not hit:
+                continue
+            bullet.kill()
+            indices = [alien.fleet_index for alien in hit]
+            self.hp[indices] -= 1
+            destroyed = [alien for alien in hit if self.hp[alien.fleet_index] <= 0]
+            if destroyed:
+                self.remove(*destroyed)
+                collisions[bullet] = destroyed
+        return collisions
@@ -1,15 +1,18 @@
 import sys
 import os
-import time
 import pygame
 import random
 
-from bullet import Bullet
 from alien import Alien
-from bonus import Bonus
-from stats import GameStats
-
-import pickle
+from game_state import GameState
+import assets
+import sounds
+from loop import interpolate_rect
+from atlas import blit_batch
+from profiler import frame_profiler
+import controls
+import viewport
+import waves
 
 # Функция для получения пути к ресурсу
 def resource_path(relative_path):
@@ -22,65 +25,63 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def save_game(stats, filename="savefile.pkl"):
+def save_game(sim, filename="savefile.sav"):
     """
-    Сохраняет данные игры в файл.
+    Сохраняет полное состояние игрового мира в файл.
+
+    Состояние упаковывается сразу, а запись на диск идёт в потоке ввода-вывода
+    (ioworker), поэтому сохранение не задерживает кадр. Сообщение о результате
+    выводится, когда игровой цикл обработает завершение записи.
 
-    :param stats: Объект GameStats, содержащий текущие статистические данные игры.
-    :param filename: Имя файла для сохранения данных (по умолчанию "savefile.pkl").
+    :param sim: Объект Simulation (статистика, корабль, флот, пули и бонусы).
+    :param filename: Имя файла для сохранения данных (по умолчанию "savefile.sav").
     """
-    game_data = stats.to_dict()  # Преобразует данные объекта в словарь
-    with open(filename, "wb") as f:
-        pickle.dump(game_data, f)
-    print("Игра сохранена:", game_data)
+    import snapshot  # Модуль формата сохранения нужен только при сохранении и загрузке
+
+    def on_done(error):
+        if error is None:
+            print("Игра сохранена:", filename)
+        else:
+            print("Не удалось сохранить игру:", error)
+
+    snapshot.save_async(sim, filename, on_done)
 
 # Загрузка игры
-def load_game(stats, filename="savefile.pkl"):
+def load_game(sim, filename="savefile.sav"):
     """
-    Загружает данные игры из файла.
+    Восстанавливает состояние игрового мира из файла.
+
+    Файл читается в потоке ввода-вывода, а мир восстанавливается в главном
+    потоке, когда игровой цикл обработает завершение чтения.
 
-    :param stats: Объект GameStats, в который загружаются данные.
+    :param sim: Объект Simulation, в который загружаются данные.
     :param filename: Имя файла для загрузки данных.
     """
-    try:
-        with open(filename, "rb") as f:
-            game_data = pickle.load(f)
-            stats.from_dict(game_data)  # Заполняем объект данными
+    import snapshot
 
-            # Восстановление настроек игры из статистики
-            stats.ai_settings.ship_speed_factor = stats.ship_speed_factor
-            stats.ai_settings.bullet_speed_factor = stats.bullet_speed_factor
-            stats.ai_settings.alien_speed_factor = stats.alien_speed_factor
-            stats.ai_settings.alien_points = stats.alien_points
+    def on_done(error):
+        if error is None:
+            print("Игра загружена:", filename)
+        elif isinstance(error, FileNotFoundError):
+            print("Сохранение не найдено.")
+        elif isinstance(error, ValueError):
+            print("Сохранение повреждено:", error)
+        else:
+            print("Не удалось загрузить игру:", error)
 
-        print("Игра загружена:", game_data)
-    except FileNotFoundError:
-        print("Сохранение не найдено.")
+    snapshot.load_async(sim, filename, on_done)
 
 
-def check_keydown_events(event, ai_settings, screen, ship, bullets, stats):
+def check_keydown_events(event, ai_settings, stats, inputs):
     """
-    Реагирует на нажатие клавиш.
+    Реагирует на нажатие клавиш по таблице привязок Settings.key_bindings.
 
     :param event: Событие, произошедшее при нажатии клавиши.
     :param ai_settings: Настройки игры.
-    :param screen: Экран, на котором рисуется игра.
-    :param ship: Объект корабля.
-    :param bullets: Группа пуль, выпущенных игроком.
     :param stats: Статистика игры.
+    :param inputs: Объект InputState, в который записываются команды игрока.
     """
-    if event.key == pygame.K_RIGHT:
-        ship.moving_right = True # Переместить корабль вправо
-    elif event.key == pygame.K_LEFT:
-        ship.moving_left = True # Переместить корабль влево
-    elif event.key == pygame.K_SPACE:
-        fire_bullet(ai_settings, screen, ship, bullets)
-    elif event.key == pygame.K_q:
-        sys.exit()
-    elif event.key == pygame.K_s:
-        save_game(stats)  # Сохраняем данные из объекта stats
-    elif event.key == pygame.K_l:
-        load_game(stats)  # Загружаем данные в объект stats
+    controls.get_dispatcher(ai_settings).key_down(event.key, inputs)
 
 def fire_bullet(ai_settings, screen, ship, bullets):
     """
@@ -91,157 +92,148 @@ def fire_bullet(ai_settings, screen, ship, bullets):
     :param ship: Объект корабля.
     :param bullets: Группа пуль, выпущенных игроком.
     """
-    laser_sound = pygame.mixer.Sound(resource_path("sounds/laser.wav"))
-
-    # Создание новой пули и включение её в группу bullets
+    # Создание новой пули (или повторное использование свободной) в пуле bullets
     if len(bullets) < ai_settings.bullet_allowed:
-        new_bullet = Bullet(ai_settings, screen, ship)
-        bullets.add(new_bullet)
-        laser_sound.play()  # Воспроизведение звука выстрела
+        bullets.spawn(ai_settings, screen, ship)
+        sounds.play('laser')  # Воспроизведение звука выстрела
 
-def check_keyup_events(event, ship):
+def check_keyup_events(event, ai_settings, inputs):
     """
-    Реагирует на отпускание клавиш.
+    Реагирует на отпускание клавиш по таблице привязок Settings.key_bindings.
 
     :param event: Событие, произошедшее при отпускании клавиши.
-    :param ship: Объект корабля.
+    :param ai_settings: Настройки игры.
+    :param inputs: Объект InputState с командами игрока.
     """
-    if event.key == pygame.K_RIGHT:
-        ship.moving_right = False
-    elif event.key == pygame.K_LEFT:
-        ship.moving_left = False
+    controls.get_dispatcher(ai_settings).key_up(event.key, inputs)
 
 
-def check_events(ai_settings, screen, stats, play_button, ship, aliens, bullets):
+def check_events(ai_settings, stats, play_button, inputs):
     """
     Обрабатывает нажатия клавиш и события мыши.
 
+    События не изменяют игровой мир напрямую: они переводятся в команды
+    объекта InputState, которые симуляция применяет на ближайшем шаге.
+    Обработчик события выбирается по его типу из таблицы диспетчера ввода.
+
     :param ai_settings: Настройки игры.
-    :param screen: Экран, на котором рисуется игра.
     :param stats: Статистика игры.
     :param play_button: Кнопка для начала игры.
-    :param ship: Объект корабля.
-    :param aliens: Группа пришельцев.
-    :param bullets: Группа пуль.
+    :param inputs: Объект InputState, в который записываются команды игрока.
     """
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            sys.exit()
-        elif event.type == pygame.KEYDOWN:
-            check_keydown_events(event, ai_settings, screen, ship, bullets, stats)
-        elif event.type == pygame.KEYUP:
-            check_keyup_events(event, ship)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            check_play_button(ai_settings, screen, stats, play_button, ship,
-                              aliens, bullets, mouse_x, mouse_y)
+    controls.get_dispatcher(ai_settings).process(pygame.event.get(), stats, play_button, inputs)
 
 
-def check_play_button(ai_settings, screen, stats, play_button, ship, aliens,
-                      bullets, mouse_x, mouse_y):
+def check_play_button(stats, play_button, inputs, mouse_x, mouse_y):
     """
-    Запускает новую игру при нажатии кнопки Play.
+    Запрашивает начало новой игры при нажатии кнопки Play.
 
-    :param ai_settings: Настройки игры.
-    :param screen: Экран, на котором рисуется игра.
     :param stats: Статистика игры.
     :param play_button: Кнопка для начала игры.
+    :param inputs: Объект InputState с командами игрока.
+    :param mouse_x: Координата мыши по оси X.
+    :param mouse_y: Координата мыши по оси Y.
+    """
+    if play_button.rect.collidepoint(mouse_x, mouse_y) and not stats.game_active:
+        inputs.start = True
+
+
+def start_game(ai_settings, screen, stats, ship, aliens, bullets):
+    """
+    Начинает новую игру.
+
+    :param ai_settings: Настройки игры.
+    :param screen: Экран, на котором рисуется игра (None - при симуляции без окна).
+    :param stats: Статистика игры.
     :param ship: Объект корабля.
     :param aliens: Группа пришельцев.
     :param bullets: Группа пуль.
-    :param mouse_x: Координата мыши по оси X.
-    :param mouse_y: Координата мыши по оси Y.
     """
-    if play_button.rect.collidepoint(mouse_x, mouse_y):
-        # сброс игровой статистики
-        stats.reset_stats()
-        stats.game_active = True
+    # сброс игровой статистики
+    stats.reset_stats()
+    stats.state.begin(GameState.PLAYING)
 
-        # Сбросить динамические настройки на начальные значения
-        ai_settings.initialize_dynamic_settings()
+    # Сбросить динамические настройки на начальные значения
+    ai_settings.initialize_dynamic_settings()
 
-        # очистка списков пришельцев и пуль
-        aliens.empty()
-        bullets.empty()
+    # очистка списков пришельцев, пуль и снарядов пришельцев
+    aliens.empty()
+    bullets.empty()
+    aliens.shots.clear()
+    aliens.fire_budget = 0.0
 
-        # создание нового флота и размещение корабля в центре
-        create_fleet(ai_settings, screen, ship, aliens)
-        ship.center_ship()
+    # создание нового флота и размещение корабля в центре
+    create_fleet(ai_settings, screen, ship, aliens, stats.level)
+    ship.center_ship()
 
 
-def update_screen(ai_settings, screen, stats, ship, aliens, bullets, play_button, bonuses):
+def update_screen(ai_settings, screen, stats, sb, ship, aliens, bullets, play_button, bonuses,
+                  alpha=1.0):
     """
     Обновляет изображение на экране и отображает новый экран.
 
     :param ai_settings: Настройки игры.
     :param screen: Экран, на котором рисуется игра.
     :param stats: Статистика игры.
+    :param sb: Объект Scoreboard для вывода счёта.
     :param ship: Объект корабля.
     :param aliens: Группа пришельцев.
     :param bullets: Группа пуль.
     :param play_button: Кнопка для начала игры.
     :param bonuses: Группа бонусов.
+    :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом симуляции.
     """
+    if viewport.active is not None:
+        import renderer
+
+        # Логическое игровое пространство выводится на экран другого размера
+        renderer.get_scaled_renderer(ai_settings, screen, viewport.active).render(
+            stats, sb, ship, aliens, bullets, play_button, bonuses, alpha)
+        return
+
+    if ai_settings.render_mode == 'dirty':
+        import renderer  # Рендерер загружается только в режиме 'dirty'
+
+        # Перерисовываются и выводятся только изменившиеся области экрана
+        renderer.get_dirty_renderer(ai_settings, screen).render(
+            stats, sb, ship, aliens, bullets, play_button, bonuses, alpha)
+        return
+
     # При каждом проходе цикла перерисовывается экран
     screen.fill(ai_settings.bg_color)
 
+    # Каждый слой (пули, пришельцы, бонусы) рисуется одним вызовом blits.
     # Все пули выводятся позади изображений корабля пришельцев
-    for bullet in bullets.sprites():
-        bullet.draw_bullet()
-    ship.blitme()
+    blit_batch(screen, [(bullet.image, interpolate_rect(bullet, alpha))
+                        for bullet in bullets.sprites()])
+    blit_batch(screen, aliens.shots.blit_sequence(alpha))
+    ship.blitme(alpha)
 
     if stats.shield_active:
         # Отрисовка щита вокруг корабля
-        pygame.draw.circle(screen, (0, 255, 0), (ship.rect.centerx, ship.rect.centery), 50, 2)
-
+        pygame.draw.circle(screen, (0, 255, 0), interpolate_rect(ship, alpha).center,
+                           ai_settings.shield_radius, 2)
 
-    aliens.draw(screen)
-    for bonus in bonuses.sprites():
-        bonus.blitme()
+    blit_batch(screen, aliens.blit_sequence(alpha))
+    blit_batch(screen, [(bonus.image, interpolate_rect(bonus, alpha))
+                        for bonus in bonuses.sprites()])
 
     # Кнопка Play отображается в том случае, если игра неактивна
     if not stats.game_active:
         play_button.draw_button()
 
-    # Отрисовка статистики
-    draw_stats(ai_settings, screen, stats)
+    # Отрисовка статистики (надписи перерисовываются только при изменении значений)
+    sb.show_score()
+
+    # Оверлей профилировщика (только когда он включён)
+    frame_profiler.draw(screen)
+    frame_profiler.mark('draw')
 
     # Отображение последнего прорисованного экрана
     pygame.display.flip()
 
 
-def draw_stats(ai_settings, screen, stats):
-    """
-    Отображает статистику (текущий счёт, лучший счёт, уровень, жизни) на экране.
-
-    :param ai_settings: Настройки игры.
-    :param screen: Экран, на котором рисуется игра.
-    :param stats: Статистика игры.
-    """
-    font = pygame.font.SysFont(None, 48)
-
-    # Жизни (Ships Left)
-    lives_text = font.render(f"Корабли: {stats.ships_left}", True, (255, 255, 255))
-    screen.blit(lives_text, (10, 10))
-
-    # Отображаем уровень
-    level_text = font.render(f"Уровень: {stats.level}", True, (255, 255, 255))
-    screen.blit(level_text, (ai_settings.screen_width - level_text.get_width() - 10, 10))  # В правом верхнем углу
-
-    # Текущий счёт (Current Score)
-    score_text = font.render(f"Счёт: {stats.score}", True, (255, 255, 255))
-    score_rect = score_text.get_rect()
-    score_rect.topright = (ai_settings.screen_width - 10, 60)  # В правом верхнем углу
-    screen.blit(score_text, score_rect)
-
-    # Лучший счёт (Best Score)
-    high_score_text = font.render(f"Лучший счёт: {stats.high_score}", True, (255, 255, 255))
-    high_score_rect = high_score_text.get_rect()
-    high_score_rect.midtop = (ai_settings.screen_width // 2, 10)  # По центру сверху
-    screen.blit(high_score_text, high_score_rect)
-
-
-def update_bullets(ai_settings, screen, stats, ship, aliens, bullets, bonuses):
+def update_bullets(ai_settings, screen, stats, ship, aliens, bullets, bonuses, dt=1.0):
     """
     Обновляет позиции пуль и удаляет старые пули.
 
@@ -252,14 +244,13 @@ def update_bullets(ai_settings, screen, stats, ship, aliens, bullets, bonuses):
     :param aliens: Группа пришельцев.
     :param bullets: Группа пуль.
     :param bonuses: Группа бонусов.
+    :param dt: Множитель перемещения за шаг симуляции.
     """
 
-    bullets.update()
+    bullets.update(dt)
 
-    # Удалить пули, вышедшие за пределы экрана
-    for bullet in bullets.copy():
-        if bullet.rect.bottom <= 0:
-            bullets.remove(bullet)
+    # Удалить пули, вышедшие за пределы экрана (они возвращаются в пул)
+    bullets.cull()
 
     # Проверить попадания
     check_bullet_alien_collisions(ai_settings, screen, stats, ship, aliens, bullets, bonuses)
@@ -280,28 +271,22 @@ def check_bullet_alien_collisions(ai_settings, screen, stats, ship, aliens, bull
     :param bullets: Группа пуль.
     :param bonuses: Группа бонусов.
     """
-    explosion_sound = pygame.mixer.Sound(resource_path("sounds/explosion.wav"))
-
-    # Проверка попаданий пуль по инопланетянам
-    collisions = pygame.sprite.groupcollide(bullets, aliens, True, True)
+    # Проверка попаданий пуль по инопланетянам (через сетку столкновений флота)
+    collisions = aliens.collide_bullets(bullets)
 
     if collisions:
-        for aliens in collisions.values():
-            stats.score += ai_settings.alien_points * len(aliens)
+        for hit_aliens in collisions.values():
+            # Очки с учётом множителя типа пришельца (из файла волн)
+            stats.score += ai_settings.alien_points * sum(alien.points for alien in hit_aliens)
             # Воспроизведение звука уничтожения
-            explosion_sound.play()
+            sounds.play('explosion')
 
             # Создать бонус для каждого уничтоженного пришельца
-            for alien in aliens:
-                create_bonus(ai_settings, screen, bonuses, alien)
+            for alien in hit_aliens:
+                create_bonus(ai_settings, screen, bonuses, alien, stats.rng)
 
         check_high_score(stats)
-
-    if not aliens:
-        bullets.empty()
-        ai_settings.increase_speed()  # Увеличение скорости инопланетян и корабля
-        stats.level += 1  # Увеличение уровня
-        create_fleet(ai_settings, screen, ship, aliens) # Создаем новый флот пришельцев
+    # Новый флот после уничтожения текущего создаётся в check_fleet_cleared()
 
 def check_high_score(stats):
     """
@@ -341,42 +326,24 @@ def get_number_rows(ai_settings, ship_height, alien_height):
     return number_rows
 
 
-def create_alien(ai_settings, screen, aliens, alien_number, row_number):
+def create_fleet(ai_settings, screen, ship, aliens, level=1):
     """
-    Создает пришельца и размещает его в соответствующем ряду.
+    Создает флот пришельцев волны уровня, размещая их на экране.
 
-    :param ai_settings: Настройки игры.
-    :param screen: Экран, на котором отображается игра.
-    :param aliens: Группа пришельцев.
-    :param alien_number: Индекс пришельца в ряду.
-    :param row_number: Индекс ряда.
-    """
-    alien = Alien(ai_settings, screen)
-    alien_width = alien.rect.width
-    alien.x = alien_width + 2 * alien_width * alien_number
-    alien.rect.x = alien.x
-    alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number
-    aliens.add(alien)
-
-def create_fleet(ai_settings, screen, ship, aliens):
-    """
-    Создает флот пришельцев, размещая их на экране.
+    Строй волны берётся из файла волн (ai_settings.wave_file); раскладка
+    вычисляется один раз для размера экрана, а затем копируется во флот.
 
     :param ai_settings: Настройки игры.
     :param screen: Экран, на котором отображается игра.
     :param ship: Объект корабля.
-    :param aliens: Группа пришельцев.
+    :param aliens: Флот пришельцев (объект Fleet).
+    :param level: Номер уровня (определяет волну).
     """
-    alien = Alien(ai_settings, screen)
-    number_aliens_x = get_number_aliens_x(ai_settings, alien.rect.width)
-    number_rows = get_number_rows(ai_settings, ship.rect.height,
-                                  alien.rect.height)
-
-    # создание флота пришельцев
-    for row_number in range(number_rows):
-        for alien_number in range(number_aliens_x):
-            create_alien(ai_settings, screen,
-                         aliens, alien_number, row_number)
+    # Размер пришельца берётся из общего изображения, без создания лишнего спрайта
+    alien_size = assets.get_image(Alien.image_path).get_size()
+    book = waves.get_wave_book(ai_settings.wave_file)
+    layout = book.layout(level, ai_settings, alien_size, ship.rect.height)
+    aliens.place(layout, book.images(layout), ai_settings, screen)
 
 
 def check_fleet_edges(ai_settings, aliens):
@@ -384,14 +351,10 @@ def check_fleet_edges(ai_settings, aliens):
     Реагирует на достижение пришельцем края экрана.
 
     :param ai_settings: Настройки игры.
-    :param aliens: Группа пришельцев.
+    :param aliens: Флот пришельцев (объект Fleet).
     """
-
-
-    for alien in aliens.sprites():
-        if alien.check_edges():
-            change_fleet_direction(ai_settings, aliens)
-            break
+    if aliens.check_edges():
+        change_fleet_direction(ai_settings, aliens)
 
 
 def change_fleet_direction(ai_settings, aliens):
@@ -399,14 +362,13 @@ def change_fleet_direction(ai_settings, aliens):
     Меняет направление флота пришельцев и опускает его вниз.
 
     :param ai_settings: Настройки игры.
-    :param aliens: Группа пришельцев.
+    :param aliens: Флот пришельцев (объект Fleet).
     """
-    for alien in aliens.sprites():
-        alien.rect.y += ai_settings.fleet_drop_speed
+    aliens.drop(ai_settings.fleet_drop_speed)
     ai_settings.fleet_direction *= -1
 
 
-def update_aliens(ai_settings, stats, screen, ship, aliens, bullets):
+def update_aliens(ai_settings, stats, screen, ship, aliens, bullets, dt=1.0):
     """
     Обновляет позиции всех пришельцев и проверяет на столкновения с кораблем.
 
@@ -416,23 +378,76 @@ def update_aliens(ai_settings, stats, screen, ship, aliens, bullets):
     :param ship: Объект корабля.
     :param aliens: Группа пришельцев.
     :param bullets: Группа пуль.
+    :param dt: Множитель перемещения за шаг симуляции.
     """
     check_fleet_edges(ai_settings, aliens)
-    aliens.update()
+    aliens.update(dt)
 
     # Проверка времени действия щита
-    if stats.shield_active:
-        current_time = pygame.time.get_ticks()
-        if current_time - stats.shield_timer > ai_settings.shield_duration:
-            stats.shield_active = False  # Отключаем щит
+    stats.is_shield_expired()
 
     # Проверка столкновений "пришелец - корабль"
-    if pygame.sprite.spritecollideany(ship, aliens):
+    if aliens.collide_any(ship.rect):
         ship_hit(ai_settings, stats, screen, ship, aliens, bullets)
 
     # Проверка, добрались ли пришельцы до нижнего края
     check_aliens_bottom(ai_settings, stats, screen, ship, aliens, bullets)
 
+    # Ответный огонь (если корабль не был потерян на этом шаге)
+    if stats.state.is_playing():
+        update_alien_fire(ai_settings, stats, screen, ship, aliens, bullets, dt)
+
+
+def get_alien_fire_rate(ai_settings, level):
+    """
+    Возвращает частоту ответного огня флота для уровня.
+
+    :param ai_settings: Настройки игры.
+    :param level: Номер уровня (с 1).
+    :return: Количество выстрелов флота в секунду.
+    """
+    rates = ai_settings.alien_fire_rates
+    if not rates:
+        return 0
+    return rates[min(level, len(rates)) - 1]
+
+
+def update_alien_fire(ai_settings, stats, screen, ship, aliens, bullets, dt=1.0):
+    """
+    Выпускает снаряды пришельцев, перемещает их и проверяет попадания в корабль и щит.
+
+    Стреляют только нижние пришельцы колонок флота; какой именно - выбирается
+    генератором случайных чисел мира.
+
+    :param ai_settings: Настройки игры.
+    :param stats: Статистика игры.
+    :param screen: Экран, на котором отображается игра.
+    :param ship: Объект корабля.
+    :param aliens: Флот пришельцев (объект Fleet).
+    :param bullets: Группа пуль.
+    :param dt: Множитель перемещения за шаг симуляции.
+    """
+    shots = aliens.shots
+
+    # Частота задана в секундах, dt - в кадрах базовой частоты
+    aliens.fire_budget += get_alien_fire_rate(ai_settings, stats.level) * dt / ai_settings.speed_base_fps
+    if aliens.fire_budget >= 1:
+        shooters = aliens.shooters()
+        while aliens.fire_budget >= 1:
+            aliens.fire_budget -= 1
+            if len(shooters):
+                index = int(shooters[stats.rng.randrange(len(shooters))])
+                shots.spawn(aliens.x[index] + (aliens.alien_width - shots.width) / 2,
+                            aliens.y[index] + aliens.alien_height, ai_settings.alien_bullet_speed)
+
+    shots.update(dt, 0, ai_settings.screen_height)
+
+    # Одна проверка всех снарядов: щит поглощает снаряды, попавшие в его круг
+    center = ship.rect.center if stats.shield_active else None
+    ship_hits, _ = shots.collide(ship.rect, center, ai_settings.shield_radius)
+    if ship_hits:
+        ship_hit(ai_settings, stats, screen, ship, aliens, bullets)
+
 def check_aliens_bottom(ai_settings, stats, screen, ship, aliens, bullets):
     """
     Проверяет, добрались ли пришельцы до нижнего края экрана.
@@ -444,16 +459,16 @@ def check_aliens_bottom(ai_settings, stats, screen, ship, aliens, bullets):
     :param aliens: Группа пришельцев.
     :param bullets: Группа пуль.
     """
-    screen_rect = screen.get_rect()
-    for alien in aliens.sprites():
-        if alien.rect.bottom >= screen_rect.bottom:
-            if stats.shield_active:
-                # Уничтожить пришельца, если щит активен
-                aliens.remove(alien)
-            else:
-                # Обработка столкновения при отсутствии щита
-                ship_hit(ai_settings, stats, screen, ship, aliens, bullets)
-                break
+    reached = aliens.reached_bottom()
+    if not reached:
+        return
+
+    if stats.shield_active:
+        # Уничтожить пришельцев, если щит активен
+        aliens.remove(*reached)
+    else:
+        # Обработка столкновения при отсутствии щита
+        ship_hit(ai_settings, stats, screen, ship, aliens, bullets)
 
 
 def ship_hit(ai_settings, stats, screen, ship, aliens, bullets):
@@ -470,32 +485,29 @@ def ship_hit(ai_settings, stats, screen, ship, aliens, bullets):
     if stats.shield_active:
         return  # Игнорируем столкновение при активном щите
 
-    life_lost_sound = pygame.mixer.Sound(resource_path("sounds/life_lost.wav"))
-    game_over_sound = pygame.mixer.Sound(resource_path("sounds/game_over.wav"))
-
     if stats.ships_left > 0:
         # Уменьшение количества оставшихся кораблей
         stats.ships_left -= 1
 
         # Воспроизведение звука потери жизни
-        life_lost_sound.play()
+        sounds.play('life_lost')
 
-        # Очистка списка пришельцев и пуль
+        # Очистка списка пришельцев, пуль и снарядов пришельцев
         aliens.empty()
         bullets.empty()
+        aliens.shots.clear()
 
         # Создание нового флота и размещение корабля в центре
-        create_fleet(ai_settings, screen, ship, aliens)
+        create_fleet(ai_settings, screen, ship, aliens, stats.level)
         ship.center_ship()
 
-        # Пауза
-        time.sleep(1)
+        # Пауза перед продолжением: цикл продолжает обрабатывать события и рисовать
+        stats.state.begin(GameState.RESPAWNING, ai_settings.respawn_time)
     else:
-        stats.game_active = False
-        pygame.mouse.set_visible(True)
+        stats.state.begin(GameState.GAME_OVER)
 
         # Воспроизведение звука окончания игры
-        game_over_sound.play()
+        sounds.play('game_over')
 
 
 def check_fleet_cleared(ai_settings, stats, screen, ship, aliens, bullets):
@@ -512,8 +524,10 @@ def check_fleet_cleared(ai_settings, stats, screen, ship, aliens, bullets):
     """
     if not aliens:
         bullets.empty() # Очистить оставшиеся пули
+        aliens.shots.clear()  # Снаряды старого флота исчезают вместе с ним
         level_up(stats) # Увеличить уровень через функцию level_up
-        create_fleet(ai_settings, screen, ship, aliens) # Создать новый флот
+        create_fleet(ai_settings, screen, ship, aliens, stats.level) # Создать новый флот
+        stats.state.begin(GameState.LEVEL_TRANSITION, ai_settings.level_transition_time)
 
 def level_up(stats):
     """
@@ -525,7 +539,7 @@ def level_up(stats):
     stats.update_from_settings()  # Обновляем статистику из настроек
     stats.level += 1
 
-def create_bonus(ai_settings, screen, bonuses, alien):
+def create_bonus(ai_settings, screen, bonuses, alien, rng=random):
     """
     Создает бонус с определенной вероятностью, когда инопланетянин уничтожен.
 
@@ -533,12 +547,12 @@ def create_bonus(ai_settings, screen, bonuses, alien):
     :param screen: Экран, на котором отображается игра.
     :param bonuses: Группа бонусов.
     :param alien: Инопланетянин, от которого будет выпасть бонус.
+    :param rng: Генератор случайных чисел (random.Random игры; по умолчанию - модуль random).
     """
     # Вероятность появления бонуса
-    if random.random() < ai_settings.bonus_chance:
-        bonus_type = random.choice(['life', 'shield'])  # Случайный тип бонуса
-        bonus = Bonus(ai_settings, screen, bonus_type, alien.rect.x, alien.rect.y)
-        bonuses.add(bonus)
+    if rng.random() < ai_settings.bonus_chance:
+        bonus_type = rng.choice(['life', 'shield'])  # Случайный тип бонуса
+        bonuses.spawn(ai_settings, screen, bonus_type, alien.rect.x, alien.rect.y)
 
 def check_bonus_collisions(ai_settings, stats, ship, bonuses):
     """
@@ -558,5 +572,4 @@ def check_bonus_collisions(ai_settings, stats, ship, bonuses):
                 stats.ships_left += 1
         elif bonus.bonus_type == 'shield':
             # Включение временного щита
-            stats.shield_active = True
-            stats.shield_timer = pygame.time.get_ticks()  # Засекаем время
+            stats.activate_shield()
@@ -0,0 +1,66 @@
+class GameState:
+    """
+    Конечный автомат состояний игры с таймерами на игровых часах.
+
+    Паузы (возрождение корабля, переход на новый уровень) не блокируют
+    основной цикл: состояние просто запоминает, когда оно закончится, а цикл
+    продолжает обрабатывать события и рисовать кадры.
+    """
+
+    MENU = 'menu'  # Игра ещё не начата, показана кнопка Play
+    PLAYING = 'playing'  # Обычный игровой процесс
+    RESPAWNING = 'respawning'  # Пауза после потери корабля
+    LEVEL_TRANSITION = 'level_transition'  # Пауза перед новым уровнем
+    GAME_OVER = 'game_over'  # Все корабли потеряны
+
+    # Состояния с таймером и состояние, в которое они переходят по его истечении
+    timed_states = {RESPAWNING: PLAYING, LEVEL_TRANSITION: PLAYING}
+
+    def __init__(self, clock):
+        """
+        Инициализирует автомат в состоянии MENU.
+
+        :param clock: Часы игры (объект с методом get_ticks()).
+        """
+        self.clock = clock
+        self.state = self.MENU
+        self.started_at = clock.get_ticks()  # Время входа в текущее состояние (мс)
+        self.duration = 0  # Длительность текущего состояния (мс, 0 - без ограничения)
+
+    def begin(self, state, duration=0):
+        """
+        Переводит игру в новое состояние.
+
+        :param state: Новое состояние (например, GameState.RESPAWNING).
+        :param duration: Длительность состояния в миллисекундах (0 - без ограничения).
+        """
+        self.state = state
+        self.started_at = self.clock.get_ticks()
+        self.duration = duration
+
+    def update(self):
+        """
+        Завершает состояние с истёкшим таймером.
+
+        :return: True, если состояние изменилось.
+        """
+        next_state = self.timed_states.get(self.state)
+        if next_state is not None and self.remaining() == 0:
+            self.begin(next_state)
+            return True
+        return False
+
+    def remaining(self):
+        """Возвращает оставшееся время текущего состояния в миллисекундах."""
+        if not self.duration:
+            return 0
+        elapsed = self.clock.get_ticks() - self.started_at
+        return max(self.duration - elapsed, 0)
+
+    def is_playing(self):
+        """Проверяет, идёт ли обычный игровой процесс (мир обновляется)."""
+        return self.state == self.PLAYING
+
+    def is_active(self):
+        """Проверяет, идёт ли игра (включая паузы возрождения и перехода уровня)."""
+        return self.state not in (self.MENU, self.GAME_OVER)
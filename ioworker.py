@@ -0,0 +1,175 @@
+"""
+Фоновый поток ввода-вывода и счётчики ввода-вывода по потокам.
+
+Чтение и запись файлов (изображения, звуки, сохранения) выполняются в
+отдельном потоке IOWorker. submit() сразу возвращает объект Future
+(concurrent.futures), а обработчики завершения выполняются в главном потоке,
+когда игровой цикл вызывает poll(): так результаты (например, загруженное
+сохранение) применяются к миру между кадрами, без блокировок.
+
+Все операции ввода-вывода игры отмечаются в io_stats.track(); счётчики
+показывают, сколько операций выполнил главный поток и сколько времени они
+заняли, - в игровом цикле их количество должно оставаться нулевым.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+
+class IOStats:
+    """Счётчики операций ввода-вывода в главном и фоновых потоках."""
+
+    def __init__(self):
+        """Инициализирует нулевые счётчики."""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Обнуляет счётчики."""
+        with self._lock:
+            self.main_ops = 0  # Операций в главном потоке
+            self.main_time = 0.0  # Время операций в главном потоке (в секундах)
+            self.background_ops = 0  # Операций в фоновых потоках
+            self.background_time = 0.0
+            self.main_kinds = {}  # Вид операции -> количество в главном потоке
+
+    @contextmanager
+    def track(self, kind):
+        """
+        Отмечает операцию ввода-вывода: её поток и длительность.
+
+        :param kind: Вид операции (например, 'image', 'sound', 'save').
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                if threading.current_thread() is threading.main_thread():
+                    self.main_ops += 1
+                    self.main_time += elapsed
+                    self.main_kinds[kind] = self.main_kinds.get(kind, 0) + 1
+                else:
+                    self.background_ops += 1
+                    self.background_time += elapsed
+
+    def get_stats(self):
+        """
+        Возвращает счётчики ввода-вывода.
+
+        :return: Словарь с количеством и временем (мс) операций главного и фоновых потоков.
+        """
+        with self._lock:
+            return {
+                "main_ops": self.main_ops,
+                "main_time_ms": round(self.main_time * 1000, 3),
+                "main_kinds": dict(self.main_kinds),
+                "background_ops": self.background_ops,
+                "background_time_ms": round(self.background_time * 1000, 3),
+            }
+
+
+# Общие счётчики ввода-вывода игры
+io_stats = IOStats()
+
+
+class IOWorker:
+    """
+    Поток ввода-вывода с очередью операций.
+
+    Операции выполняются по одной в порядке постановки, поэтому, например,
+    загрузка сохранения, запрошенная после записи, прочитает уже записанный файл.
+    """
+
+    def __init__(self, name='io-worker'):
+        """
+        :param name: Имя потока (видно в отладчике и трассах).
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self._completed = queue.SimpleQueue()  # (Future, обработчик) завершённых операций
+        self.pending = 0  # Операций, обработчики которых ещё не выполнены
+
+    def submit(self, fn, *args, on_done=None):
+        """
+        Ставит операцию в очередь потока ввода-вывода.
+
+        :param fn: Функция, выполняемая в фоновом потоке.
+        :param args: Аргументы функции.
+        :param on_done: Функция on_done(future), вызываемая в главном потоке из poll()
+            после завершения операции (результат - future.result()).
+        :return: Объект concurrent.futures.Future.
+        """
+        future = self._executor.submit(fn, *args)
+        self.pending += 1
+        future.add_done_callback(lambda done: self._completed.put((done, on_done)))
+        return future
+
+    def poll(self):
+        """
+        Выполняет обработчики завершённых операций (вызывается игровым циклом каждый кадр).
+
+        :return: Количество обработанных операций.
+        """
+        handled = 0
+        while True:
+            try:
+                future, on_done = self._completed.get_nowait()
+            except queue.Empty:
+                return handled
+            self.pending -= 1
+            handled += 1
+            if on_done is not None:
+                on_done(future)
+
+    def wait(self, timeout=None):
+        """
+        Ждёт завершения всех поставленных операций и выполняет их обработчики.
+
+        Для запуска без игрового цикла (инструменты, проверки); игровой цикл
+        вместо ожидания вызывает poll().
+
+        :param timeout: Максимальное время ожидания (в секундах) или None.
+        :return: True, если все операции завершены.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.pending:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                future, on_done = self._completed.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            self.pending -= 1
+            if on_done is not None:
+                on_done(future)
+        return True
+
+    def shutdown(self, wait=True):
+        """
+        Останавливает поток после выполнения поставленных операций.
+
+        :param wait: Ждать завершения операций.
+        """
+        self._executor.shutdown(wait=wait)
+
+
+# Общий поток ввода-вывода (создаётся при первом обращении)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_worker():
+    """
+    Возвращает общий поток ввода-вывода игры.
+
+    :return: Объект IOWorker.
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = IOWorker()
+    return _worker
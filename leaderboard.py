@@ -0,0 +1,347 @@
+"""
+Постоянная таблица рекордов в базе SQLite.
+
+Результаты хранятся по игрокам и профилям настроек: счёт, набранный при
+других правилах (скорость роста сложности, число кораблей, файл волн и т.п.),
+не сравнивается с остальными. База открывается в режиме WAL, а схема
+содержит индексы по счёту, поэтому лучшие результаты профиля читаются по
+индексу даже после десятков тысяч записей.
+
+Вся работа с базой идёт в отдельном потоке: record() только ставит результат
+в очередь, и поток записывает накопившиеся результаты одной транзакцией.
+Лучшие результаты для меню загружаются тем же потоком при первом обращении
+(top() возвращает последние загруженные значения и никогда не ждёт диска).
+
+Вывод таблицы рекордов:
+    python leaderboard.py
+    python leaderboard.py --profile default --limit 20
+"""
+import hashlib
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+from ioworker import io_stats
+
+LEADERBOARD_FILE = 'scores.db'  # Файл базы по умолчанию
+
+# Настройки, определяющие правила игры: из них строится имя профиля по умолчанию
+PROFILE_SETTINGS = ('screen_width', 'screen_height', 'ship_limit', 'speedup_scale', 'score_scale',
+                    'alien_fire_rates', 'alien_bullet_speed', 'bonus_chance', 'shield_duration',
+                    'sim_fps', 'speed_base_fps', 'wave_file')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    settings TEXT NOT NULL DEFAULT '{}'
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    profile_id INTEGER NOT NULL REFERENCES profiles(id),
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_profile_score ON scores (profile_id, score DESC);
+CREATE INDEX IF NOT EXISTS scores_player_score ON scores (player_id, profile_id, score DESC);
+"""
+
+_TOP_QUERY = """
+SELECT players.name, scores.score, scores.level, scores.played_at
+FROM scores JOIN players ON players.id = scores.player_id
+WHERE scores.profile_id = (SELECT id FROM profiles WHERE name = ?)
+ORDER BY scores.score DESC, scores.id
+LIMIT ?
+"""
+
+
+def profile_settings(ai_settings):
+    """
+    Возвращает значения настроек, определяющих правила игры.
+
+    :param ai_settings: Настройки игры.
+    :return: Словарь {имя настройки: значение}.
+    """
+    return {name: getattr(ai_settings, name) for name in PROFILE_SETTINGS}
+
+
+def profile_name(ai_settings):
+    """
+    Возвращает имя профиля настроек для таблицы рекордов.
+
+    Если профиль не задан явно (Settings.score_profile), имя строится по
+    настройкам правил игры, и результаты при разных правилах попадают в разные профили.
+
+    :param ai_settings: Настройки игры.
+    :return: Имя профиля.
+    """
+    if ai_settings.score_profile:
+        return ai_settings.score_profile
+    encoded = json.dumps(profile_settings(ai_settings), sort_keys=True).encode()
+    return 'auto-' + hashlib.sha1(encoded).hexdigest()[:10]
+
+
+class Leaderboard:
+    """
+    Таблица рекордов с записью и чтением в фоновом потоке.
+
+    Главный поток только обменивается с потоком базы очередью и кэшем
+    результатов: record() и top() не выполняют ввода-вывода.
+    """
+
+    batch_size = 512  # Максимум результатов в одной транзакции
+    batch_delay = 0.05  # Ожидание следующих результатов перед записью (в секундах)
+
+    def __init__(self, filename=LEADERBOARD_FILE):
+        """
+        Запускает поток базы; база и схема создаются в нём же.
+
+        :param filename: Путь к файлу базы SQLite.
+        """
+        self.filename = filename
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._top = {}  # (профиль, количество) -> список (игрок, счёт, уровень, время)
+        self._stale = set()  # Ключи кэша, ожидающие перезагрузки после новых результатов
+        self._loading = set()  # Ключи кэша, загрузка которых уже поставлена в очередь
+        self._profiles = {}  # Имя профиля -> настройки (записываются вместе с первым результатом)
+
+        # Счётчики для контроля затрат
+        self.recorded = 0  # Результатов записано в базу
+        self.batches = 0  # Транзакций записи
+        self.write_time = 0.0  # Суммарное время записи (в секундах)
+        self.read_time = 0.0  # Суммарное время чтения лучших результатов (в секундах)
+        self.error = None  # Последняя ошибка базы (None - ошибок не было)
+
+        self._thread = threading.Thread(target=self._run, name='leaderboard', daemon=True)
+        self._thread.start()
+
+    def record(self, player, profile, score, level, settings=None):
+        """
+        Ставит результат игры в очередь на запись.
+
+        :param player: Имя игрока.
+        :param profile: Имя профиля настроек.
+        :param score: Счёт.
+        :param level: Достигнутый уровень.
+        :param settings: Настройки профиля (словарь, сохраняется при первом результате профиля).
+        """
+        if settings is not None:
+            self._profiles.setdefault(profile, settings)
+        with self._lock:
+            # Загрузка, уже стоящая в очереди, может прочитать таблицу до этого
+            # результата, поэтому её ключ тоже помечается для перезагрузки
+            self._stale.update(key for key in (*self._top, *self._loading) if key[0] == profile)
+        self._queue.put(('record', (player, profile, int(score), int(level), time.time())))
+
+    def top(self, profile, limit=10):
+        """
+        Возвращает лучшие результаты профиля, не обращаясь к диску.
+
+        При первом обращении (и после новых результатов профиля) загрузка
+        ставится в очередь потока базы, а до её завершения возвращаются
+        прежние значения (при первом обращении - пустой список).
+
+        :param profile: Имя профиля настроек.
+        :param limit: Количество результатов.
+        :return: Список кортежей (игрок, счёт, уровень, время unix).
+        """
+        key = (profile, limit)
+        with self._lock:
+            entries = self._top.get(key)
+            if (entries is None or key in self._stale) and key not in self._loading:
+                self._loading.add(key)
+                self._stale.discard(key)
+                self._queue.put(('top', key))
+        return entries if entries is not None else []
+
+    def flush(self):
+        """Ждёт, пока поток базы выполнит все поставленные в очередь операции."""
+        self._queue.join()
+
+    def close(self, timeout=2.0):
+        """
+        Записывает оставшиеся результаты и останавливает поток базы.
+
+        :param timeout: Максимальное время ожидания (в секундах).
+        """
+        if self._thread.is_alive():
+            self._queue.put(('close', None))
+            self._thread.join(timeout)
+
+    def get_stats(self):
+        """
+        Возвращает счётчики работы с базой.
+
+        :return: Словарь с количеством записанных результатов, транзакций и временем записи и чтения (мс).
+        """
+        return {
+            "recorded": self.recorded,
+            "batches": self.batches,
+            "queued": self._queue.qsize(),
+            "write_time_ms": round(self.write_time * 1000, 3),
+            "read_time_ms": round(self.read_time * 1000, 3),
+        }
+
+    def _run(self):
+        """Цикл потока базы: пакетная запись результатов и загрузка лучших результатов."""
+        connection = None
+        try:
+            connection = sqlite3.connect(self.filename)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+        except sqlite3.Error as e:
+            # Без базы поток продолжает разбирать очередь, чтобы flush() и close() не зависали
+            if connection is not None:
+                connection.close()
+                connection = None
+            self._fail(e)
+        player_ids = {}  # Кэш идентификаторов игроков и профилей
+        profile_ids = {}
+
+        pending = None  # Операция, полученная при сборе пакета и ещё не выполненная
+        while True:
+            task, pending = pending or self._queue.get(), None
+            kind, value = task
+            if kind == 'close':
+                if connection is not None:
+                    connection.close()
+                self._queue.task_done()
+                return
+            if kind == 'top':
+                if connection is not None:
+                    self._load_top(connection, value)
+                self._queue.task_done()
+                continue
+
+            # Результаты, пришедшие следом, записываются той же транзакцией
+            batch = [value]
+            while len(batch) < self.batch_size:
+                try:
+                    task = self._queue.get(timeout=self.batch_delay)
+                except queue.Empty:
+                    break
+                if task[0] != 'record':
+                    pending = task
+                    break
+                batch.append(task[1])
+            if connection is not None:
+                self._write(connection, batch, player_ids, profile_ids)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, connection, batch, player_ids, profile_ids):
+        """Записывает пакет результатов одной транзакцией."""
+        start = time.perf_counter()
+        try:
+            with io_stats.track('scores'), connection:
+                rows = []
+                for player, profile, score, level, played_at in batch:
+                    rows.append((self._row_id(connection, player_ids, 'players', player),
+                                 self._row_id(connection, profile_ids, 'profiles', profile),
+                                 score, level, played_at))
+                connection.executemany(
+                    'INSERT INTO scores (player_id, profile_id, score, level, played_at) '
+                    'VALUES (?, ?, ?, ?, ?)', rows)
+        except sqlite3.Error as e:
+            # Идентификаторы из откатанной транзакции могли не сохраниться
+            player_ids.clear()
+            profile_ids.clear()
+            self._fail(e)
+            return
+        self.recorded += len(batch)
+        self.batches += 1
+        self.write_time += time.perf_counter() - start
+
+    def _row_id(self, connection, cache, table, name):
+        """Возвращает идентификатор игрока или профиля, добавляя его при необходимости."""
+        row_id = cache.get(name)
+        if row_id is None:
+            if table == 'profiles':
+                settings = json.dumps(self._profiles.get(name, {}), sort_keys=True)
+                connection.execute('INSERT OR IGNORE INTO profiles (name, settings) VALUES (?, ?)',
+                                   (name, settings))
+            else:
+                connection.execute('INSERT OR IGNORE INTO players (name) VALUES (?)', (name,))
+            row_id, = connection.execute(f'SELECT id FROM {table} WHERE name = ?', (name,)).fetchone()
+            cache[name] = row_id
+        return row_id
+
+    def _load_top(self, connection, key):
+        """Загружает лучшие результаты профиля в кэш."""
+        start = time.perf_counter()
+        try:
+            with io_stats.track('scores'):
+                entries = connection.execute(_TOP_QUERY, key).fetchall()
+        except sqlite3.Error as e:
+            self._fail(e)
+            entries = []
+        self.read_time += time.perf_counter() - start
+        with self._lock:
+            self._top[key] = entries
+            self._loading.discard(key)
+
+    def _fail(self, error):
+        """Запоминает ошибку базы и сообщает о ней (игра продолжается без таблицы рекордов)."""
+        if self.error is None:
+            print("Ошибка таблицы рекордов:", error)
+        self.error = error
+
+
+# Таблицы рекордов, открытые для файлов баз
+_leaderboards = {}
+
+
+def get_leaderboard(filename=LEADERBOARD_FILE):
+    """
+    Возвращает таблицу рекордов для файла базы, открывая её при первом обращении.
+
+    :param filename: Путь к файлу базы SQLite.
+    :return: Объект Leaderboard.
+    """
+    board = _leaderboards.get(filename)
+    if board is None:
+        board = Leaderboard(filename)
+        _leaderboards[filename] = board
+    return board
+
+
+def main(argv=None):
+    """Точка входа командной строки: вывод лучших результатов профиля."""
+    import argparse  # Нужен только при выводе таблицы, не при запуске игры
+
+    from settings import Settings
+
+    parser = argparse.ArgumentParser(description="Таблица рекордов игры.")
+    parser.add_argument('--file', default=LEADERBOARD_FILE, help="Файл базы SQLite.")
+    parser.add_argument('--profile', help="Профиль настроек (по умолчанию - профиль текущих настроек).")
+    parser.add_argument('--limit', type=int, default=10, help="Количество результатов.")
+    args = parser.parse_args(argv)
+
+    profile = args.profile or profile_name(Settings())
+    board = Leaderboard(args.file)
+    board.top(profile, args.limit)
+    board.flush()
+    entries = board.top(profile, args.limit)
+    board.close()
+    print(f"Профиль: {profile}")
+    if not entries:
+        print("Результатов нет.")
+    for place, (player, score, level, played_at) in enumerate(entries, 1):
+        date = time.strftime('%Y-%m-%d %H:%M', time.localtime(played_at))
+        print(f"{place:>3}. {player:<20}{score:>10}  уровень {level:<4}{date}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
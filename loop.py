@@ -0,0 +1,100 @@
+import pygame
+
+from profiler import frame_profiler
+
+
+class GameLoop:
+    """
+    Игровой цикл с фиксированным шагом симуляции.
+
+    Симуляция продвигается шагами постоянной длительности (Settings.sim_fps),
+    а отрисовка ограничивается частотой Settings.max_fps. Остаток времени между
+    шагами передаётся в отрисовку как коэффициент интерполяции alpha.
+    """
+
+    def __init__(self, ai_settings):
+        """
+        Инициализирует параметры цикла из настроек игры.
+
+        :param ai_settings: Настройки игры (частоты симуляции и отрисовки).
+        """
+        self.ai_settings = ai_settings
+        self.clock = pygame.time.Clock()
+
+        # Длительность одного шага симуляции (в миллисекундах)
+        self.step_ms = 1000.0 / ai_settings.sim_fps
+        # Множитель перемещения за один шаг: скорости в настройках заданы
+        # в пикселях за кадр при частоте speed_base_fps
+        self.dt = self.step_ms / 1000.0 * ai_settings.speed_base_fps
+
+        self.accumulator = 0.0  # Накопленное, но ещё не просимулированное время
+        self.running = False
+
+    def run(self, handle_events, update, render):
+        """
+        Запускает цикл до вызова stop().
+
+        :param handle_events: Функция без аргументов для обработки событий.
+        :param update: Функция update(dt), продвигающая симуляцию на один шаг.
+        :param render: Функция render(alpha), отрисовывающая кадр.
+        """
+        self.running = True
+        while self.running:
+            self.tick(handle_events, update, render)
+
+    def tick(self, handle_events, update, render):
+        """
+        Выполняет один кадр: ожидание, обработку событий, шаги симуляции и отрисовку.
+
+        :return: Количество выполненных шагов симуляции.
+        """
+        frame_profiler.begin_frame()
+
+        # Ожидание до следующего кадра (ограничение частоты отрисовки)
+        frame_ms = self.clock.tick(self.ai_settings.max_fps)
+        frame_profiler.mark('idle')
+        # Ограничение длительности кадра защищает от "спирали смерти" после зависаний
+        self.accumulator += min(frame_ms, self.ai_settings.max_frame_time)
+
+        handle_events()
+        frame_profiler.mark('events')
+
+        steps = 0
+        while (self.accumulator >= self.step_ms and
+               steps < self.ai_settings.max_steps_per_frame):
+            update(self.dt)
+            self.accumulator -= self.step_ms
+            steps += 1
+        if steps == self.ai_settings.max_steps_per_frame:
+            # Отбрасываем невыполнимый остаток, чтобы не копить отставание
+            self.accumulator = min(self.accumulator, self.step_ms)
+
+        alpha = self.accumulator / self.step_ms if self.ai_settings.interpolate else 1.0
+        render(min(alpha, 1.0))
+        frame_profiler.mark('flip')  # Вывод кадра на экран (после отметки 'draw')
+        return steps
+
+    def stop(self):
+        """Останавливает цикл после текущего кадра."""
+        self.running = False
+
+    def get_fps(self):
+        """Возвращает среднюю частоту кадров отрисовки."""
+        return self.clock.get_fps()
+
+
+def interpolate_rect(sprite, alpha):
+    """
+    Возвращает прямоугольник спрайта между предыдущим и текущим шагом симуляции.
+
+    :param sprite: Спрайт с атрибутами rect и prev_pos (позиция на предыдущем шаге или None).
+    :param alpha: Доля шага от 0 до 1, прошедшая после последнего шага симуляции.
+    :return: Прямоугольник для отрисовки.
+    """
+    prev_pos = sprite.prev_pos
+    if prev_pos is None or alpha >= 1.0:
+        return sprite.rect
+    rect = sprite.rect.copy()
+    rect.x = round(prev_pos[0] + (rect.x - prev_pos[0]) * alpha)
+    rect.y = round(prev_pos[1] + (rect.y - prev_pos[1]) * alpha)
+    return rect
@@ -1,11 +1,44 @@
+import time
+
+# Момент запуска программы для отчёта о времени до первого кадра
+start_time = time.perf_counter()
+
+import atexit
+
 import pygame
-from pygame.sprite import Group
 
 from settings import Settings
-from stats import GameStats
 from button import Button
-from ship import Ship
+from scoreboard import Scoreboard
 import functions as gf
+import assets
+import sounds
+import controls
+import viewport
+from loop import GameLoop
+from clock import SimClock
+from simulation import Simulation, InputState
+from game_state import GameState
+from profiler import frame_profiler
+from ioworker import io_stats, get_worker
+from ship import Ship
+from alien import Alien
+from bonus import Bonus
+
+
+def load_assets(ai_settings, worker):
+    """
+    Ставит загрузку изображений и звуков игры в очередь потока ввода-вывода.
+
+    Главный поток не ждёт загрузки: спрайты сразу получают заглушки
+    изображений, а звуки начинают звучать, как только банк звуков загружен.
+
+    :param ai_settings: Настройки игры (пути к звукам и параметры микшера).
+    :param worker: Поток ввода-вывода (ioworker.IOWorker).
+    """
+    assets.registry.use_worker(worker)
+    assets.registry.request([Ship.image_path, Alien.image_path, *Bonus.image_paths.values()])
+    worker.submit(sounds.bank.load, ai_settings)
 
 
 def run_game():
@@ -18,41 +51,105 @@ def run_game():
 
     # Настройки игры
     ai_settings = Settings()
-    screen = pygame.display.set_mode((ai_settings.screen_width,
-                                      ai_settings.screen_height))
+    # Окно создаётся в режиме Settings.display_mode; игра считает в логических
+    # координатах screen_width x screen_height при любом размере окна
+    screen = viewport.create_screen(ai_settings)
     pygame.display.set_caption("Инопланетное Вторжение")
 
+    # Изображения и звуки (из пакета ресурсов) загружаются в потоке ввода-вывода,
+    # а игра сразу показывает первый кадр с заглушками изображений
+    worker = get_worker()
+    load_assets(ai_settings, worker)
+    atexit.register(worker.shutdown)
+
+    # Обработка ввода по таблице привязок клавиш; в очередь событий попадают
+    # только обрабатываемые типы (без движения мыши и т.п.)
+    controls.get_dispatcher(ai_settings).install()
+
     # создание кнопки Play
     play_button = Button(ai_settings, screen, "Играть")
 
-    # создание экземпляра для хранения игровой статистики
-    stats = GameStats(ai_settings)
+    # создание игрового мира: корабль, пули, пришельцы, бонусы и статистика.
+    # Время мира идёт шагами симуляции, случайность - из генератора с известным зерном
+    sim = Simulation(ai_settings, screen, SimClock(), ai_settings.random_seed)
+    stats = sim.stats
+
+    # таблица рекордов: база открывается и пишется в фоновом потоке, а лучшие
+    # результаты загружаются при первом показе меню
+    board = profile = None
+    if ai_settings.leaderboard_file:
+        import leaderboard  # Модуль таблицы рекордов нужен только при включённой таблице
+
+        board = leaderboard.get_leaderboard(ai_settings.leaderboard_file)
+        profile = leaderboard.profile_name(ai_settings)
+        profile_settings = leaderboard.profile_settings(ai_settings)
+        atexit.register(board.close)
+
+    # создание панели вывода счёта
+    sb = Scoreboard(ai_settings, screen, stats, board, profile)
+
+    # команды игрока, применяемые на ближайшем шаге симуляции
+    inputs = InputState()
+
+    # запись сеанса (зерно и команды на каждом шаге) для воспроизведения в replay.py
+    recorder = None
+    if ai_settings.record_file:
+        from replay import Recorder  # Модуль записи нужен только при включённой записи
 
-    # создание корабля, группы пуль и группы пришельцев
-    ship = Ship(ai_settings, screen)
-    bullets = Group()
-    aliens = Group()
-    bonuses = Group()
+        recorder = Recorder(ai_settings.record_file, sim.seed, ai_settings)
+        atexit.register(recorder.close, stats)
 
-    # создание флота пришельцев
-    gf.create_fleet(ai_settings, screen, ship, aliens)
+    # Отчёт о времени запуска; далее счётчики ввода-вывода главного потока
+    # считают только игровой цикл (в нём операций быть не должно)
+    ready_ms = (time.perf_counter() - start_time) * 1000
+    startup_io = io_stats.get_stats()
+    print(f"Игра готова: {ready_ms:.0f} мс, ввод-вывод главного потока при запуске: "
+          f"{startup_io['main_ops']} операций, {startup_io['main_time_ms']:.0f} мс")
+    io_stats.reset()
+    first_frame = True
+    atlas_built = False
 
-    # запуск основного цикла игры
-    while True:
-        gf.check_events(ai_settings, screen, stats, play_button,
-                        ship, aliens, bullets)
+    def handle_events():
+        """Применяет результаты фонового ввода-вывода и переводит события в команды игрока."""
+        nonlocal atlas_built
+        worker.poll()
+        if not atlas_built and not worker.pending:
+            # Все изображения загружены: приводим их к формату экрана (только в
+            # главном потоке) и собираем в текстурный атлас
+            assets.registry.convert_all()
+            assets.registry.build_atlas()
+            atlas_built = True
+        gf.check_events(ai_settings, stats, play_button, inputs)
 
-        if stats.game_active:
-            ship.update()
-            gf.update_bullets(ai_settings, screen, stats, ship, aliens, bullets, bonuses)
-            gf.update_aliens(ai_settings, stats, screen, ship, aliens, bullets)
-            gf.check_bonus_collisions(ai_settings, stats, ship, bonuses)
-            bonuses.update()  # Обновление бонусов
+    def update(dt):
+        """Продвигает симуляцию на один фиксированный шаг."""
+        if recorder is not None:
+            recorder.record(inputs)
+        was_over = stats.state.state == GameState.GAME_OVER
+        sim.step(inputs)
+        if board is not None and not was_over and stats.state.state == GameState.GAME_OVER:
+            # Результат законченной игры ставится в очередь записи таблицы рекордов
+            board.record(ai_settings.player_name, profile, stats.score, stats.level, profile_settings)
 
-            # Проверка истечения времени действия щита
-            stats.is_shield_expired()
+    def render(alpha):
+        """Отрисовывает кадр с интерполяцией позиций."""
+        nonlocal first_frame
+        if frame_profiler.enabled:
+            frame_profiler.counts = {
+                "aliens": len(sim.aliens),
+                "bullets": len(sim.bullets),
+                "bonuses": len(sim.bonuses),
+                "main_io": io_stats.main_ops,
+            }
+        gf.update_screen(ai_settings, screen, stats, sb, sim.ship, sim.aliens, sim.bullets,
+                         play_button, sim.bonuses, alpha)
+        if first_frame:
+            print(f"Первый кадр: {(time.perf_counter() - start_time) * 1000:.0f} мс")
+            first_frame = False
 
-        gf.update_screen(ai_settings, screen, stats, ship, aliens, bullets, play_button, bonuses)
+    # запуск основного цикла игры с фиксированным шагом симуляции
+    game_loop = GameLoop(ai_settings)
+    game_loop.run(handle_events, update, render)
 
 
 run_game()
\ No newline at end of file
@@ -0,0 +1,70 @@
+from sprites import CompactGroup
+
+
+class SpritePool(CompactGroup):
+    """
+    Группа спрайтов с повторным использованием экземпляров.
+
+    Спрайт, удалённый из группы (попадание, выход за экран, очистка группы),
+    не выбрасывается, а попадает в список свободных экземпляров и при
+    следующем spawn() переинициализируется методом reset(). Поэтому при долгой
+    игре число созданных объектов и затраты на кадр остаются постоянными.
+    """
+
+    def __init__(self, factory):
+        """
+        Инициализирует пустой пул.
+
+        :param factory: Класс спрайта; его конструктор и метод reset() принимают одинаковые аргументы.
+        """
+        super().__init__()
+        self.factory = factory
+        self._free = []  # Свободные экземпляры для повторного использования
+
+        # Счётчики пула
+        self.created = 0  # Создано новых экземпляров
+        self.reused = 0  # Выдано экземпляров из списка свободных
+        self.culled = 0  # Удалено спрайтов, вышедших за пределы экрана
+
+    def spawn(self, *args):
+        """
+        Добавляет в группу спрайт, по возможности используя свободный экземпляр.
+
+        :param args: Аргументы конструктора / метода reset() спрайта.
+        :return: Добавленный спрайт.
+        """
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args)
+            self.reused += 1
+        else:
+            sprite = self.factory(*args)
+            self.created += 1
+        self.add(sprite)
+        return sprite
+
+    def remove_internal(self, sprite):
+        """Удаляет спрайт из группы и возвращает его в список свободных."""
+        super().remove_internal(sprite)
+        self._free.append(sprite)
+
+    def cull(self):
+        """Удаляет спрайты, вышедшие за пределы экрана (метод is_offscreen() спрайта)."""
+        offscreen = [sprite for sprite in self.spritedict if sprite.is_offscreen()]
+        if offscreen:
+            self.remove(*offscreen)
+            self.culled += len(offscreen)
+
+    def get_counts(self):
+        """
+        Возвращает счётчики пула.
+
+        :return: Словарь с количеством активных, свободных и созданных экземпляров.
+        """
+        return {
+            "live": len(self.spritedict),
+            "pooled": len(self._free),
+            "created": self.created,
+            "reused": self.reused,
+            "culled": self.culled,
+        }
@@ -0,0 +1,227 @@
+import gc
+import time
+from collections import deque
+
+import pygame
+
+from ioworker import io_stats, get_worker
+
+
+class FrameProfiler:
+    """
+    Профилировщик кадра: замеры фаз основного цикла, оверлей и трасса.
+
+    Фазы отмечаются вызовами mark(): время с предыдущей отметки приписывается
+    указанной фазе. Пока профилировщик выключен, begin_frame() и mark()
+    сразу возвращаются, поэтому накладные расходы почти нулевые.
+    """
+
+    overlay_interval = 0.25  # Период обновления текста оверлея (в секундах)
+    overlay_color = (255, 255, 0)  # Цвет текста оверлея
+    overlay_bg_color = (0, 0, 0)  # Цвет фона оверлея
+
+    def __init__(self, window=300, max_trace_events=200000):
+        """
+        Инициализирует выключенный профилировщик.
+
+        :param window: Количество последних кадров для скользящей статистики.
+        :param max_trace_events: Максимум хранимых событий трассы.
+        """
+        self.enabled = False
+        self.frame_times = deque(maxlen=window)  # Длительности кадров (с)
+        self.phase_times = {}  # Фаза -> deque длительностей за кадр (с)
+        self.gc_pauses = deque(maxlen=window)  # Длительности пауз сборщика мусора (с)
+        self.trace = deque(maxlen=max_trace_events)  # (имя, начало, длительность)
+        self.counts = {}  # Количество спрайтов для оверлея
+
+        self._window = window
+        self._frame_start = None
+        self._last = 0.0
+        self._current = {}  # Фаза -> накопленное время в текущем кадре
+        self._gc_start = None
+
+        self.font = None
+        self._overlay = None
+        self._overlay_time = 0.0
+
+    def toggle(self):
+        """Включает или выключает профилировщик."""
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+
+    def enable(self):
+        """Включает замеры, оверлей и отслеживание пауз сборщика мусора."""
+        if self.enabled:
+            return
+        self.enabled = True
+        # Каждый сеанс профилирования начинается с чистой статистики
+        self.frame_times.clear()
+        self.phase_times.clear()
+        self.gc_pauses.clear()
+        self.trace.clear()
+        self._frame_start = None
+        self._overlay = None
+        gc.callbacks.append(self._on_gc)
+
+    def disable(self):
+        """Выключает профилировщик."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def begin_frame(self):
+        """Отмечает начало нового кадра и сохраняет замеры предыдущего."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_times.append(now - self._frame_start)
+            self.trace.append(('frame', self._frame_start, now - self._frame_start))
+            for name, duration in self._current.items():
+                times = self.phase_times.get(name)
+                if times is None:
+                    times = self.phase_times[name] = deque(maxlen=self._window)
+                times.append(duration)
+        self._frame_start = now
+        self._last = now
+        self._current = {}
+
+    def mark(self, name):
+        """
+        Приписывает время с предыдущей отметки фазе name.
+
+        :param name: Имя фазы (например, 'events' или 'flip').
+        """
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        start = self._last
+        self._current[name] = self._current.get(name, 0.0) + now - start
+        self._last = now
+        self.trace.append((name, start, now - start))
+
+    def _on_gc(self, phase, info):
+        """Обработчик gc.callbacks: замеряет паузы сборщика мусора."""
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            duration = time.perf_counter() - self._gc_start
+            self.gc_pauses.append(duration)
+            self.trace.append(('gc', self._gc_start, duration))
+            self._gc_start = None
+
+    def get_report(self):
+        """
+        Возвращает скользящую статистику.
+
+        :return: Словарь с FPS, временем кадра 1% худших, временем фаз (мс), паузами GC и счётчиками.
+        """
+        frames = sorted(self.frame_times)
+        fps = len(frames) / sum(frames) if frames and sum(frames) > 0 else 0.0
+        low_1pct = frames[min(int(len(frames) * 0.99), len(frames) - 1)] * 1000 if frames else 0.0
+        phases = {name: sum(times) / len(times) * 1000
+                  for name, times in self.phase_times.items() if times}
+        return {
+            "fps": fps,
+            "low_1pct_ms": low_1pct,
+            "phases_ms": phases,
+            "gc_pauses": len(self.gc_pauses),
+            "gc_max_ms": max(self.gc_pauses) * 1000 if self.gc_pauses else 0.0,
+            "counts": dict(self.counts),
+        }
+
+    def get_overlay(self):
+        """
+        Возвращает изображение оверлея, перерисовывая его не чаще overlay_interval.
+
+        :return: Кортеж (изображение, прямоугольник) или None, если профилировщик выключен.
+        """
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time >= self.overlay_interval:
+            self._overlay = self._render_overlay()
+            self._overlay_time = now
+        return self._overlay
+
+    def _render_overlay(self):
+        """Отрисовывает текст оверлея на отдельной поверхности."""
+        if self.font is None:
+            self.font = pygame.font.SysFont(None, 24)
+        report = self.get_report()
+        lines = ["FPS: {:.1f}   1% low: {:.2f} мс".format(report["fps"], report["low_1pct_ms"])]
+        for name, ms in report["phases_ms"].items():
+            lines.append("{}: {:.3f} мс".format(name, ms))
+        if report["counts"]:
+            lines.append("  ".join("{}: {}".format(name, count)
+                                   for name, count in report["counts"].items()))
+        lines.append("GC: {} пауз, макс. {:.2f} мс".format(report["gc_pauses"], report["gc_max_ms"]))
+
+        images = [self.font.render(line, True, self.overlay_color) for line in lines]
+        width = max(image.get_width() for image in images) + 10
+        height = sum(image.get_height() for image in images) + 10
+        overlay = pygame.Surface((width, height))
+        overlay.fill(self.overlay_bg_color)
+        y = 5
+        for image in images:
+            overlay.blit(image, (5, y))
+            y += image.get_height()
+        return overlay, overlay.get_rect(bottomleft=(10, pygame.display.get_surface().get_height() - 10))
+
+    def draw(self, screen):
+        """Рисует оверлей на экране, если профилировщик включён."""
+        overlay = self.get_overlay()
+        if overlay is not None:
+            screen.blit(*overlay)
+
+    def dump_trace(self, filename):
+        """
+        Сохраняет накопленную трассу в формате Chrome Trace Event (chrome://tracing, Perfetto).
+
+        :param filename: Имя файла трассы.
+        """
+        self._write_trace(filename, list(self.trace))
+        print("Трасса сохранена:", filename)
+
+    def dump_trace_async(self, filename):
+        """
+        Снимает копию трассы и сохраняет её в потоке ввода-вывода (во время игры).
+
+        Сообщение о результате выводится, когда игровой цикл обработает завершение записи.
+
+        :param filename: Имя файла трассы.
+        :return: Объект Future операции записи.
+        """
+        def done(future):
+            error = future.exception()
+            if error is None:
+                print("Трасса сохранена:", filename)
+            else:
+                print("Не удалось сохранить трассу:", error)
+
+        return get_worker().submit(self._write_trace, filename, list(self.trace), on_done=done)
+
+    @staticmethod
+    def _write_trace(filename, events):
+        """Записывает события трассы в файл в формате Chrome Trace Event."""
+        import json  # Нужен только при сохранении трассы
+
+        origin = events[0][1] if events else 0.0
+        trace_events = [{
+            "name": name,
+            "ph": "X",
+            "ts": round((start - origin) * 1e6, 3),
+            "dur": round(duration * 1e6, 3),
+            "pid": 1,
+            "tid": 2 if name == 'frame' else 1,
+        } for name, start, duration in events]
+        with io_stats.track('trace'), open(filename, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+
+# Общий профилировщик кадра
+frame_profiler = FrameProfiler()
@@ -0,0 +1,154 @@
+import numpy as np
+
+import assets
+
+
+class ProjectileArray:
+    """
+    Снаряды одинакового размера в массивах NumPy.
+
+    Позиции и скорости всех снарядов хранятся плотно (первые count ячеек
+    массивов), поэтому движение, удаление вылетевших за экран снарядов и
+    проверка попаданий выполняются одной векторной операцией независимо от
+    количества снарядов. Спрайты для снарядов не создаются: отрисовка идёт
+    одним общим изображением по массивам (blit_sequence()).
+    """
+
+    initial_capacity = 64  # Начальный размер массивов
+
+    def __init__(self, size, color, limit=1000):
+        """
+        Инициализирует пустой набор снарядов.
+
+        :param size: Размер снаряда (ширина, высота).
+        :param color: Цвет снаряда.
+        :param limit: Максимальное количество снарядов одновременно.
+        """
+        self.width, self.height = size
+        self.color = color
+        self.limit = limit
+
+        self.count = 0  # Количество снарядов (занятых ячеек массивов)
+        self.x = np.zeros(self.initial_capacity)  # Левая граница снаряда
+        self.y = np.zeros(self.initial_capacity)  # Верхняя граница снаряда
+        self.prev_x = np.zeros(self.initial_capacity)  # Позиция на предыдущем шаге
+        self.prev_y = np.zeros(self.initial_capacity)
+        self.speed = np.zeros(self.initial_capacity)  # Скорость по вертикали (пикселей за кадр)
+
+        self._image = None  # Общее изображение снаряда (создаётся при первой отрисовке)
+
+    def __len__(self):
+        """Возвращает количество снарядов."""
+        return self.count
+
+    def spawn(self, x, y, speed):
+        """
+        Добавляет снаряд.
+
+        :param x: Левая граница снаряда.
+        :param y: Верхняя граница снаряда.
+        :param speed: Скорость по вертикали (положительная - вниз).
+        :return: True, если снаряд добавлен (False - достигнут лимит).
+        """
+        if self.count >= self.limit:
+            return False
+        if self.count == len(self.x):
+            self._grow()
+        index = self.count
+        self.count += 1
+        self.x[index] = self.prev_x[index] = x
+        self.y[index] = self.prev_y[index] = y
+        self.speed[index] = speed
+        return True
+
+    def _grow(self):
+        """Увеличивает размер массивов вдвое."""
+        for name in ('x', 'y', 'prev_x', 'prev_y', 'speed'):
+            array = getattr(self, name)
+            grown = np.zeros(len(array) * 2, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def _keep(self, mask):
+        """Оставляет только снаряды, отмеченные в маске, сохраняя плотное хранение."""
+        kept = int(mask.sum())
+        if kept == self.count:
+            return
+        for array in (self.x, self.y, self.prev_x, self.prev_y, self.speed):
+            array[:kept] = array[:self.count][mask]
+        self.count = kept
+
+    def clear(self):
+        """Удаляет все снаряды."""
+        self.count = 0
+
+    def update(self, dt, top, bottom):
+        """
+        Перемещает все снаряды и удаляет вылетевшие за пределы экрана.
+
+        :param dt: Множитель перемещения за прошедшее время (1.0 - один кадр базовой частоты).
+        :param top: Верхняя граница экрана.
+        :param bottom: Нижняя граница экрана.
+        """
+        count = self.count
+        if not count:
+            return
+        self.prev_x[:count] = self.x[:count]
+        self.prev_y[:count] = self.y[:count]
+        self.y[:count] += self.speed[:count] * dt
+        y = self.y[:count]
+        self._keep((y < bottom) & (y + self.height > top))
+
+    def collide(self, rect, center=None, radius=0):
+        """
+        Находит снаряды, попавшие в прямоугольник или в круг, и удаляет их.
+
+        Проверка выполняется одной векторной операцией для всех снарядов.
+
+        :param rect: Прямоугольник pygame.Rect (например, корабля).
+        :param center: Центр круга (например, щита) или None.
+        :param radius: Радиус круга.
+        :return: Кортеж (попаданий в прямоугольник, попаданий в круг). Снаряд,
+                 попавший в круг, в прямоугольник не засчитывается.
+        """
+        count = self.count
+        if not count:
+            return 0, 0
+        # Целые координаты совпадают с координатами отрисовки
+        xs = self.x[:count].astype(np.int64)
+        ys = self.y[:count].astype(np.int64)
+        hit_rect = ((xs < rect.right) & (xs + self.width > rect.left) &
+                    (ys < rect.bottom) & (ys + self.height > rect.top))
+        if center is not None:
+            # Ближайшая к центру круга точка снаряда лежит внутри круга
+            dx = np.clip(center[0], xs, xs + self.width) - center[0]
+            dy = np.clip(center[1], ys, ys + self.height) - center[1]
+            hit_circle = dx * dx + dy * dy <= radius * radius
+            hit_rect &= ~hit_circle
+        else:
+            hit_circle = np.zeros(count, dtype=bool)
+        rect_hits = int(hit_rect.sum())
+        circle_hits = int(hit_circle.sum())
+        if rect_hits or circle_hits:
+            self._keep(~(hit_rect | hit_circle))
+        return rect_hits, circle_hits
+
+    def blit_sequence(self, alpha=1.0):
+        """
+        Возвращает пары (изображение, позиция) всех снарядов для Surface.blits().
+
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом.
+        :return: Список пар (поверхность, (x, y)).
+        """
+        if self._image is None:
+            self._image = assets.registry.solid((self.width, self.height), self.color)
+        count = self.count
+        xs = self.x[:count].astype(np.int64)
+        ys = self.y[:count].astype(np.int64)
+        if alpha < 1.0:
+            prev_xs = self.prev_x[:count].astype(np.int64)
+            prev_ys = self.prev_y[:count].astype(np.int64)
+            xs = np.rint(prev_xs + (xs - prev_xs) * alpha).astype(np.int64)
+            ys = np.rint(prev_ys + (ys - prev_ys) * alpha).astype(np.int64)
+        image = self._image
+        return [(image, position) for position in zip(xs.tolist(), ys.tolist())]
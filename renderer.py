@@ -0,0 +1,261 @@
+import pygame
+
+import assets
+from loop import interpolate_rect
+from atlas import blit_batch
+from profiler import frame_profiler
+
+
+class DirtyRenderer:
+    """
+    Отрисовка кадра по "грязным" прямоугольникам.
+
+    Вместо заливки всего экрана и pygame.display.flip() рендерер запоминает,
+    где и что было нарисовано в прошлом кадре, стирает фоном только области
+    изменившихся объектов и передаёт в pygame.display.update() лишь их
+    прямоугольники (по аналогии с pygame.sprite.RenderUpdates).
+    """
+
+    shield_color = (0, 255, 0)  # Цвет кольца щита
+    shield_width = 2  # Толщина кольца щита
+
+    def __init__(self, ai_settings, screen):
+        """
+        Инициализирует рендерер.
+
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором рисуется игра.
+        """
+        self.ai_settings = ai_settings
+        self.screen = screen
+
+        # Объект -> (изображение или цвет заливки, прямоугольник) из прошлого кадра
+        self._last = {}
+        self._full_redraw = True  # Первый кадр выводится целиком
+        # Поколение изображений реестра: при его смене заглушки заменены загруженными изображениями
+        self._generation = assets.registry.generation
+
+        # Кольцо щита рисуется один раз и затем только копируется на экран
+        radius = ai_settings.shield_radius
+        self.shield_image = pygame.Surface((2 * radius, 2 * radius))
+        self.shield_image.set_colorkey((0, 0, 0))
+        pygame.draw.circle(self.shield_image, self.shield_color, (radius, radius),
+                           radius, self.shield_width)
+
+        # Количество прямоугольников, выведенных в последнем кадре
+        self.dirty_count = 0
+
+    def invalidate(self):
+        """Требует полной перерисовки экрана в следующем кадре."""
+        self._full_redraw = True
+
+    def collect(self, stats, sb, ship, aliens, bullets, play_button, bonuses, alpha):
+        """
+        Собирает список отрисовываемых элементов в порядке вывода на экран.
+
+        :return: Список кортежей (ключ, изображение или цвет заливки, прямоугольник).
+        """
+        items = []
+
+        # Все пули выводятся позади изображений корабля пришельцев
+        for bullet in bullets.sprites():
+            items.append((bullet, bullet.image, pygame.Rect(interpolate_rect(bullet, alpha))))
+        # Снаряды пришельцев не имеют спрайтов: ключом служит номер снаряда
+        shots = aliens.shots
+        for number, (image, position) in enumerate(shots.blit_sequence(alpha)):
+            items.append((('shot', number), image, pygame.Rect(position, (shots.width, shots.height))))
+
+        ship_rect = pygame.Rect(interpolate_rect(ship, alpha))
+        items.append((ship, ship.image, ship_rect))
+
+        if stats.shield_active:
+            # Кольцо щита вокруг корабля
+            items.append(('shield', self.shield_image,
+                          self.shield_image.get_rect(center=ship_rect.center)))
+
+        for alien in aliens.sprites():
+            items.append((alien, alien.image, pygame.Rect(interpolate_rect(alien, alpha))))
+        for bonus in bonuses.sprites():
+            items.append((bonus, bonus.image, pygame.Rect(interpolate_rect(bonus, alpha))))
+
+        # Кнопка Play отображается в том случае, если игра неактивна
+        if not stats.game_active:
+            items.append(('button', play_button.button_color, play_button.rect))
+            items.append(('button_msg', play_button.msg_image, play_button.msg_image_rect))
+
+        # Надписи панели счёта
+        sb.prep_all()
+        for label, image, rect in sb.get_labels():
+            items.append((label, image, rect))
+
+        # Оверлей профилировщика (только когда он включён)
+        overlay = frame_profiler.get_overlay()
+        if overlay is not None:
+            items.append(('profiler', overlay[0], overlay[1]))
+        return items
+
+    def render(self, stats, sb, ship, aliens, bullets, play_button, bonuses, alpha=1.0):
+        """
+        Отрисовывает кадр и выводит на экран только изменившиеся области.
+
+        :param stats: Статистика игры.
+        :param sb: Объект Scoreboard для вывода счёта.
+        :param ship: Объект корабля.
+        :param aliens: Группа пришельцев.
+        :param bullets: Группа пуль.
+        :param play_button: Кнопка для начала игры.
+        :param bonuses: Группа бонусов.
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом симуляции.
+        """
+        screen = self.screen
+        bg_color = self.ai_settings.bg_color
+        if self._generation != assets.registry.generation:
+            # Изображения изменились на месте - сравнение с прошлым кадром их не заметит
+            self._generation = assets.registry.generation
+            self.invalidate()
+        items = self.collect(stats, sb, ship, aliens, bullets, play_button, bonuses, alpha)
+
+        current = {}
+        dirty = []
+        for key, image, rect in items:
+            current[key] = (image, rect)
+            previous = self._last.pop(key, None)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] is not image or previous[1] != rect:
+                # Объект сдвинулся или изменился: обновляем старую и новую области
+                if previous[1].colliderect(rect):
+                    dirty.append(rect.union(previous[1]))
+                else:
+                    dirty.append(previous[1])
+                    dirty.append(rect)
+
+        # Объекты, исчезнувшие с прошлого кадра
+        for _, rect in self._last.values():
+            dirty.append(rect)
+        self._last = current
+
+        if self._full_redraw:
+            screen.fill(bg_color)
+            self._draw_items(items)
+            frame_profiler.mark('draw')
+            pygame.display.flip()
+            self._full_redraw = False
+            self.dirty_count = 1
+            return
+
+        # Каждая изменившаяся область стирается фоном и заново собирается из
+        # пересекающих её объектов; отсечение не даёт перерисовать соседние пиксели
+        rects = [rect for _, _, rect in items]
+        for dirty_rect in dirty:
+            screen.set_clip(dirty_rect)
+            screen.fill(bg_color, dirty_rect)
+            self._draw_items([items[i] for i in dirty_rect.collidelistall(rects)])
+        screen.set_clip(None)
+        frame_profiler.mark('draw')
+
+        pygame.display.update(dirty)
+        self.dirty_count = len(dirty)
+
+    def _draw_items(self, items):
+        """Рисует элементы: поверхности копируются, цвета заливаются по прямоугольнику."""
+        screen = self.screen
+        for _, image, rect in items:
+            if isinstance(image, tuple):
+                screen.fill(image, rect)
+            else:
+                screen.blit(image, rect)
+
+
+class ScaledRenderer(DirtyRenderer):
+    """
+    Вывод логического игрового пространства на экран другого размера.
+
+    Элементы кадра собираются в логических координатах (как в DirtyRenderer),
+    а на экран выводятся их изображения, отмасштабированные объектом Viewport
+    один раз и взятые из его кэша. Кадр выводится целиком через flip().
+    """
+
+    letterbox_color = (0, 0, 0)  # Цвет полос вокруг игрового пространства
+
+    def __init__(self, ai_settings, screen, viewport):
+        """
+        Инициализирует рендерер и заранее масштабирует изображения игры.
+
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором рисуется игра.
+        :param viewport: Объект Viewport для размера экрана.
+        """
+        super().__init__(ai_settings, screen)
+        self.viewport = viewport
+        viewport.prescale(assets.registry.surfaces() + [self.shield_image])
+
+    def render(self, stats, sb, ship, aliens, bullets, play_button, bonuses, alpha=1.0):
+        """Отрисовывает кадр с масштабированием и выводит экран целиком."""
+        screen = self.screen
+        viewport = self.viewport
+        if self._generation != assets.registry.generation:
+            # Заглушки заменены загруженными изображениями: масштабируем их заново
+            self._generation = assets.registry.generation
+            surfaces = assets.registry.surfaces()
+            viewport.forget(surfaces)
+            viewport.prescale(surfaces)
+        items = self.collect(stats, sb, ship, aliens, bullets, play_button, bonuses, alpha)
+
+        screen.fill(self.letterbox_color)
+        screen.fill(self.ai_settings.bg_color, viewport.rect)
+
+        # Подряд идущие изображения рисуются одним вызовом blits; заливки
+        # (фон кнопки) разрывают последовательность, чтобы сохранить порядок слоёв
+        sequence = []
+        for key, image, rect in items:
+            if key == 'profiler':
+                # Оверлей профилировщика уже расположен в координатах экрана
+                sequence.append((image, rect))
+            elif isinstance(image, tuple):
+                blit_batch(screen, sequence)
+                sequence = []
+                screen.fill(image, viewport.map_rect(rect))
+            else:
+                sequence.append((viewport.image(image), viewport.map_pos(rect.topleft)))
+        blit_batch(screen, sequence)
+        frame_profiler.mark('draw')
+
+        pygame.display.flip()
+        self.dirty_count = 1
+
+
+# Рендереры, созданные для экранов (по одному на экран)
+_dirty_renderers = {}
+_scaled_renderers = {}
+
+
+def get_dirty_renderer(ai_settings, screen):
+    """
+    Возвращает рендерер "грязных" прямоугольников для экрана, создавая его при необходимости.
+
+    :param ai_settings: Настройки игры.
+    :param screen: Экран, на котором рисуется игра.
+    :return: Объект DirtyRenderer.
+    """
+    renderer = _dirty_renderers.get(id(screen))
+    if renderer is None or renderer.screen is not screen:
+        renderer = DirtyRenderer(ai_settings, screen)
+        _dirty_renderers[id(screen)] = renderer
+    return renderer
+
+
+def get_scaled_renderer(ai_settings, screen, viewport):
+    """
+    Возвращает масштабирующий рендерер для экрана, создавая его при необходимости.
+
+    :param ai_settings: Настройки игры.
+    :param screen: Экран, на котором рисуется игра.
+    :param viewport: Объект Viewport для размера экрана.
+    :return: Объект ScaledRenderer.
+    """
+    renderer = _scaled_renderers.get(id(screen))
+    if renderer is None or renderer.screen is not screen or renderer.viewport is not viewport:
+        renderer = ScaledRenderer(ai_settings, screen, viewport)
+        _scaled_renderers[id(screen)] = renderer
+    return renderer
@@ -0,0 +1,243 @@
+"""
+Запись и воспроизведение игровых сеансов.
+
+Ход игры полностью определяется зерном генератора случайных чисел мира и
+командами игрока на каждом шаге симуляции. Recorder сохраняет их в файл,
+а replay() прогоняет записанный сеанс через Simulation без окна и отрисовки
+с максимальной скоростью и сверяет итоговый счёт и уровень с записанными.
+
+Примеры:
+    python replay.py session.rec
+    python replay.py session.rec --trace replay_trace.json
+"""
+import argparse
+import struct
+import sys
+import time
+
+from settings import Settings
+from simulation import Simulation, InputState
+from clock import SimClock
+from profiler import frame_profiler
+from ioworker import io_stats, get_worker
+
+MAGIC = b'AIRP'  # Сигнатура файла записи
+# Версия формата записи; увеличивается и при изменении правил игры (например,
+# ответный огонь пришельцев, волны из файла), так как старые записи воспроизводились бы иначе
+VERSION = 3
+
+# Сигнатура, версия, зерно, ширина и высота экрана, частота симуляции
+_HEADER = struct.Struct('<4sHQiii')
+# Шаг, флаги команд, количество выстрелов
+_EVENT = struct.Struct('<QBH')
+# Итог сеанса: количество шагов, счёт, уровень
+_TRAILER = struct.Struct('<Qqi')
+
+# Флаги команд игрока
+MOVING_LEFT = 1
+MOVING_RIGHT = 2
+START = 4
+SAVE = 8
+LOAD = 16
+END = 0xFF  # Признак конца записи (за ним следует итог сеанса)
+
+
+def pack_inputs(inputs):
+    """Возвращает флаги команд объекта InputState."""
+    return ((MOVING_LEFT if inputs.moving_left else 0) |
+            (MOVING_RIGHT if inputs.moving_right else 0) |
+            (START if inputs.start else 0) |
+            (SAVE if inputs.save else 0) |
+            (LOAD if inputs.load else 0))
+
+
+class Recorder:
+    """
+    Запись команд игрока по шагам симуляции.
+
+    Записываются только шаги, на которых команды изменились или есть
+    одноразовые команды (выстрел, начало игры), поэтому файл остаётся
+    маленьким даже для долгих сеансов. События копятся в памяти, а на диск
+    их пишет поток ввода-вывода, так что запись не задерживает кадр.
+    """
+
+    flush_size = 4096  # Размер накопленных событий, после которого они отдаются на запись (в байтах)
+
+    def __init__(self, filename, seed, ai_settings):
+        """
+        Открывает файл записи и записывает заголовок.
+
+        :param filename: Имя файла записи.
+        :param seed: Зерно генератора случайных чисел мира.
+        :param ai_settings: Настройки игры (размер экрана и частота симуляции).
+        """
+        self.filename = filename
+        self.worker = get_worker()
+        with io_stats.track('replay'):
+            self.file = open(filename, 'wb')
+        self._buffer = bytearray(_HEADER.pack(MAGIC, VERSION, seed, ai_settings.screen_width,
+                                              ai_settings.screen_height, ai_settings.sim_fps))
+        self.tick = 0  # Количество записанных шагов
+        self._last_flags = 0
+        self._closed = False
+
+    def record(self, inputs):
+        """
+        Записывает команды, которые будут применены на ближайшем шаге симуляции.
+
+        :param inputs: Объект InputState (вызывается перед Simulation.step()).
+        """
+        flags = pack_inputs(inputs)
+        if flags != self._last_flags or inputs.fire or inputs.start:
+            self._buffer += _EVENT.pack(self.tick, flags, inputs.fire)
+            self._last_flags = flags & (MOVING_LEFT | MOVING_RIGHT)
+            if len(self._buffer) >= self.flush_size:
+                self._flush()
+        self.tick += 1
+
+    def close(self, stats):
+        """
+        Записывает итог сеанса и закрывает файл.
+
+        :param stats: Статистика игры для сверки при воспроизведении.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer += _EVENT.pack(self.tick, END, 0)
+        self._buffer += _TRAILER.pack(self.tick, stats.score, stats.level)
+        self._flush()
+        # Вызывается при выходе из игры: дожидаемся, пока файл будет записан
+        self.worker.submit(self._close_file).result()
+        print("Сеанс записан:", self.filename)
+
+    def _flush(self):
+        """Отдаёт накопленные события потоку ввода-вывода."""
+        self.worker.submit(self._write, bytes(self._buffer))
+        self._buffer.clear()
+
+    def _write(self, data):
+        """Записывает данные в файл (в потоке ввода-вывода)."""
+        with io_stats.track('replay'):
+            self.file.write(data)
+
+    def _close_file(self):
+        """Закрывает файл записи (в потоке ввода-вывода)."""
+        with io_stats.track('replay'):
+            self.file.close()
+
+
+class Recording:
+    """Загруженная запись сеанса."""
+
+    def __init__(self, filename):
+        """
+        Читает файл записи.
+
+        :param filename: Имя файла записи.
+        :raises ValueError: Если файл повреждён или записан в неизвестной версии формата.
+        """
+        with io_stats.track('replay'), open(filename, 'rb') as f:
+            data = f.read()
+        try:
+            magic, version, seed, width, height, sim_fps = _HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"некорректный заголовок: {e}") from e
+        if magic != MAGIC:
+            raise ValueError("неизвестная сигнатура файла")
+        if version != VERSION:
+            raise ValueError(f"неподдерживаемая версия формата: {version}")
+        self.seed = seed
+        self.screen_width = width
+        self.screen_height = height
+        self.sim_fps = sim_fps
+
+        self.events = []  # Список (шаг, флаги, выстрелы)
+        self.ticks = None  # Количество шагов (None - запись оборвана)
+        self.score = None
+        self.level = None
+        offset = _HEADER.size
+        while offset + _EVENT.size <= len(data):
+            tick, flags, fire = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            if flags == END:
+                if offset + _TRAILER.size <= len(data):
+                    self.ticks, self.score, self.level = _TRAILER.unpack_from(data, offset)
+                break
+            self.events.append((tick, flags, fire))
+        if self.ticks is None:
+            # Запись оборвана (например, игра аварийно завершилась) - воспроизводим до последней команды
+            self.ticks = self.events[-1][0] + 1 if self.events else 0
+
+    def make_settings(self):
+        """Возвращает настройки игры, совпадающие с настройками записанного сеанса."""
+        ai_settings = Settings()
+        ai_settings.screen_width = self.screen_width
+        ai_settings.screen_height = self.screen_height
+        ai_settings.sim_fps = self.sim_fps
+        return ai_settings
+
+
+def replay(recording, profile=False):
+    """
+    Воспроизводит сеанс без окна и отрисовки с максимальной скоростью.
+
+    Команды сохранения и загрузки (S и L) не воспроизводятся: они зависят
+    от файлов на диске, а не от записи.
+
+    :param recording: Объект Recording.
+    :param profile: Замерять фазы каждого шага профилировщиком кадра.
+    :return: Объект Simulation после последнего шага.
+    """
+    sim = Simulation(recording.make_settings(), None, SimClock(), recording.seed)
+    inputs = InputState()
+    if profile:
+        frame_profiler.enable()
+
+    events = iter(recording.events)
+    next_event = next(events, None)
+    for tick in range(recording.ticks):
+        if next_event is not None and next_event[0] == tick:
+            _, flags, fire = next_event
+            inputs.moving_left = bool(flags & MOVING_LEFT)
+            inputs.moving_right = bool(flags & MOVING_RIGHT)
+            inputs.start = bool(flags & START)
+            inputs.fire = fire
+            next_event = next(events, None)
+        frame_profiler.begin_frame()
+        sim.step(inputs)
+    frame_profiler.begin_frame()  # Завершает замер последнего шага
+    return sim
+
+
+def main(argv=None):
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Воспроизведение записанного сеанса без отрисовки.")
+    parser.add_argument('recording', help="Файл записи сеанса.")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="Сохранить трассу шагов в формате Chrome Trace Event.")
+    args = parser.parse_args(argv)
+
+    recording = Recording(args.recording)
+    start = time.perf_counter()
+    sim = replay(recording, profile=args.trace is not None)
+    elapsed = time.perf_counter() - start
+    if args.trace:
+        frame_profiler.dump_trace(args.trace)
+        frame_profiler.disable()
+
+    print(f"Шагов: {sim.tick}, время: {elapsed:.3f} с ({sim.tick / max(elapsed, 1e-9):.0f} шагов/с)")
+    print(f"Счёт: {sim.stats.score}, уровень: {sim.stats.level}")
+    if recording.score is None:
+        print("Итог сеанса не записан, сверка невозможна.")
+        return 0
+    if (sim.stats.score, sim.stats.level) != (recording.score, recording.level):
+        print(f"Расхождение с записью: счёт {recording.score}, уровень {recording.level}",
+              file=sys.stderr)
+        return 1
+    print("Совпадает с записью.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
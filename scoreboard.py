@@ -0,0 +1,151 @@
+import math
+import pygame.font
+
+from game_state import GameState
+
+
+class Scoreboard:
+    """
+    Класс для вывода игровой информации (жизни, уровень, счёт, рекорд).
+
+    Шрифт создаётся один раз, а изображения надписей кэшируются по значению:
+    надпись перерисовывается только тогда, когда соответствующее значение
+    в GameStats изменилось.
+    """
+
+    max_cached_values = 32  # Максимум кэшированных изображений одной надписи
+
+    def __init__(self, ai_settings, screen, stats, leaderboard=None, profile=None):
+        """
+        Инициализирует атрибуты, связанные с выводом счёта.
+
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором отображается информация.
+        :param stats: Статистика игры.
+        :param leaderboard: Таблица рекордов (объект Leaderboard) или None.
+        :param profile: Профиль настроек в таблице рекордов.
+        """
+        self.screen = screen
+        self.ai_settings = ai_settings
+        self.stats = stats
+        self.leaderboard = leaderboard
+        self.profile = profile
+
+        # Настройки шрифта для вывода информации
+        self.text_color = (255, 255, 255)
+        self.font = pygame.font.SysFont(None, 48)
+        self.table_font = pygame.font.SysFont(None, 32)  # Шрифт таблицы рекордов
+
+        # Надпись -> (текущее значение, изображение, прямоугольник)
+        self._labels = {}
+        # Надпись -> {значение: изображение}
+        self._cache = {}
+
+    def _render(self, label, template, value, font=None):
+        """
+        Возвращает изображение надписи, отрисовывая его только для нового значения.
+
+        :param label: Имя надписи (например, 'score').
+        :param template: Шаблон текста с одним полем для значения.
+        :param value: Текущее значение.
+        :param font: Шрифт надписи (по умолчанию - основной).
+        :return: Изображение надписи.
+        """
+        cache = self._cache.setdefault(label, {})
+        image = cache.get(value)
+        if image is None:
+            if len(cache) >= self.max_cached_values:
+                cache.clear()
+            image = (font or self.font).render(template.format(value), True, self.text_color)
+            cache[value] = image
+        return image
+
+    def prep_label(self, label, template, value, font=None, **position):
+        """
+        Подготавливает надпись, если её значение изменилось с прошлого кадра.
+
+        :param label: Имя надписи.
+        :param template: Шаблон текста с одним полем для значения.
+        :param value: Текущее значение.
+        :param font: Шрифт надписи (по умолчанию - основной).
+        :param position: Привязка прямоугольника (например, topright=(x, y)).
+        """
+        current = self._labels.get(label)
+        if current is not None and current[0] == value:
+            return
+        image = self._render(label, template, value, font)
+        rect = image.get_rect(**position)
+        self._labels[label] = (value, image, rect)
+
+    def prep_all(self):
+        """Подготавливает все надписи по текущим значениям статистики."""
+        width = self.ai_settings.screen_width
+        self.prep_label('lives', "Корабли: {}", self.stats.ships_left, topleft=(10, 10))
+        self.prep_label('level', "Уровень: {}", self.stats.level, topright=(width - 10, 10))
+        self.prep_label('score', "Счёт: {}", self.stats.score, topright=(width - 10, 60))
+
+        # Лучшие результаты загружаются потоком таблицы рекордов при первом обращении
+        entries = []
+        if self.leaderboard is not None:
+            entries = self.leaderboard.top(self.profile, self.ai_settings.leaderboard_size)
+
+        # Таблица рекордов показывается в меню и после окончания игры
+        self.prep_table([] if self.stats.game_active else entries)
+
+        # Лучший счёт - с учётом результатов прошлых сеансов
+        high_score = max(self.stats.high_score, entries[0][1]) if entries else self.stats.high_score
+        self.prep_label('high_score', "Лучший счёт: {}", high_score,
+                        midtop=(width // 2, 10))
+
+        overlay = self.get_overlay_text()
+        if overlay:
+            self.prep_label('overlay', "{}", overlay,
+                            center=(width // 2, self.ai_settings.screen_height // 2 - 80))
+        else:
+            self._labels.pop('overlay', None)
+
+    def prep_table(self, entries):
+        """
+        Подготавливает строки таблицы рекордов под кнопкой "Играть".
+
+        :param entries: Список кортежей (игрок, счёт, уровень, время) или пустой список.
+        """
+        x = self.ai_settings.screen_width // 2
+        y = self.ai_settings.screen_height // 2 + 50
+        line_height = self.table_font.get_linesize()
+        for place, (player, score, level, _) in enumerate(entries, 1):
+            self.prep_label(f'table_{place}', "{}", f"{place}. {player} - {score} (уровень {level})",
+                            font=self.table_font, midtop=(x, y + (place - 1) * line_height))
+        # Лишние строки (например, прежней, более длинной таблицы) убираются
+        place = len(entries) + 1
+        while self._labels.pop(f'table_{place}', None) is not None:
+            place += 1
+
+    def get_overlay_text(self):
+        """
+        Возвращает текст надписи поверх игры для текущего состояния.
+
+        :return: Текст (отсчёт возрождения, номер уровня, конец игры) или None.
+        """
+        state = self.stats.state
+        if state.state == GameState.RESPAWNING:
+            return "Приготовьтесь: {}".format(math.ceil(state.remaining() / 1000))
+        if state.state == GameState.LEVEL_TRANSITION:
+            return "Уровень {}".format(self.stats.level)
+        if state.state == GameState.GAME_OVER:
+            return "Игра окончена"
+        return None
+
+    def get_labels(self):
+        """
+        Возвращает подготовленные надписи.
+
+        :return: Список кортежей (имя надписи, изображение, прямоугольник).
+        """
+        return [(label, image, rect) for label, (_, image, rect) in self._labels.items()]
+
+    def show_score(self):
+        """Выводит жизни, уровень, текущий счёт и рекорд на экран."""
+        self.prep_all()
+        for _, image, rect in self._labels.values():
+            self.screen.blit(image, rect)
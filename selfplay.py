@@ -0,0 +1,243 @@
+"""
+Пакетные прогоны игры ботом для подбора сложности.
+
+Каждая партия играется без окна и отрисовки (Simulation) простым ботом при
+заданных переопределениях настроек и зерне. Партии распределяются по
+процессам (multiprocessing), а итоги - достигнутый уровень, счёт и время
+жизни - сводятся по наборам параметров и сохраняются в CSV или JSON
+(формат выбирается по расширению файла).
+
+Параметр с несколькими значениями даёт перебор всех сочетаний (сетку).
+
+Примеры:
+    python selfplay.py --games 50 --output selfplay.csv
+    python selfplay.py --set speedup_scale=1.05,1.1,1.2 --set bonus_chance=0.05,0.1 --games 100 --output sweep.json
+    python selfplay.py --set fleet_drop_speed=10,20 --games 200 --per-game games.csv
+"""
+import argparse
+import ast
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+
+# Приветствие pygame печаталось бы в каждом процессе пула
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from settings import Settings
+from simulation import Simulation, InputState
+
+# Поля итога партии (в порядке столбцов CSV)
+GAME_FIELDS = ('seed', 'level', 'score', 'ticks', 'survival_s', 'timed_out')
+# Показатели, сводимые по партиям одного набора параметров
+METRICS = ('level', 'score', 'survival_s')
+
+
+class ScriptedBot:
+    """
+    Простой бот: держит корабль под самым нижним пришельцем и стреляет
+    в среднем с заданной частотой.
+
+    Случайность бота берётся из собственного генератора (а не из генератора
+    мира), поэтому партия полностью определяется зерном и настройками.
+    """
+
+    def __init__(self, seed, fire_interval=15):
+        """
+        :param seed: Зерно генератора случайных решений бота.
+        :param fire_interval: Средний интервал между выстрелами (в шагах симуляции).
+        """
+        self.rng = random.Random(seed)
+        self.fire_interval = fire_interval
+
+    def act(self, sim, inputs):
+        """
+        Записывает команды бота на ближайший шаг симуляции.
+
+        :param sim: Объект Simulation.
+        :param inputs: Объект InputState.
+        """
+        fleet = sim.aliens
+        count = fleet.count
+        alive = fleet.alive[:count]
+        if not alive.any():
+            inputs.moving_left = inputs.moving_right = False
+            return
+
+        # Самый нижний живой пришелец (при равенстве - ближайший по горизонтали)
+        ys = fleet.y[:count]
+        lowest = ys[alive].max()
+        candidates = (fleet.x[:count] + fleet.alien_width / 2)[alive & (ys == lowest)]
+        ship_x = sim.ship.rect.centerx
+        target = candidates[abs(candidates - ship_x).argmin()]
+
+        dead_zone = sim.ship.rect.width / 4
+        inputs.moving_right = target > ship_x + dead_zone
+        inputs.moving_left = target < ship_x - dead_zone
+        if self.rng.random() * self.fire_interval < 1:
+            inputs.fire = 1
+
+
+def apply_overrides(ai_settings, overrides):
+    """
+    Переопределяет настройки игры.
+
+    :param ai_settings: Настройки игры.
+    :param overrides: Словарь {имя настройки: значение}.
+    :raises AttributeError: Если такой настройки нет.
+    """
+    for name, value in overrides.items():
+        if not hasattr(ai_settings, name):
+            raise AttributeError(f"неизвестная настройка: {name}")
+        setattr(ai_settings, name, value)
+
+
+def play_game(task):
+    """
+    Играет одну партию ботом до конца игры или до ограничения по времени.
+
+    :param task: Кортеж (переопределения настроек, зерно, ограничение времени партии в секундах).
+    :return: Кортеж (переопределения, итог партии в виде словаря).
+    """
+    overrides, seed, max_seconds = task
+    ai_settings = Settings()
+    apply_overrides(ai_settings, overrides)
+    sim = Simulation(ai_settings, seed=seed)
+    # Начало игры сбрасывает динамические настройки (скорости, fleet_drop_speed),
+    # поэтому переопределения применяются повторно
+    sim.start_game()
+    apply_overrides(ai_settings, overrides)
+
+    bot = ScriptedBot(seed)
+    inputs = InputState()
+    max_ticks = int(max_seconds * ai_settings.sim_fps)
+    while sim.stats.game_active and sim.tick < max_ticks:
+        bot.act(sim, inputs)
+        sim.step(inputs)
+
+    return overrides, {
+        'seed': seed,
+        'level': sim.stats.level,
+        'score': sim.stats.score,
+        'ticks': sim.tick,
+        'survival_s': round(sim.clock.get_ticks() / 1000, 3),
+        'timed_out': sim.stats.game_active,
+    }
+
+
+def parse_override(text):
+    """
+    Разбирает аргумент --set вида имя=значение1,значение2,...
+
+    :return: Кортеж (имя, список значений).
+    """
+    name, sep, values = text.partition('=')
+    if not sep or not values:
+        raise argparse.ArgumentTypeError(f"ожидается имя=значение[,значение...]: {text}")
+    try:
+        return name.strip(), [ast.literal_eval(value.strip()) for value in values.split(',')]
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"некорректное значение в {text}") from None
+
+
+def make_grid(overrides):
+    """
+    Возвращает все сочетания значений параметров.
+
+    :param overrides: Список пар (имя, список значений).
+    :return: Список словарей {имя: значение}.
+    """
+    names = [name for name, _ in overrides]
+    return [dict(zip(names, values))
+            for values in itertools.product(*(values for _, values in overrides))]
+
+
+def summarize(overrides, games):
+    """
+    Сводит итоги партий одного набора параметров.
+
+    :param overrides: Переопределения настроек.
+    :param games: Список итогов партий.
+    :return: Словарь со значениями параметров и средними, медианами, минимумами и максимумами показателей.
+    """
+    row = dict(overrides)
+    row['games'] = len(games)
+    row['timed_out'] = sum(game['timed_out'] for game in games)
+    for metric in METRICS:
+        values = [game[metric] for game in games]
+        row[f'{metric}_mean'] = round(statistics.fmean(values), 3)
+        row[f'{metric}_median'] = statistics.median(values)
+        row[f'{metric}_min'] = min(values)
+        row[f'{metric}_max'] = max(values)
+    return row
+
+
+def write_rows(filename, rows):
+    """Сохраняет строки в CSV или JSON (по расширению файла)."""
+    if filename.lower().endswith('.json'):
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        return
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    """Точка входа командной строки."""
+    parser = argparse.ArgumentParser(description="Пакетные прогоны игры ботом без отрисовки.")
+    parser.add_argument('--set', dest='overrides', action='append', default=[], type=parse_override,
+                        metavar='ИМЯ=ЗНАЧЕНИЯ',
+                        help="Переопределение настройки (несколько значений через запятую).")
+    parser.add_argument('--games', type=int, default=20, help="Партий на каждый набор параметров.")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно первой партии набора.")
+    parser.add_argument('--max-time', type=float, default=600,
+                        help="Ограничение длительности партии (секунды игрового времени).")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Количество процессов.")
+    parser.add_argument('--output', default='selfplay.csv', help="Файл сводки (.csv или .json).")
+    parser.add_argument('--per-game', metavar='FILE', help="Файл итогов отдельных партий (.csv или .json).")
+    args = parser.parse_args(argv)
+
+    grid = make_grid(args.overrides)
+    try:
+        for overrides in grid:
+            apply_overrides(Settings(), overrides)  # Неизвестные настройки - до запуска пула
+    except AttributeError as e:
+        parser.error(str(e))
+    tasks = [(overrides, args.seed + game, args.max_time)
+             for overrides in grid for game in range(args.games)]
+
+    start = time.perf_counter()
+    results = {}  # Индекс набора параметров -> итоги партий
+    with multiprocessing.Pool(args.workers) as pool:
+        chunksize = max(1, len(tasks) // (args.workers * 8))
+        for overrides, game in pool.imap_unordered(play_game, tasks, chunksize):
+            results.setdefault(grid.index(overrides), []).append(game)
+    elapsed = time.perf_counter() - start
+
+    summary = [summarize(grid[index], sorted(results[index], key=lambda game: game['seed']))
+               for index in range(len(grid))]
+    write_rows(args.output, summary)
+    if args.per_game:
+        write_rows(args.per_game, [{**grid[index], **game}
+                                   for index in range(len(grid))
+                                   for game in sorted(results[index], key=lambda game: game['seed'])])
+
+    for row in summary:
+        params = ', '.join(f"{name}={row[name]}" for name in grid[0]) or "настройки по умолчанию"
+        print(f"{params}: уровень {row['level_mean']:.1f}, счёт {row['score_mean']:.0f}, "
+              f"время жизни {row['survival_s_mean']:.1f} с")
+    print(f"Партий: {len(tasks)}, время: {elapsed:.1f} с, процессов: {args.workers}")
+    print("Сводка сохранена:", args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
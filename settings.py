@@ -20,9 +20,54 @@ class Settings:
         self.screen_width = 1200  # Ширина экрана
         self.screen_height = 800  # Высота экрана
         self.bg_color = (23, 25, 71)  # Цвет фона экрана (темно-синий)
+        # Режим вывода кадра: 'flip' - весь экран, 'dirty' - только изменившиеся области
+        self.render_mode = 'flip'
+        # Режим окна: 'window' - окно размера screen_width x screen_height,
+        # 'scaled' - масштабирование средствами видеокарты (pygame.SCALED),
+        # 'prescaled' - окно размера дисплея со спрайтами, отмасштабированными заранее
+        # (кадр выводится целиком, render_mode не учитывается).
+        # screen_width и screen_height остаются размером логического игрового пространства
+        self.display_mode = 'window'
+        self.display_size = None  # Размер окна в режиме 'prescaled' (None - размер рабочего стола)
+        self.fullscreen = False  # Полноэкранный режим
+        self.vsync = True  # Вертикальная синхронизация в режиме 'scaled'
+
+        # Параметры игрового цикла
+        self.sim_fps = 120  # Частота шагов симуляции (фиксированный шаг)
+        self.max_fps = 60  # Ограничение частоты отрисовки (0 - без ограничения)
+        self.speed_base_fps = 120  # Частота, при которой скорости заданы в пикселях за кадр
+        self.max_frame_time = 250  # Максимальная учитываемая длительность кадра (мс)
+        self.max_steps_per_frame = 10  # Максимум шагов симуляции за один кадр
+        self.interpolate = True  # Интерполяция позиций между шагами симуляции
+        self.random_seed = None  # Зерно генератора случайных чисел мира (None - случайное)
+        self.record_file = None  # Файл записи сеанса для replay.py (None - запись выключена)
+
+        # Таблица рекордов (SQLite): результаты по игрокам и профилям настроек
+        self.leaderboard_file = 'scores.db'  # Файл базы (None - таблица рекордов выключена)
+        self.player_name = 'Игрок'  # Имя игрока в таблице рекордов
+        self.score_profile = None  # Профиль настроек (None - по значениям настроек правил игры)
+        self.leaderboard_size = 10  # Количество лучших результатов в меню
+
+        # Профилировщик кадра: F3 - оверлей с замерами, F4 - сохранение трассы
+        self.profiler_trace_file = 'frame_trace.json'  # Файл трассы (формат Chrome Trace Event)
+
+        # Управление: действие -> список клавиш (имена pygame.key.name(), например 'right', 'space', 'f3')
+        self.key_bindings = {
+            'move_right': ['right'],  # Движение вправо
+            'move_left': ['left'],  # Движение влево
+            'fire': ['space'],  # Выстрел
+            'quit': ['q'],  # Выход из игры
+            'save': ['s'],  # Сохранение игры
+            'load': ['l'],  # Загрузка игры
+            'profiler': ['f3'],  # Оверлей профилировщика кадра
+            'trace': ['f4'],  # Сохранение трассы профилировщика
+        }
+        self.autofire_rate = 6  # Выстрелов в секунду при удержании клавиши выстрела (0 - без автоогня)
 
         # Параметры корабля
         self.ship_limit = 3  # Максимальное количество кораблей у игрока
+        self.respawn_time = 1000  # Пауза после потери корабля (в миллисекундах)
+        self.level_transition_time = 1000  # Пауза перед новым уровнем (в миллисекундах)
 
         # Параметры скорости пришельцев и очков
         self.speedup_scale = 1.1  # Коэффициент увеличения скорости пришельцев после каждого уровня
@@ -34,10 +79,38 @@ class Settings:
         self.bullet_color = (0, 128, 255)  # Цвет пули (голубой)
         self.bullet_allowed = 5  # Максимальное количество пуль на экране
 
+        # Ответный огонь пришельцев: стреляют нижние пришельцы колонок флота
+        # Выстрелов флота в секунду по уровням (1, 2, ...); после последнего - последнее значение
+        self.alien_fire_rates = (0.5, 0.75, 1, 1.5, 2, 3, 4, 6, 8)
+        self.alien_bullet_speed = 1.5  # Скорость снарядов пришельцев
+        self.alien_bullet_width = 4  # Ширина снаряда пришельца
+        self.alien_bullet_height = 12  # Высота снаряда пришельца
+        self.alien_bullet_color = (255, 96, 64)  # Цвет снаряда пришельца (оранжевый)
+        self.alien_bullets_max = 1000  # Максимум снарядов пришельцев на экране
+
+        # Файл волн: строй, скорости рядов и типы пришельцев по уровням (см. waves.py)
+        self.wave_file = 'waves/waves.json'
+
         # Параметры бонусов
         self.bonus_chance = 0.1  # Вероятность появления бонуса
         self.bonus_speed = 1.1  # Скорость падения бонусов
         self.shield_duration = 5000  # Длительность щита (в миллисекундах)
+        self.shield_radius = 50  # Радиус щита вокруг корабля (поглощает снаряды пришельцев)
+
+        # Параметры звука
+        self.sound_files = {
+            'laser': 'sounds/laser.wav',  # Выстрел
+            'explosion': 'sounds/explosion.wav',  # Уничтожение пришельца
+            'life_lost': 'sounds/life_lost.wav',  # Потеря жизни
+            'game_over': 'sounds/game_over.wav',  # Конец игры
+        }
+        self.sound_channels = 8  # Количество зарезервированных каналов микшера
+        self.sound_voice_limits = {  # Максимум одновременных голосов каждого звука
+            'laser': 3,
+            'explosion': 4,
+            'life_lost': 1,
+            'game_over': 1,
+        }
 
         # Инициализация динамических параметров игры
         self.initialize_dynamic_settings()
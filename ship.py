@@ -1,25 +1,31 @@
 import pygame
-import functions as gf
+
+import assets
+from loop import interpolate_rect
 
 
 class Ship:
     """Класс для создания и управления кораблём."""
 
+    image_path = 'images/spaceship.bmp'  # Общее изображение корабля
+
     def __init__(self, ai_settings, screen):
         """
         Инициализирует корабль и задаёт его начальную позицию.
 
         Параметры:
         ai_settings (Settings): объект, содержащий параметры игры.
-        screen (pygame.Surface): объект экрана, на котором будет отображаться корабль.
+        screen (pygame.Surface): объект экрана, на котором будет отображаться корабль
+            (None - при симуляции без окна).
         """
         self.screen = screen
         self.ai_settings = ai_settings
 
-        # Загрузка изображения корабля и получение его прямоугольника
-        self.image = pygame.image.load(gf.resource_path('images/spaceship.bmp'))
+        # Получение общего изображения корабля и его прямоугольника
+        self.image = assets.get_image(self.image_path)
         self.rect = self.image.get_rect()
-        self.screen_rect = screen.get_rect()
+        # Границы игрового поля берутся из настроек, чтобы корабль работал и без окна
+        self.screen_rect = pygame.Rect(0, 0, ai_settings.screen_width, ai_settings.screen_height)
 
         # Каждый новый корабль появляется у нижнего края экрана, по центру
         self.rect.centerx = self.screen_rect.centerx
@@ -27,36 +33,44 @@ class Ship:
 
         # Сохранение вещественной координаты центра корабля для более точного контроля
         self.center = float(self.rect.centerx)
+        # Позиция на предыдущем шаге симуляции (для интерполяции при отрисовке)
+        self.prev_pos = None
 
         # Флаги для управления движением корабля
         self.moving_right = False
         self.moving_left = False
 
-    def update(self):
+    def update(self, dt=1.0):
         """
         Обновляет позицию корабля в зависимости от флагов движения.
 
         Этот метод вызывается в основном игровом цикле для обновления позиции корабля.
         Если флаг движения вправо установлен и корабль не выходит за правую границу экрана,
         то его позиция сдвигается вправо. Аналогично для движения влево.
+
+        :param dt: Множитель перемещения за прошедшее время (1.0 - один кадр базовой частоты).
         """
+        self.prev_pos = self.rect.topleft
+
         # Обновление координаты корабля (атрибут center), не rect
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.center += self.ai_settings.ship_speed_factor
+            self.center += self.ai_settings.ship_speed_factor * dt
 
         if self.moving_left and self.rect.left > 0:
-            self.center -= self.ai_settings.ship_speed_factor
+            self.center -= self.ai_settings.ship_speed_factor * dt
 
         # Обновление атрибута rect на основе изменённой координаты center
         self.rect.centerx = self.center
 
-    def blitme(self):
+    def blitme(self, alpha=1.0):
         """
         Рисует корабль на экране в текущей позиции.
 
         Этот метод вызывается для отображения корабля на экране в своём текущем месте.
+
+        :param alpha: Коэффициент интерполяции между предыдущим и текущим шагом.
         """
-        self.screen.blit(self.image, self.rect)
+        self.screen.blit(self.image, interpolate_rect(self, alpha))
 
     def center_ship(self):
         """
@@ -65,3 +79,5 @@ class Ship:
         Этот метод используется, чтобы вернуть корабль в центр экрана после его уничтожения.
         """
         self.center = self.screen_rect.centerx
+        self.rect.centerx = self.center
+        self.prev_pos = None  # Перенос корабля не интерполируется
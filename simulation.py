@@ -0,0 +1,149 @@
+import random
+
+from stats import GameStats
+from ship import Ship
+from bullet import Bullet
+from bonus import Bonus
+from fleet import Fleet
+from pools import SpritePool
+from clock import SimClock
+import functions as gf
+from profiler import frame_profiler
+
+
+class InputState:
+    """
+    Команды игрока на ближайший шаг симуляции.
+
+    Удерживаемые клавиши хранятся как флаги, а одноразовые действия
+    (выстрел, начало игры) сбрасываются после применения.
+    """
+
+    def __init__(self):
+        """Инициализирует пустое состояние ввода."""
+        self.moving_left = False  # Удерживается движение влево
+        self.moving_right = False  # Удерживается движение вправо
+        self.fire = 0  # Количество запрошенных выстрелов
+        self.start = False  # Запрошено начало новой игры
+        self.save = False  # Запрошено сохранение мира
+        self.load = False  # Запрошена загрузка сохранённого мира
+
+    def clear_triggers(self):
+        """Сбрасывает одноразовые команды после их применения."""
+        self.fire = 0
+        self.start = False
+        self.save = False
+        self.load = False
+
+
+class Simulation:
+    """
+    Игровой мир без отрисовки.
+
+    Содержит корабль, флот, пули, бонусы и статистику и продвигает их на один
+    шаг симуляции за вызов step(). Время берётся из внедрённых часов, а
+    команды - из объекта InputState, поэтому симуляция работает без окна и
+    аудиоустройства (например, для быстрых прогонов на сервере).
+    """
+
+    def __init__(self, ai_settings, screen=None, clock=None, seed=None):
+        """
+        Создаёт игровой мир.
+
+        :param ai_settings: Настройки игры.
+        :param screen: Экран для отрисовки спрайтов (None - симуляция без окна).
+        :param clock: Часы симуляции (по умолчанию - новый SimClock).
+        :param seed: Зерно генератора случайных чисел мира (None - случайное).
+        """
+        self.ai_settings = ai_settings
+        self.screen = screen
+        self.clock = clock if clock is not None else SimClock()
+        # Все случайные решения мира берутся из одного генератора, поэтому
+        # зерно и команды игрока полностью определяют ход игры
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+
+        # Длительность шага и множитель перемещения, как в GameLoop
+        self.step_ms = 1000.0 / ai_settings.sim_fps
+        self.dt = self.step_ms / 1000.0 * ai_settings.speed_base_fps
+        self.tick = 0  # Количество выполненных шагов
+
+        self.stats = GameStats(ai_settings, self.clock, self.rng)
+        self.ship = Ship(ai_settings, screen)
+        self.bullets = SpritePool(Bullet)
+        self.aliens = Fleet(ai_settings)
+        self.bonuses = SpritePool(Bonus)
+
+        gf.create_fleet(ai_settings, screen, self.ship, self.aliens, self.stats.level)
+
+    def start_game(self):
+        """Начинает новую игру."""
+        self.bonuses.empty()
+        gf.start_game(self.ai_settings, self.screen, self.stats, self.ship,
+                      self.aliens, self.bullets)
+
+    def apply_input(self, inputs):
+        """
+        Применяет команды игрока и сбрасывает одноразовые команды.
+
+        :param inputs: Объект InputState.
+        """
+        if inputs.load:
+            gf.load_game(self)
+        if inputs.save:
+            gf.save_game(self)
+        if inputs.start and not self.stats.game_active:
+            self.start_game()
+
+        self.ship.moving_left = inputs.moving_left
+        self.ship.moving_right = inputs.moving_right
+
+        if self.stats.state.is_playing():
+            for _ in range(inputs.fire):
+                gf.fire_bullet(self.ai_settings, self.screen, self.ship, self.bullets)
+        inputs.clear_triggers()
+
+    def step(self, inputs=None):
+        """
+        Продвигает мир на один шаг симуляции.
+
+        :param inputs: Объект InputState с командами игрока (None - без ввода).
+        """
+        if inputs is not None:
+            self.apply_input(inputs)
+
+        # Завершение пауз возрождения и перехода уровня по таймеру
+        self.stats.state.update()
+
+        if self.stats.state.is_playing():
+            ai_settings, stats, screen = self.ai_settings, self.stats, self.screen
+            self.ship.update(self.dt)
+            frame_profiler.mark('ship')
+            gf.update_bullets(ai_settings, screen, stats, self.ship, self.aliens,
+                              self.bullets, self.bonuses, self.dt)
+            frame_profiler.mark('bullets')  # Включая столкновения пуль с пришельцами
+            gf.update_aliens(ai_settings, stats, screen, self.ship, self.aliens,
+                             self.bullets, self.dt)
+            frame_profiler.mark('aliens')  # Включая столкновения с кораблём
+            gf.check_bonus_collisions(ai_settings, stats, self.ship, self.bonuses)
+            self.bonuses.update(self.dt)  # Обновление бонусов
+            self.bonuses.cull()  # Удаление бонусов, упавших за нижний край
+
+            # Проверка истечения времени действия щита
+            stats.is_shield_expired()
+            frame_profiler.mark('bonuses')
+
+        self.clock.advance(self.step_ms)
+        self.tick += 1
+
+    def get_pool_counts(self):
+        """
+        Возвращает счётчики пулов пуль и бонусов и повторного использования пришельцев.
+
+        :return: Словарь {'bullets': {...}, 'bonuses': {...}, 'aliens': {...}}.
+        """
+        return {
+            "aliens": self.aliens.get_counts(),
+            "bullets": self.bullets.get_counts(),
+            "bonuses": self.bonuses.get_counts(),
+        }
@@ -0,0 +1,355 @@
+"""
+Двоичный формат сохранения полного состояния игрового мира.
+
+Файл состоит из заголовка (сигнатура, версия формата, длина и контрольная
+сумма данных) и данных, упакованных модулем struct: статистика, состояние
+игры, динамические настройки, корабль, генератор случайных чисел, флот, пули
+и бонусы. Загрузка не использует pickle, поэтому открытие чужого файла не
+выполняет произвольный код.
+"""
+import os
+import random
+import struct
+import tempfile
+import threading
+import zlib
+
+from bonus import Bonus
+from clock import SimClock
+from game_state import GameState
+from ioworker import io_stats, get_worker
+import waves
+
+MAGIC = b'AISV'  # Сигнатура файла сохранения
+VERSION = 5  # Версия формата; увеличивается при любом изменении разметки
+
+_HEADER = struct.Struct('<4sHII')  # Сигнатура, версия, длина данных, CRC32 данных
+# Номер шага симуляции и время часов (мс)
+_WORLD = struct.Struct('<Qd')
+# Жизни, счёт, уровень, рекорд, скорости корабля/пуль/пришельцев, очки за пришельца,
+# щит активен, время включения щита
+_STATS = struct.Struct('<iqiqdddi?q')
+# Имя состояния, время входа в состояние, длительность состояния
+_STATE = struct.Struct('<16sqq')
+# Динамические настройки: скорости, снижение флота, очки за пришельца, направление флота
+_SETTINGS = struct.Struct('<ddddib')
+# Корабль: точный центр, левая и верхняя граница
+_SHIP = struct.Struct('<dii')
+# Состояние генератора случайных чисел (Mersenne Twister): 624 слова, позиция,
+# признак и значение отложенного gauss()
+_RNG = struct.Struct('<625I?d')
+_COUNT = struct.Struct('<I')
+# Пришелец: точные левая и верхняя граница, множитель скорости, оставшиеся попадания,
+# колонка строя, тип из файла волн (пустой - обычный пришелец; один символ занимает
+# в UTF-8 до 4 байт, поэтому типы могут обозначаться и не латинскими буквами)
+_ALIEN = struct.Struct('<dddii4s')
+_BULLET = struct.Struct('<iddi')  # Левая граница, точная верхняя граница, скорость, ширина
+_BONUS = struct.Struct('<16sid')  # Тип, левая граница, точная верхняя граница
+_FIRE = struct.Struct('<d')  # Накопленная доля следующего выстрела флота
+_SHOT = struct.Struct('<ddd')  # Снаряд пришельца: левая и верхняя граница, скорость
+
+# Одновременно на диск пишет только один поток
+_write_lock = threading.Lock()
+
+
+def capture(sim):
+    """
+    Упаковывает состояние мира в байты.
+
+    :param sim: Объект Simulation.
+    :return: Содержимое файла сохранения (заголовок и данные).
+    """
+    stats, state, ai_settings, ship = sim.stats, sim.stats.state, sim.ai_settings, sim.ship
+    clock_ticks = getattr(sim.clock, 'ticks', None)
+    if clock_ticks is None:
+        clock_ticks = float(sim.clock.get_ticks())
+
+    parts = [
+        _WORLD.pack(sim.tick, clock_ticks),
+        _STATS.pack(stats.ships_left, stats.score, stats.level, stats.high_score,
+                    stats.ship_speed_factor, stats.bullet_speed_factor,
+                    stats.alien_speed_factor, stats.alien_points,
+                    stats.shield_active, stats.shield_timer),
+        _STATE.pack(state.state.encode(), state.started_at, state.duration),
+        _SETTINGS.pack(ai_settings.ship_speed_factor, ai_settings.bullet_speed_factor,
+                       ai_settings.alien_speed_factor, ai_settings.fleet_drop_speed,
+                       ai_settings.alien_points, ai_settings.fleet_direction),
+        _SHIP.pack(ship.center, ship.rect.x, ship.rect.y),
+        _pack_rng(stats.rng),
+    ]
+
+    aliens = sim.aliens
+    indices = aliens.alive[:aliens.count].nonzero()[0]
+    parts.append(_COUNT.pack(len(indices)))
+    parts.extend(_ALIEN.pack(x, y, speed, hp, column, (member.kind or '').encode())
+                 for x, y, speed, hp, column, member in zip(
+                     aliens.x[indices].tolist(), aliens.y[indices].tolist(),
+                     aliens.speed[indices].tolist(), aliens.hp[indices].tolist(),
+                     aliens.column[indices].tolist(), [aliens.members[i] for i in indices.tolist()]))
+
+    bullets = sim.bullets.sprites()
+    parts.append(_COUNT.pack(len(bullets)))
+    parts.extend(_BULLET.pack(bullet.rect.x, bullet.y, bullet.speed_factor, bullet.rect.width)
+                 for bullet in bullets)
+
+    bonuses = sim.bonuses.sprites()
+    parts.append(_COUNT.pack(len(bonuses)))
+    parts.extend(_BONUS.pack(bonus.bonus_type.encode(), bonus.rect.x, bonus.y)
+                 for bonus in bonuses)
+
+    shots = aliens.shots
+    parts.append(_FIRE.pack(aliens.fire_budget))
+    parts.append(_COUNT.pack(shots.count))
+    parts.extend(_SHOT.pack(x, y, speed) for x, y, speed in zip(shots.x[:shots.count].tolist(),
+                                                                 shots.y[:shots.count].tolist(),
+                                                                 shots.speed[:shots.count].tolist()))
+
+    payload = b''.join(parts)
+    return _HEADER.pack(MAGIC, VERSION, len(payload), zlib.crc32(payload)) + payload
+
+
+def _pack_rng(rng):
+    """Упаковывает состояние генератора random.Random."""
+    _, words, gauss_next = rng.getstate()
+    return _RNG.pack(*words, gauss_next is not None, gauss_next or 0.0)
+
+
+def restore(sim, data):
+    """
+    Восстанавливает состояние мира из байтов, созданных capture().
+
+    :param sim: Объект Simulation.
+    :param data: Содержимое файла сохранения.
+    :raises ValueError: Если файл повреждён или записан в неизвестной версии формата.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("файл слишком короткий")
+    magic, version, length, crc = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("неизвестная сигнатура файла")
+    if version != VERSION:
+        raise ValueError(f"неподдерживаемая версия формата: {version}")
+    payload = memoryview(data)[_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ValueError("контрольная сумма не совпадает")
+
+    alien_types = waves.get_wave_book(sim.ai_settings.wave_file).alien_types
+    try:
+        world = _unpack_payload(payload, alien_types)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"некорректные данные: {e}") from e
+    _apply(sim, *world)
+
+
+def _unpack_payload(payload, alien_types):
+    """
+    Распаковывает и проверяет данные сохранения, не изменяя мир.
+
+    :param payload: Данные сохранения (без заголовка).
+    :param alien_types: Типы пришельцев из файла волн {символ: waves.AlienType}.
+
+    :return: Кортеж значений для _apply().
+    """
+    offset = 0
+
+    def read(layout):
+        nonlocal offset
+        values = layout.unpack_from(payload, offset)
+        offset += layout.size
+        return values
+
+    def read_many(layout):
+        count, = read(_COUNT)
+        return [read(layout) for _ in range(count)]
+
+    tick, clock_ticks = read(_WORLD)
+    stats_values = read(_STATS)
+    state_name, started_at, duration = read(_STATE)
+    settings_values = read(_SETTINGS)
+    ship_center, ship_x, ship_y = read(_SHIP)
+    rng_values = read(_RNG)
+    rng_state = (3, tuple(rng_values[:625]), rng_values[626] if rng_values[625] else None)
+    aliens = [(x, y, speed, hp, column, kind.rstrip(b'\0').decode())
+              for x, y, speed, hp, column, kind in read_many(_ALIEN)]
+    bullets = read_many(_BULLET)
+    bonuses = [(bonus_type.rstrip(b'\0').decode(), x, y) for bonus_type, x, y in read_many(_BONUS)]
+    fire_budget, = read(_FIRE)
+    shots = read_many(_SHOT)
+
+    state_name = state_name.rstrip(b'\0').decode()
+    known_states = (GameState.MENU, GameState.PLAYING, GameState.RESPAWNING,
+                    GameState.LEVEL_TRANSITION, GameState.GAME_OVER)
+    if state_name not in known_states:
+        raise ValueError(f"неизвестное состояние игры: {state_name}")
+    random.Random().setstate(rng_state)  # ValueError при некорректном состоянии
+    for *_, kind in aliens:
+        if kind and kind not in alien_types:
+            raise ValueError(f"неизвестный тип пришельца: {kind}")
+    aliens = [(x, y, speed, hp, column, alien_types[kind] if kind else None)
+              for x, y, speed, hp, column, kind in aliens]
+    for bonus_type, _, _ in bonuses:
+        if bonus_type not in Bonus.image_paths:
+            raise ValueError(f"неизвестный тип бонуса: {bonus_type}")
+    return (tick, clock_ticks, stats_values, (state_name, started_at, duration),
+            settings_values, (ship_center, ship_x, ship_y), rng_state, aliens, bullets, bonuses,
+            fire_budget, shots)
+
+
+def _apply(sim, tick, clock_ticks, stats_values, state_values, settings_values, ship_values,
+           rng_state, aliens, bullets, bonuses, fire_budget, shots):
+    """Переносит распакованное состояние в объекты мира."""
+    ai_settings, stats, screen = sim.ai_settings, sim.stats, sim.screen
+
+    # Часы симуляции переводятся на момент сохранения; при часах реального
+    # времени таймеры сдвигаются на прошедшее с тех пор время
+    if isinstance(sim.clock, SimClock):
+        sim.clock.ticks = clock_ticks
+        time_offset = 0
+    else:
+        time_offset = sim.clock.get_ticks() - int(clock_ticks)
+    sim.tick = tick
+
+    (stats.ships_left, stats.score, stats.level, stats.high_score,
+     stats.ship_speed_factor, stats.bullet_speed_factor, stats.alien_speed_factor,
+     stats.alien_points, stats.shield_active, shield_timer) = stats_values
+    stats.shield_timer = shield_timer + time_offset if stats.shield_active else shield_timer
+
+    state_name, started_at, duration = state_values
+    state = stats.state
+    state.state = state_name
+    state.started_at = started_at + time_offset
+    state.duration = duration
+
+    (ai_settings.ship_speed_factor, ai_settings.bullet_speed_factor,
+     ai_settings.alien_speed_factor, ai_settings.fleet_drop_speed,
+     ai_settings.alien_points, ai_settings.fleet_direction) = settings_values
+
+    stats.rng.setstate(rng_state)
+
+    ship_center, ship_x, ship_y = ship_values
+    ship = sim.ship
+    ship.center = ship_center
+    ship.rect.topleft = (ship_x, ship_y)
+    ship.prev_pos = None
+
+    sim.aliens.empty()
+    for x, y, speed, hp, column, alien_type in aliens:
+        alien = sim.aliens.spawn(ai_settings, screen, x, y, alien_type, speed, hp, column)
+        sim.aliens.y[alien.fleet_index] = y  # Точная координата, а не округлённая
+
+    sim.bullets.empty()
+    # Скорость пуль общая и уже восстановлена в настройках вместе с уровнем
+    for x, y, _, width in bullets:
+        bullet = sim.bullets.spawn(ai_settings, screen, ship)
+        bullet.rect.width = int(width)
+        bullet.rect.x = x
+        bullet.y = y
+        bullet.rect.y = y
+        bullet.prev_pos = None
+
+    sim.bonuses.empty()
+    for bonus_type, x, y in bonuses:
+        bonus = sim.bonuses.spawn(ai_settings, screen, bonus_type, x, int(y))
+        bonus.y = y
+
+    sim.aliens.fire_budget = fire_budget
+    sim.aliens.shots.clear()
+    for x, y, speed in shots:
+        sim.aliens.shots.spawn(x, y, speed)
+
+
+def write_atomic(filename, data):
+    """
+    Записывает данные во временный файл рядом с целевым и переименовывает его.
+
+    Прерванная запись не портит предыдущее сохранение: файл либо полностью
+    старый, либо полностью новый.
+
+    :param filename: Имя файла сохранения.
+    :param data: Байты для записи.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    with _write_lock, io_stats.track('save'):
+        fd, temp_path = tempfile.mkstemp(prefix='.save-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filename)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def save_async(sim, filename, on_done=None):
+    """
+    Снимает состояние мира в текущем потоке и записывает его на диск в потоке ввода-вывода.
+
+    Упаковка занимает доли миллисекунды, а запись на диск (включая fsync) не
+    задерживает кадр.
+
+    :param sim: Объект Simulation.
+    :param filename: Имя файла сохранения.
+    :param on_done: Функция on_done(error), вызываемая в главном потоке из
+        IOWorker.poll() после записи (error - None или исключение).
+    :return: Объект Future операции записи.
+    """
+    data = capture(sim)
+
+    def done(future):
+        if on_done is not None:
+            on_done(future.exception())
+
+    return get_worker().submit(write_atomic, filename, data, on_done=done)
+
+
+def load_async(sim, filename, on_done=None):
+    """
+    Читает файл сохранения в потоке ввода-вывода и восстанавливает мир в главном потоке.
+
+    Мир восстанавливается из IOWorker.poll() игрового цикла, между шагами симуляции.
+
+    :param sim: Объект Simulation.
+    :param filename: Имя файла сохранения.
+    :param on_done: Функция on_done(error), вызываемая после восстановления
+        (error - None, FileNotFoundError, ValueError или OSError).
+    :return: Объект Future операции чтения.
+    """
+    def done(future):
+        error = future.exception()
+        if error is None:
+            try:
+                restore(sim, future.result())
+            except ValueError as e:
+                error = e
+        if on_done is not None:
+            on_done(error)
+
+    return get_worker().submit(read_file, filename, on_done=done)
+
+
+def load(sim, filename):
+    """
+    Загружает состояние мира из файла.
+
+    :param sim: Объект Simulation.
+    :param filename: Имя файла сохранения.
+    :raises FileNotFoundError: Если файла нет.
+    :raises ValueError: Если файл повреждён или несовместим.
+    """
+    restore(sim, read_file(filename))
+
+
+def read_file(filename):
+    """
+    Читает файл сохранения целиком.
+
+    :param filename: Имя файла сохранения.
+    :return: Содержимое файла.
+    :raises FileNotFoundError: Если файла нет.
+    """
+    with _write_lock, io_stats.track('save'):  # Не читать файл, пока его заменяет фоновая запись
+        with open(filename, 'rb') as f:
+            return f.read()
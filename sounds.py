@@ -0,0 +1,129 @@
+import pygame
+
+import assetpack
+import functions as gf
+from ioworker import io_stats
+
+
+class SoundBank:
+    """
+    Банк звуковых эффектов игры.
+
+    Все звуки декодируются один раз при запуске и воспроизводятся через
+    фиксированный пул зарезервированных каналов микшера. Для каждого звука
+    задаётся предел одновременных голосов; при его превышении самый старый
+    голос этого звука прерывается (voice stealing).
+    """
+
+    def __init__(self):
+        """Инициализирует пустой банк звуков. Звуки загружаются методом load()."""
+        self.enabled = False  # False, если микшер недоступен (например, нет аудиоустройства)
+        self._sounds = {}  # Имя звука -> pygame.mixer.Sound
+        self._limits = {}  # Имя звука -> максимальное число одновременных голосов
+        self._channels = []  # Пул зарезервированных каналов
+        self._voices = {}  # Канал -> (имя звука, порядковый номер запуска)
+        self._serial = 0  # Счётчик запусков для определения самого старого голоса
+
+        # Счётчики воспроизведения
+        self.played = 0  # Количество запущенных звуков
+        self.stolen = 0  # Количество прерванных голосов
+        self.dropped = 0  # Количество звуков, которые не удалось воспроизвести
+
+    def load(self, ai_settings):
+        """
+        Декодирует все звуки из настроек (из пакета ресурсов или отдельных файлов)
+        и резервирует каналы микшера.
+
+        :param ai_settings: Настройки игры (пути к звукам, размер пула и лимиты голосов).
+        """
+        if not pygame.mixer.get_init():
+            self.enabled = False
+            return
+
+        channel_count = ai_settings.sound_channels
+        if pygame.mixer.get_num_channels() < channel_count:
+            pygame.mixer.set_num_channels(channel_count)
+        pygame.mixer.set_reserved(channel_count)
+        self._channels = [pygame.mixer.Channel(i) for i in range(channel_count)]
+
+        pack = assetpack.default_pack()
+        for name, relative_path in ai_settings.sound_files.items():
+            with io_stats.track('sound'):
+                if pack is not None and relative_path in pack:
+                    self._sounds[name] = pack.sound(relative_path)
+                else:
+                    self._sounds[name] = pygame.mixer.Sound(gf.resource_path(relative_path))
+            self._limits[name] = ai_settings.sound_voice_limits.get(name, channel_count)
+        self.enabled = True
+
+    def play(self, name):
+        """
+        Воспроизводит звук через пул каналов с учётом лимита голосов.
+
+        :param name: Имя звука (например, 'laser' или 'explosion').
+        """
+        if not self.enabled:
+            return
+
+        sound = self._sounds[name]
+        self._release_finished()
+
+        # Если лимит голосов звука исчерпан, прерываем его самый старый голос
+        own_voices = [channel for channel, (voice_name, _) in self._voices.items()
+                      if voice_name == name]
+        if len(own_voices) >= self._limits[name]:
+            channel = self._oldest(own_voices)
+            self.stolen += 1
+        else:
+            channel = self._free_channel()
+            if channel is None:
+                # Свободных каналов нет - прерываем самый старый голос в пуле
+                channel = self._oldest(list(self._voices))
+                self.stolen += 1
+
+        if channel is None:
+            self.dropped += 1
+            return
+
+        channel.stop()
+        channel.play(sound)
+        self._serial += 1
+        self._voices[channel] = (name, self._serial)
+        self.played += 1
+
+    def stop_all(self):
+        """Останавливает все звуки, воспроизводимые через пул."""
+        for channel in self._channels:
+            channel.stop()
+        self._voices.clear()
+
+    def _release_finished(self):
+        """Освобождает каналы, на которых звук уже закончился."""
+        for channel in [channel for channel in self._voices if not channel.get_busy()]:
+            del self._voices[channel]
+
+    def _free_channel(self):
+        """Возвращает свободный канал пула или None."""
+        for channel in self._channels:
+            if channel not in self._voices:
+                return channel
+        return None
+
+    def _oldest(self, channels):
+        """Возвращает канал с самым давно запущенным голосом или None."""
+        if not channels:
+            return None
+        return min(channels, key=lambda channel: self._voices[channel][1])
+
+
+# Общий банк звуков игры
+bank = SoundBank()
+
+
+def play(name):
+    """
+    Воспроизводит звук из общего банка.
+
+    :param name: Имя звука.
+    """
+    bank.play(name)
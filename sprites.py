@@ -0,0 +1,213 @@
+"""
+Компактные спрайты для многочисленных объектов игры (пришельцы, пули, бонусы).
+
+pygame.sprite.Sprite хранит атрибуты в словаре экземпляра и создаёт для
+каждого спрайта множество групп. CompactSprite объявляет __slots__ и хранит
+группы в кортеже, а общие для всех спрайтов волны параметры (настройки игры
+и экран) - в одном общем объекте SpriteContext. Экземпляр занимает в
+несколько раз меньше памяти и создаётся быстрее.
+
+Отчёт о памяти и стоимости создания по сравнению со спрайтами со словарём
+экземпляра:
+    python sprites.py
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from pygame.sprite import Group
+
+
+class SpriteContext:
+    """Параметры, общие для всех спрайтов волны: настройки игры и экран."""
+
+    __slots__ = ('ai_settings', 'screen')
+
+    def __init__(self, ai_settings, screen):
+        """
+        :param ai_settings: Настройки игры.
+        :param screen: Экран, на котором рисуются спрайты (None - симуляция без окна).
+        """
+        self.ai_settings = ai_settings
+        self.screen = screen
+
+
+# Контексты, созданные для пар (настройки, экран)
+_contexts = {}
+
+
+def get_context(ai_settings, screen):
+    """
+    Возвращает общий контекст для настроек и экрана, создавая его при необходимости.
+
+    :param ai_settings: Настройки игры.
+    :param screen: Экран, на котором рисуются спрайты.
+    :return: Объект SpriteContext.
+    """
+    key = (id(ai_settings), id(screen))
+    context = _contexts.get(key)
+    if context is None or context.ai_settings is not ai_settings or context.screen is not screen:
+        context = SpriteContext(ai_settings, screen)
+        _contexts[key] = context
+    return context
+
+
+class CompactSprite:
+    """
+    Спрайт с __slots__, совместимый с группами pygame.sprite.
+
+    Поддерживает тот же протокол, что и pygame.sprite.Sprite (add_internal,
+    remove_internal, kill, alive, groups), поэтому работает с Group,
+    spritecollide() и т.п. Настройки и экран берутся из общего контекста.
+    """
+
+    __slots__ = ('_groups', 'context', 'image', 'rect', 'prev_pos')
+
+    def __init__(self):
+        """Инициализирует спрайт вне групп."""
+        self._groups = ()  # Группы, в которых состоит спрайт (обычно одна)
+
+    @property
+    def ai_settings(self):
+        """Настройки игры (из общего контекста)."""
+        return self.context.ai_settings
+
+    @property
+    def screen(self):
+        """Экран, на котором рисуется спрайт (из общего контекста)."""
+        return self.context.screen
+
+    def add_internal(self, group):
+        """Запоминает группу, в которую добавлен спрайт."""
+        self._groups += (group,)
+
+    def remove_internal(self, group):
+        """Забывает группу, из которой удалён спрайт."""
+        self._groups = tuple(member for member in self._groups if member is not group)
+
+    def kill(self):
+        """Удаляет спрайт из всех групп."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def alive(self):
+        """Проверяет, состоит ли спрайт хотя бы в одной группе."""
+        return bool(self._groups)
+
+    def groups(self):
+        """Возвращает список групп спрайта."""
+        return list(self._groups)
+
+    def update(self, *args, **kwargs):
+        """Обновление спрайта (переопределяется в наследниках)."""
+
+
+class CompactGroup(Group):
+    """
+    Группа, добавляющая и удаляющая компактные спрайты напрямую.
+
+    Group.add() и Group.remove() распознают только наследников
+    pygame.sprite.Sprite, а остальные объекты сначала пробуют разобрать как
+    последовательность (с исключением на каждый спрайт).
+    """
+
+    def add(self, *sprites):
+        """Добавляет спрайты в группу."""
+        for sprite in sprites:
+            if isinstance(sprite, CompactSprite):
+                if sprite not in self.spritedict:
+                    self.add_internal(sprite)
+                    sprite.add_internal(self)
+            else:
+                super().add(sprite)
+
+    def remove(self, *sprites):
+        """Удаляет спрайты из группы."""
+        for sprite in sprites:
+            if isinstance(sprite, CompactSprite):
+                if sprite in self.spritedict:
+                    self.remove_internal(sprite)
+                    sprite.remove_internal(self)
+            else:
+                super().remove(sprite)
+
+
+def measure(factory, count):
+    """
+    Замеряет память и время создания экземпляров.
+
+    :param factory: Функция без аргументов, создающая один экземпляр.
+    :param count: Количество создаваемых экземпляров.
+    :return: Словарь: байт на экземпляр, микросекунд на создание, сборок мусора поколения 0.
+    """
+    gc.collect()
+    collections = gc.get_stats()[0]['collections']
+    start = time.perf_counter()
+    instances = [factory() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    collections = gc.get_stats()[0]['collections'] - collections
+    del instances
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del instances
+    return {
+        "bytes": round(size / count),
+        "create_us": round(elapsed / count * 1e6, 3),
+        "gc_gen0": collections,
+    }
+
+
+def main(count=20000):
+    """Печатает отчёт: компактные спрайты против тех же классов со словарём экземпляра."""
+    import os
+
+    # Отчёт не требует окна и звука
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from pygame.sprite import Sprite
+
+    from settings import Settings
+    from ship import Ship
+    from alien import Alien
+    from bullet import Bullet
+    from bonus import Bonus
+
+    pygame.init()
+    ai_settings = Settings()
+    ship = Ship(ai_settings, None)
+    arguments = {
+        Alien: (ai_settings, None),
+        Bullet: (ai_settings, None, ship),
+        Bonus: (ai_settings, None, 'life', 0, 0),
+    }
+
+    print(f"{'класс':<10}{'вариант':<18}{'байт':>8}{'мкс':>9}{'сборок gc':>11}")
+    for cls, args in arguments.items():
+        # Тот же класс, но как наследник pygame.sprite.Sprite со словарём экземпляра
+        # (как до перехода на __slots__)
+        legacy = type(cls.__name__ + 'WithDict', (cls, Sprite), {})
+        for name, factory in (('__slots__', cls), ('Sprite + __dict__', legacy)):
+            if factory is legacy:
+                def create(factory=factory, args=args):
+                    sprite = factory(*args)
+                    Sprite.__init__(sprite)
+                    return sprite
+            else:
+                def create(factory=factory, args=args):
+                    return factory(*args)
+            result = measure(create, count)
+            print(f"{cls.__name__:<10}{name:<18}{result['bytes']:>8}{result['create_us']:>9}"
+                  f"{result['gc_gen0']:>11}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
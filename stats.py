@@ -1,20 +1,37 @@
-import pygame
+import random
+
+from clock import WallClock
+from game_state import GameState
 
 
 class GameStats:
     """Отслеживание статистики для игры 'Инопланетное Вторжение'."""
 
-    def __init__(self, ai_settings):
+    def __init__(self, ai_settings, clock=None, rng=None):
         """
         Инициализирует статистику игры.
 
         :param ai_settings: Объект настроек игры, содержащий параметры для начальной настройки статистики.
+        :param clock: Часы для игровых таймеров (по умолчанию - реальное время pygame).
+        :param rng: Генератор случайных чисел игры (по умолчанию - новый random.Random).
         """
         self.ai_settings = ai_settings
+        self.clock = clock if clock is not None else WallClock()
+        self.rng = rng if rng is not None else random.Random()
         self.reset_stats()  # Инициализация статистики
-        self.game_active = False  # Игра начинается в неактивном состоянии
+        self.state = GameState(self.clock)  # Игра начинается в состоянии меню
         self.high_score = 0  # Высокий рекорд, изначально равен 0
 
+    @property
+    def game_active(self):
+        """Игра идёт (в том числе во время пауз возрождения и перехода уровня)."""
+        return self.state.is_active()
+
+    @game_active.setter
+    def game_active(self, active):
+        """Запускает игру (True) или завершает её (False)."""
+        self.state.begin(GameState.PLAYING if active else GameState.GAME_OVER)
+
     def reset_stats(self):
         """
         Инициализирует статистику, которая изменяется в ходе игры.
@@ -42,7 +59,7 @@ class GameStats:
         Щит становится активным, и начинается отсчет времени его действия.
         """
         self.shield_active = True
-        self.shield_timer = pygame.time.get_ticks()  # Текущее время в миллисекундах
+        self.shield_timer = self.clock.get_ticks()  # Текущее время в миллисекундах
 
     def deactivate_shield(self):
         """
@@ -60,7 +77,7 @@ class GameStats:
         :return: True, если время действия щита истекло, иначе False.
         """
         if self.shield_active:
-            current_time = pygame.time.get_ticks()
+            current_time = self.clock.get_ticks()
             if current_time - self.shield_timer > self.ai_settings.shield_duration:
                 self.deactivate_shield()
                 return True
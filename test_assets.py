@@ -0,0 +1,76 @@
+"""
+Проверки реестра изображений: прозрачность спрайтов после конвертации.
+
+Запуск:
+    python -m pytest -q
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+import assetpack
+import assets
+from ioworker import IOWorker
+
+BG_COLOR = (23, 25, 71)  # Цвет фона игры (Settings.bg_color)
+SPRITE_IMAGES = ('images/alienship.bmp', 'images/spaceship.bmp',
+                 'images/bonus_life.bmp', 'images/bonus_shield.bmp')
+
+
+@pytest.fixture
+def screen():
+    """Окно для convert()/convert_alpha()."""
+    pygame.init()
+    return pygame.display.set_mode((200, 200))
+
+
+@pytest.fixture
+def pack(tmp_path, monkeypatch):
+    """Пакет ресурсов из папки images/, подставленный как пакет игры."""
+    pack_file = str(tmp_path / 'assets.pack')
+    assetpack.build(pack_file, ('images',))
+    built = assetpack.AssetPack(pack_file)
+    monkeypatch.setattr(assetpack, '_default_pack', built)
+    return built
+
+
+def corner_over_background(image):
+    """Возвращает цвет угла изображения, нарисованного поверх фона игры."""
+    target = pygame.Surface(image.get_size())
+    target = target.convert()
+    target.fill(BG_COLOR)
+    target.blit(image, (0, 0))
+    return tuple(target.get_at((0, 0)))[:3]
+
+
+@pytest.mark.parametrize('path', SPRITE_IMAGES)
+def test_registry_keeps_sprite_transparency(screen, path):
+    """Прозрачный фон спрайта не превращается в чёрный прямоугольник."""
+    registry = assets.AssetRegistry()
+    assert corner_over_background(registry.image(path)) == BG_COLOR
+
+
+@pytest.mark.parametrize('path', SPRITE_IMAGES)
+def test_pack_images_keep_transparency(screen, pack, path):
+    """Пакет хранит пиксели RGBA и флаг альфы; реестр конвертирует их с сохранением прозрачности."""
+    assert pack.image_info(path)[2]
+    registry = assets.AssetRegistry()
+    assert corner_over_background(registry.image(path)) == BG_COLOR
+
+
+@pytest.mark.parametrize('path', SPRITE_IMAGES)
+def test_placeholder_receives_transparency(screen, pack, path):
+    """Заглушка фоновой загрузки после прихода изображения прозрачна там же, где изображение."""
+    registry = assets.AssetRegistry()
+    worker = IOWorker()
+    registry.use_worker(worker)
+    try:
+        placeholder = registry.image(path)
+        assert placeholder.get_flags() & pygame.SRCALPHA
+        assert worker.wait(5)
+        assert corner_over_background(placeholder) == BG_COLOR
+    finally:
+        worker.shutdown()
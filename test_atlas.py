@@ -0,0 +1,48 @@
+"""
+Проверки текстурного атласа: области атласа рисуются так же, как исходные изображения.
+
+Запуск:
+    python -m pytest -q
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+import assets
+
+BG_COLOR = (23, 25, 71)  # Цвет фона игры (Settings.bg_color)
+SPRITE_IMAGES = ('images/alienship.bmp', 'images/spaceship.bmp',
+                 'images/bonus_life.bmp', 'images/bonus_shield.bmp')
+
+
+@pytest.fixture
+def screen():
+    """Окно для convert()/convert_alpha()."""
+    pygame.init()
+    return pygame.display.set_mode((200, 200))
+
+
+def corner_over_background(image):
+    """Возвращает цвет угла изображения, нарисованного поверх фона игры."""
+    target = pygame.Surface(image.get_size()).convert()
+    target.fill(BG_COLOR)
+    target.blit(image, (0, 0))
+    return tuple(target.get_at((0, 0)))[:3]
+
+
+def test_atlas_regions_keep_transparency(screen):
+    """Область атласа поверх фона оставляет фон в прозрачном углу и совпадает с изображением."""
+    registry = assets.AssetRegistry()
+    originals = {path: registry.image(path).copy() for path in SPRITE_IMAGES}
+    registry.convert_all()
+    registry.build_atlas()
+    assert registry.atlas.surface.get_flags() & pygame.SRCALPHA
+
+    for path, original in originals.items():
+        region = registry.image(path)
+        assert region.get_parent() is registry.atlas.surface
+        assert corner_over_background(region) == BG_COLOR
+        assert pygame.image.tobytes(region, 'RGBA') == pygame.image.tobytes(original, 'RGBA')
@@ -0,0 +1,48 @@
+"""
+Проверки флота пришельцев на сетке столкновений.
+
+Запуск:
+    python -m pytest -q
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import functions as gf
+from fleet import Fleet
+from settings import Settings
+from ship import Ship
+
+
+def make_large_fleet():
+    """Создаёт флот на экране 3840x2160, где пришельцев не меньше Fleet.grid_min_aliens."""
+    pygame.init()
+    ai_settings = Settings()
+    ai_settings.screen_width, ai_settings.screen_height = 3840, 2160
+    ship = Ship(ai_settings, None)
+    aliens = Fleet(ai_settings)
+    gf.create_fleet(ai_settings, None, ship, aliens)
+    assert aliens.count >= Fleet.grid_min_aliens
+    return ai_settings, aliens
+
+
+def test_collide_rect_syncs_rects_on_grid_path():
+    """Пришельцы, найденные через сетку, получают текущие координаты массивов."""
+    _, aliens = make_large_fleet()
+    for _ in range(50):
+        aliens.update()  # sprites() не вызывается, как при отрисовке атласом
+
+    index = aliens.count - 1
+    x, y = int(aliens.x[index]), int(aliens.y[index])
+    hit = aliens.collide_rect(pygame.Rect(x + 1, y + 1, 2, 2))
+    assert aliens.members[index] in hit
+    assert aliens.members[index].rect.topleft == (x, y)
+
+
+def test_place_sets_rects_from_layout():
+    """Пришельцы раскладки волны сразу получают свои позиции, а не позицию reset()."""
+    _, aliens = make_large_fleet()
+    for index, alien in enumerate(aliens.members):
+        assert alien.rect.topleft == (int(aliens.x[index]), int(aliens.y[index]))
@@ -0,0 +1,22 @@
+"""
+Проверки таблицы рекордов.
+
+Запуск:
+    python -m pytest -q
+"""
+from leaderboard import Leaderboard
+
+
+def test_record_during_pending_load_is_reloaded(tmp_path):
+    """Результат, записанный, пока загрузка лучших результатов в очереди, попадает в таблицу."""
+    board = Leaderboard(str(tmp_path / 'scores.db'))
+    try:
+        board.top('p', 3)  # Загрузка ставится в очередь и может ещё не выполниться
+        board.record('y', 'p', 999, 1)
+        entries = []
+        for _ in range(3):
+            board.flush()
+            entries = board.top('p', 3)
+        assert [(player, score) for player, score, _, _ in entries] == [('y', 999)]
+    finally:
+        board.close()
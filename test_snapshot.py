@@ -0,0 +1,52 @@
+"""
+Проверки снимков мира: сохранение и восстановление флота волны с типами пришельцев.
+
+Запуск:
+    python -m pytest -q
+"""
+import json
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import snapshot
+from clock import SimClock
+from settings import Settings
+from simulation import Simulation
+
+# Волна с типами, обозначенными латинской и кириллической буквами
+TYPED_WAVES = {
+    "alien_types": {
+        "A": {"image": "images/alienship.bmp"},
+        "Ж": {"image": "images/alienship.bmp", "tint": [255, 150, 120], "hits": 2, "points": 3}
+    },
+    "waves": [
+        {"name": "Смешанный строй", "rows": ["ЖAЖAЖ", "AAAAA"], "row_speeds": [1.2, 1.0]}
+    ]
+}
+
+
+def make_sim(wave_file, seed):
+    """Создаёт мир без окна с волнами из файла."""
+    pygame.init()
+    ai_settings = Settings()
+    ai_settings.wave_file = wave_file
+    return Simulation(ai_settings, None, SimClock(), seed)
+
+
+def test_typed_wave_round_trip(tmp_path):
+    """Снимок флота с типами пришельцев восстанавливается без потери типов."""
+    wave_file = tmp_path / 'waves.json'
+    wave_file.write_text(json.dumps(TYPED_WAVES, ensure_ascii=False), encoding='utf-8')
+    sim = make_sim(str(wave_file), 1)
+    kinds = sorted(alien.kind for alien in sim.aliens.sprites())
+    assert 'Ж' in kinds
+
+    data = snapshot.capture(sim)
+    restored = make_sim(str(wave_file), 2)
+    snapshot.restore(restored, data)
+
+    assert sorted(alien.kind for alien in restored.aliens.sprites()) == kinds
+    assert snapshot.capture(restored) == data
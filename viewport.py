@@ -0,0 +1,152 @@
+import pygame
+
+
+class Viewport:
+    """
+    Отображение логического игрового пространства на экран другого размера.
+
+    Игра всегда считает в логических координатах (Settings.screen_width x
+    Settings.screen_height), поэтому размер флота и скорости не зависят от
+    дисплея. Viewport масштабирует их с сохранением пропорций (с полосами по
+    краям) и хранит изображения, отмасштабированные один раз для своего размера
+    экрана, - в кадре transform.scale не вызывается.
+    """
+
+    max_cached_images = 512  # Максимум отмасштабированных изображений в кэше
+
+    def __init__(self, logical_size, display_size):
+        """
+        Вычисляет масштаб и смещение.
+
+        :param logical_size: Размер логического игрового пространства (ширина, высота).
+        :param display_size: Размер экрана в пикселях (ширина, высота).
+        """
+        self.logical_size = logical_size
+        self.display_size = display_size
+        self.scale = min(display_size[0] / logical_size[0], display_size[1] / logical_size[1])
+        width = round(logical_size[0] * self.scale)
+        height = round(logical_size[1] * self.scale)
+        # Область экрана, занятая игрой (по центру)
+        self.rect = pygame.Rect((display_size[0] - width) // 2, (display_size[1] - height) // 2,
+                                width, height)
+        # id(исходной поверхности) -> (исходная, отмасштабированная)
+        self._prescaled = {}  # Изображения спрайтов, отмасштабированные при запуске
+        self._images = {}  # Остальные изображения (надписи и т.п.), не более max_cached_images
+
+    def map_pos(self, pos):
+        """Переводит логическую точку в точку экрана."""
+        return (self.rect.x + round(pos[0] * self.scale),
+                self.rect.y + round(pos[1] * self.scale))
+
+    def map_rect(self, rect):
+        """Переводит логический прямоугольник в прямоугольник экрана (без зазоров между соседними)."""
+        left, top = self.map_pos(rect.topleft)
+        right, bottom = self.map_pos(rect.bottomright)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def to_logical(self, pos):
+        """Переводит точку экрана (например, позицию мыши) в логические координаты."""
+        return (int((pos[0] - self.rect.x) / self.scale),
+                int((pos[1] - self.rect.y) / self.scale))
+
+    def image(self, surface):
+        """
+        Возвращает изображение, отмасштабированное для этого экрана.
+
+        Масштабирование выполняется при первом обращении к изображению, далее
+        используется кэш.
+
+        :param surface: Исходная поверхность в логическом размере.
+        :return: Отмасштабированная поверхность.
+        """
+        entry = self._prescaled.get(id(surface)) or self._images.get(id(surface))
+        if entry is not None and entry[0] is surface:
+            return entry[1]
+        scaled = self._scale(surface)
+        if len(self._images) >= self.max_cached_images:
+            # Вытесняется самое старое изображение (например, устаревшая надпись счёта)
+            del self._images[next(iter(self._images))]
+        self._images[id(surface)] = (surface, scaled)
+        return scaled
+
+    def _scale(self, surface):
+        """Масштабирует поверхность (со сглаживанием, если у неё нет цветового ключа прозрачности)."""
+        if self.scale == 1:
+            scaled = surface
+        else:
+            width, height = surface.get_size()
+            size = (max(round(width * self.scale), 1), max(round(height * self.scale), 1))
+            if surface.get_bitsize() in (24, 32) and surface.get_colorkey() is None:
+                scaled = pygame.transform.smoothscale(surface, size)
+            else:
+                scaled = pygame.transform.scale(surface, size)
+        return scaled
+
+    def prescale(self, surfaces):
+        """
+        Масштабирует изображения заранее (при запуске), чтобы не делать этого в
+        первых кадрах; эти изображения не вытесняются из кэша.
+
+        :param surfaces: Исходные поверхности в логическом размере.
+        """
+        for surface in surfaces:
+            if id(surface) not in self._prescaled:
+                self._prescaled[id(surface)] = (surface, self._scale(surface))
+
+    def forget(self, surfaces):
+        """
+        Удаляет отмасштабированные копии изображений из кэша (например, после
+        замены заглушки загруженным изображением).
+
+        :param surfaces: Исходные поверхности, содержимое которых изменилось.
+        """
+        for surface in surfaces:
+            self._prescaled.pop(id(surface), None)
+            self._images.pop(id(surface), None)
+
+
+# Viewport текущего экрана (None - экран совпадает с логическим пространством)
+active = None
+
+
+def create_screen(ai_settings):
+    """
+    Создаёт окно игры в режиме Settings.display_mode.
+
+    'window' - окно логического размера;
+    'scaled' - логический размер, масштабирование до окна/экрана выполняет
+    SDL средствами видеокарты (pygame.SCALED);
+    'prescaled' - окно размера дисплея, спрайты масштабируются один раз и
+    кэшируются (Viewport).
+
+    :param ai_settings: Настройки игры.
+    :return: Поверхность экрана.
+    """
+    global active
+    active = None
+    logical_size = (ai_settings.screen_width, ai_settings.screen_height)
+    flags = pygame.FULLSCREEN if ai_settings.fullscreen else 0
+
+    if ai_settings.display_mode == 'scaled':
+        # Вертикальная синхронизация и аппаратное масштабирование поддерживаются
+        # не всеми драйверами: при ошибке окно создаётся без синхронизации,
+        # а затем - обычное окно логического размера
+        for vsync in (int(ai_settings.vsync), 0):
+            try:
+                return pygame.display.set_mode(logical_size, flags | pygame.SCALED, vsync=vsync)
+            except pygame.error as e:
+                error = e
+        print("Масштабирование окна недоступно:", error)
+
+    if ai_settings.display_mode == 'prescaled':
+        display_size = ai_settings.display_size or pygame.display.get_desktop_sizes()[0]
+        screen = pygame.display.set_mode(display_size, flags)
+        active = Viewport(logical_size, screen.get_size())
+        return screen
+
+    return pygame.display.set_mode(logical_size, flags)
+
+
+def to_logical(pos):
+    """Переводит точку экрана в логические координаты текущего экрана."""
+    return active.to_logical(pos) if active is not None else pos
@@ -0,0 +1,273 @@
+"""
+Волны пришельцев из файла данных.
+
+Файл волн (JSON, по умолчанию waves/waves.json) описывает типы пришельцев и
+строй каждой волны:
+
+    {
+      "alien_types": {
+        "A": {"image": "images/alienship.bmp"},
+        "B": {"image": "images/alienship.bmp", "tint": [255, 150, 120], "hits": 2, "points": 2}
+      },
+      "waves": [
+        {"name": "Строй", "formation": "fill", "front_rows": ["B"]},
+        {"name": "Клин", "rows": ["..A..", ".AAA."], "row_speeds": [1.2, 1.0]}
+      ]
+    }
+
+Тип пришельца: изображение, необязательный оттенок (tint, умножение цвета),
+количество попаданий до уничтожения (hits) и множитель очков (points).
+
+Строй волны задаётся либо строками (rows: символ - тип пришельца, '.' - пустая
+ячейка), либо "formation": "fill" - всё доступное поле, как в исходной игре
+(front_rows - типы нижних рядов). Ячейки строя - те же, что в исходной игре;
+строки центрируются по ширине экрана, а не поместившиеся ряды и края слишком
+широких строк отбрасываются. Изображения всех типов должны быть одного размера.
+row_speeds - множители скорости рядов сверху вниз (по умолчанию 1).
+
+Волны идут по кругу: уровень 1 - первая волна, и т.д. Раскладка волны
+(позиции, скорости, прочность) вычисляется один раз для размера экрана и
+кэшируется, поэтому начало волны сводится к копированию готовых массивов во флот.
+"""
+import json
+import threading
+
+import numpy as np
+
+import assetpack
+import assets
+import functions as gf
+from ioworker import io_stats
+
+WAVE_FILE = 'waves/waves.json'  # Файл волн по умолчанию
+EMPTY = '.'  # Пустая ячейка строя
+
+
+class AlienType:
+    """Тип пришельца из файла волн."""
+
+    def __init__(self, kind, image_path, tint=None, hits=1, points=1):
+        """
+        :param kind: Символ типа в строках строя.
+        :param image_path: Путь к изображению пришельца.
+        :param tint: Оттенок изображения (r, g, b) или None.
+        :param hits: Количество попаданий до уничтожения.
+        :param points: Множитель очков за уничтожение.
+        """
+        self.kind = kind
+        self.image_path = image_path
+        self.tint = tuple(tint) if tint is not None else None
+        self.hits = hits
+        self.points = points
+
+    def image(self):
+        """Возвращает общее изображение пришельца этого типа (с оттенком)."""
+        if self.tint is None:
+            return assets.get_image(self.image_path)
+        return assets.registry.tinted(self.image_path, self.tint)
+
+
+class FormationLayout:
+    """
+    Раскладка волны для конкретного размера экрана: массивы, которые
+    копируются во флот без дальнейших вычислений.
+    """
+
+    def __init__(self, alien_size, x, y, speed, hits, points, column, kinds):
+        self.alien_size = alien_size  # Размер пришельца (ширина, высота)
+        self.x = x  # Левые границы пришельцев
+        self.y = y  # Верхние границы пришельцев
+        self.speed = speed  # Множители скорости (по рядам)
+        self.hits = hits  # Попаданий до уничтожения
+        self.points = points  # Множители очков
+        self.column = column  # Номер колонки строя (для выбора стреляющих)
+        self.kinds = kinds  # Типы пришельцев (символы)
+        self.kind_set = sorted(set(kinds))  # Типы, встречающиеся в волне
+        self.uniform_speed = bool(np.all(speed == 1.0))  # Весь строй движется одинаково
+
+    def __len__(self):
+        """Возвращает количество пришельцев в раскладке."""
+        return len(self.x)
+
+
+class Wave:
+    """Описание одной волны из файла."""
+
+    def __init__(self, index, data, alien_types):
+        """
+        Разбирает и проверяет описание волны.
+
+        :param index: Номер волны в файле (с 0).
+        :param data: Словарь описания волны.
+        :param alien_types: Словарь {символ: AlienType}.
+        :raises ValueError: Если описание некорректно.
+        """
+        self.name = data.get('name', f"волна {index + 1}")
+        self.fill = data.get('formation') == 'fill'
+        self.rows = list(data.get('rows', []))
+        self.front_rows = list(data.get('front_rows', []))
+        self.row_speeds = [float(speed) for speed in data.get('row_speeds', [])]
+
+        if not self.fill and not self.rows:
+            raise ValueError(f"{self.name}: нужен строй (rows) или \"formation\": \"fill\"")
+        if 'formation' in data and not self.fill:
+            raise ValueError(f"{self.name}: неизвестный строй {data['formation']!r}")
+        for row in self.rows + self.front_rows:
+            for kind in row:
+                if kind != EMPTY and kind not in alien_types:
+                    raise ValueError(f"{self.name}: неизвестный тип пришельца {kind!r}")
+        if any(speed <= 0 for speed in self.row_speeds):
+            raise ValueError(f"{self.name}: скорость ряда должна быть положительной")
+
+
+class WaveBook:
+    """
+    Набор волн из файла с кэшем раскладок.
+
+    Раскладка волны вычисляется при первом обращении для данного размера
+    экрана и размеров пришельца и корабля, а затем берётся из кэша.
+    """
+
+    def __init__(self, data):
+        """
+        Разбирает содержимое файла волн.
+
+        :param data: Словарь, прочитанный из JSON.
+        :raises ValueError: Если описание некорректно.
+        """
+        try:
+            self.alien_types = {
+                kind: AlienType(kind, spec['image'], spec.get('tint'),
+                                int(spec.get('hits', 1)), int(spec.get('points', 1)))
+                for kind, spec in data['alien_types'].items()
+            }
+            waves = data['waves']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"некорректный файл волн: {e!r}") from e
+        for kind, alien_type in self.alien_types.items():
+            if len(kind) != 1 or kind == EMPTY:
+                raise ValueError(f"тип пришельца должен обозначаться одним символом: {kind!r}")
+            if alien_type.hits < 1:
+                raise ValueError(f"тип {kind!r}: hits должно быть не меньше 1")
+        if not waves:
+            raise ValueError("в файле нет ни одной волны")
+        self.waves = [Wave(index, wave, self.alien_types) for index, wave in enumerate(waves)]
+        self._layouts = {}  # (номер волны, размер экрана, размеры) -> FormationLayout
+
+    def wave_for_level(self, level):
+        """Возвращает номер волны для уровня (волны идут по кругу)."""
+        return (level - 1) % len(self.waves)
+
+    def layout(self, level, ai_settings, alien_size, ship_height):
+        """
+        Возвращает раскладку волны уровня для размера экрана.
+
+        :param level: Номер уровня (с 1).
+        :param ai_settings: Настройки игры (размер экрана).
+        :param alien_size: Размер пришельца (ширина, высота).
+        :param ship_height: Высота корабля.
+        :return: Объект FormationLayout.
+        """
+        index = self.wave_for_level(level)
+        key = (index, ai_settings.screen_width, ai_settings.screen_height,
+               tuple(alien_size), ship_height)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._compile(self.waves[index], ai_settings, alien_size, ship_height)
+            self._layouts[key] = layout
+        return layout
+
+    def _compile(self, wave, ai_settings, alien_size, ship_height):
+        """Вычисляет раскладку волны (позиции в сетке исходной игры)."""
+        alien_width, alien_height = alien_size
+        number_aliens_x = gf.get_number_aliens_x(ai_settings, alien_width)
+        number_rows = gf.get_number_rows(ai_settings, ship_height, alien_height)
+
+        if wave.fill:
+            rows = ['A' * number_aliens_x for _ in range(number_rows)]
+            # Нижние ряды заменяются типами front_rows (первый - самый нижний)
+            for offset, kind in enumerate(wave.front_rows[:number_rows]):
+                rows[number_rows - 1 - offset] = kind * number_aliens_x
+        else:
+            rows = wave.rows[:number_rows]
+
+        entries = []  # (x, y, скорость, тип, колонка)
+        for row_number, row in enumerate(rows):
+            if len(row) > number_aliens_x:
+                # Широкая строка обрезается с обеих сторон, сохраняя середину строя
+                cut = (len(row) - number_aliens_x) // 2
+                row = row[cut:cut + number_aliens_x]
+            first_column = (number_aliens_x - len(row)) // 2  # Строка центрируется
+            speed = wave.row_speeds[row_number] if row_number < len(wave.row_speeds) else 1.0
+            for offset, kind in enumerate(row):
+                if kind == EMPTY:
+                    continue
+                column = first_column + offset
+                entries.append((alien_width + 2 * alien_width * column,
+                                alien_height + 2 * alien_height * row_number,
+                                speed, kind, column))
+
+        alien_types = [self.alien_types[entry[3]] for entry in entries]
+        return FormationLayout(
+            alien_size=(alien_width, alien_height),
+            x=np.array([entry[0] for entry in entries], dtype=float),
+            y=np.array([entry[1] for entry in entries], dtype=float),
+            speed=np.array([entry[2] for entry in entries], dtype=float),
+            hits=np.array([alien_type.hits for alien_type in alien_types], dtype=np.int64),
+            points=[alien_type.points for alien_type in alien_types],
+            column=np.array([entry[4] for entry in entries], dtype=np.int64),
+            kinds=[entry[3] for entry in entries],
+        )
+
+    def images(self, layout):
+        """
+        Возвращает изображения типов пришельцев раскладки.
+
+        Изображения не хранятся в раскладке: реестр может заменить их после
+        конвертации в формат экрана или сборки атласа.
+
+        :param layout: Раскладка волны.
+        :return: Словарь {тип пришельца: изображение}.
+        """
+        return {kind: self.alien_types[kind].image() for kind in layout.kind_set}
+
+
+def load(filename=WAVE_FILE):
+    """
+    Читает файл волн из пакета ресурсов или с диска.
+
+    :param filename: Относительный путь к файлу волн.
+    :return: Объект WaveBook.
+    :raises ValueError: Если файл некорректен.
+    """
+    pack = assetpack.default_pack()
+    if pack is not None and filename in pack:
+        text = pack.data(filename).decode('utf-8')
+    else:
+        with io_stats.track('data'), open(gf.resource_path(filename), encoding='utf-8') as f:
+            text = f.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"{filename}: {e}") from e
+    return WaveBook(data)
+
+
+# Наборы волн, загруженные из файлов (файл читается один раз)
+_books = {}
+_books_lock = threading.Lock()
+
+
+def get_wave_book(filename=WAVE_FILE):
+    """
+    Возвращает набор волн из файла, загружая его при первом обращении.
+
+    :param filename: Относительный путь к файлу волн.
+    :return: Объект WaveBook.
+    """
+    with _books_lock:
+        book = _books.get(filename)
+        if book is None:
+            book = load(filename)
+            _books[filename] = book
+    return book